@@ -0,0 +1,145 @@
+"""Approximate matching of strings with automata."""
+from collections import deque
+from typing import Deque, Dict, FrozenSet, Optional, Tuple
+
+import automata.automaton as aut
+
+# Set of (state, number of edits) pairs, with the minimum number of edits
+# needed to reach each state
+Configuration = FrozenSet[Tuple[aut.State, int]]
+
+
+class ApproximateEvaluator():
+    """
+    Evaluator accepting strings within a number of edits of the language.
+
+    The distance of a string to the language is the minimum Levenshtein
+    distance (insertions, deletions and substitutions of one symbol) to an
+    accepted string. The evaluator tracks, for each state, the minimum
+    number of edits needed to reach it, discarding states that need more
+    than ``max_edits``. These configurations are determinized lazily:
+    the transitions between them are computed on first use and cached,
+    so each symbol of the string costs a dictionary lookup once the
+    common configurations have been seen.
+
+    Symbols outside the alphabet are allowed in the string, as they can be
+    deleted or substituted.
+
+    Args:
+        automaton: Automaton defining the language.
+        max_edits: Maximum number of edits.
+
+    """
+
+    def __init__(self, automaton: aut.FiniteAutomaton, max_edits: int) -> None:
+        if max_edits < 0:
+            raise ValueError("The number of edits can't be negative")
+
+        self.automaton = automaton
+        self.max_edits = max_edits
+        self._index = automaton.transition_index()
+        self._transitions: Dict[
+            Tuple[Configuration, str],
+            Configuration,
+        ] = {}
+        self.initial = self._closure({automaton.initial_state: 0})
+
+    def _closure(self, costs: Dict[aut.State, int]) -> Configuration:
+        """
+        Add the states reached with lambdas and insertions.
+
+        Lambda transitions cost nothing, and following a symbol transition
+        without consuming the string is an insertion. As costs are 0 or 1,
+        the minimum costs are found with a 0-1 breadth-first search.
+
+        """
+        pending: Deque[aut.State] = deque(
+            sorted(costs, key=costs.__getitem__),
+        )
+        while pending:
+            state = pending.popleft()
+            cost = costs[state]
+            for symbol, targets in self._index.get(state, {}).items():
+                target_cost = cost if symbol is None else cost + 1
+                if target_cost > self.max_edits:
+                    continue
+
+                for target in targets:
+                    if costs.get(target, target_cost + 1) > target_cost:
+                        costs[target] = target_cost
+                        if symbol is None:
+                            pending.appendleft(target)
+                        else:
+                            pending.append(target)
+
+        return frozenset(costs.items())
+
+    def step(
+        self,
+        configuration: Configuration,
+        symbol: str,
+    ) -> Configuration:
+        """
+        Return the configuration reached after consuming a symbol.
+
+        Args:
+            configuration: Current configuration.
+            symbol: Symbol of the string.
+
+        Returns:
+            Next configuration.
+
+        """
+        key = (configuration, symbol)
+        next_configuration = self._transitions.get(key)
+        if next_configuration is None:
+            costs: Dict[aut.State, int] = {}
+            limit = self.max_edits + 1
+
+            def relax(state: aut.State, cost: int) -> None:
+                if cost < costs.get(state, limit):
+                    costs[state] = cost
+
+            for state, cost in configuration:
+                # Deletion of the symbol
+                relax(state, cost + 1)
+                for transition_symbol, targets in (
+                    self._index.get(state, {}).items()
+                ):
+                    if transition_symbol is None:
+                        continue
+                    # Match or substitution
+                    target_cost = cost + (transition_symbol != symbol)
+                    for target in targets:
+                        relax(target, target_cost)
+
+            next_configuration = self._closure(costs)
+            self._transitions[key] = next_configuration
+
+        return next_configuration
+
+    def distance(self, string: str) -> Optional[int]:
+        """
+        Return the number of edits needed to accept a string.
+
+        Args:
+            string: String to check.
+
+        Returns:
+            Minimum number of edits, or ``None`` if it exceeds the maximum.
+
+        """
+        configuration = self.initial
+        for symbol in string:
+            configuration = self.step(configuration, symbol)
+            if not configuration:
+                return None
+
+        return min(
+            (cost for state, cost in configuration if state.is_final),
+            default=None,
+        )
+
+    def accepts(self, string: str) -> bool:
+        """Return if a string is within the maximum edits of the language."""
+        return self.distance(string) is not None
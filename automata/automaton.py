@@ -1,5 +1,19 @@
 """Automaton implementation."""
-from typing import Collection, Set
+from collections import defaultdict
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    DefaultDict,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
 from automata.interfaces import (
     AbstractFiniteAutomaton,
@@ -7,6 +21,8 @@ from automata.interfaces import (
     AbstractTransition,
 )
 
+_T = TypeVar("_T")
+
 
 class State(AbstractState):
     """State of an automaton."""
@@ -45,33 +61,146 @@ class FiniteAutomaton(
         # Add here additional initialization code.
         # Do not change the constructor interface.
 
+        # Lazily computed data derived from the (immutable) transitions,
+        # such as adjacency indexes. Filled on first use.
+        self._cache: Dict[str, Any] = {}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Cached values may not be picklable (e.g. compiled matchers), and
+        # can be computed again.
+        state = self.__dict__.copy()
+        state["_cache"] = {}
+        return state
+
+    def cached(self, key: str, compute: Callable[[], _T]) -> _T:
+        """
+        Return a value derived from the automaton, computing it once.
+
+        Automata are immutable, so values computed from them can be kept
+        with them. Cached values are not pickled.
+
+        Args:
+            key: Name of the value.
+            compute: Function computing the value if it is not cached.
+
+        Returns:
+            The cached value.
+
+        """
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    def _build_index(
+        self,
+        reverse: bool,
+    ) -> Mapping[State, Mapping[Optional[str], FrozenSet[State]]]:
+        index: DefaultDict[
+            State,
+            DefaultDict[Optional[str], Set[State]],
+        ] = defaultdict(lambda: defaultdict(set))
+
+        for t in self.transitions:
+            if reverse:
+                index[t.final_state][t.symbol].add(t.initial_state)
+            else:
+                index[t.initial_state][t.symbol].add(t.final_state)
+
+        return {
+            state: {
+                symbol: frozenset(targets)
+                for symbol, targets in by_symbol.items()
+            }
+            for state, by_symbol in index.items()
+        }
+
+    def transition_index(
+        self,
+    ) -> Mapping[State, Mapping[Optional[str], FrozenSet[State]]]:
+        """
+        Return the forward adjacency of the automaton.
+
+        Returns:
+            Mapping from each state to a mapping from symbol (``None`` for
+            lambda transitions) to the set of states reached. States without
+            outgoing transitions are not present.
+
+        """
+        return self.cached(
+            "index",
+            lambda: self._build_index(reverse=False),
+        )
+
+    def reverse_transition_index(
+        self,
+    ) -> Mapping[State, Mapping[Optional[str], FrozenSet[State]]]:
+        """
+        Return the reverse adjacency of the automaton.
+
+        Returns:
+            Mapping from each state to a mapping from symbol (``None`` for
+            lambda transitions) to the set of states that reach it.
+
+        """
+        return self.cached(
+            "reverse_index",
+            lambda: self._build_index(reverse=True),
+        )
+
+    @staticmethod
+    def _traverse(
+        start: Iterable[State],
+        index: Mapping[State, Mapping[Optional[str], FrozenSet[State]]],
+    ) -> Set[State]:
+        visited = set(start)
+        stack = list(visited)
+        while stack:
+            state = stack.pop()
+            for targets in index.get(state, {}).values():
+                for target in targets:
+                    if target not in visited:
+                        visited.add(target)
+                        stack.append(target)
+
+        return visited
+
+    def accessible_states(self) -> FrozenSet[State]:
+        """Return the states reachable from the initial state."""
+        return self.cached("accessible", lambda: frozenset(self._traverse(
+            [self.initial_state],
+            self.transition_index(),
+        )))
+
+    def co_accessible_states(self) -> FrozenSet[State]:
+        """Return the states from which a final state can be reached."""
+        return self.cached("co_accessible", lambda: frozenset(self._traverse(
+            [state for state in self.states if state.is_final],
+            self.reverse_transition_index(),
+        )))
+
     @property
     def final_state(self):
         return self.states[-1]
 
     def get_closure(self, states: Set[State]) -> Set[State]:
-        states_to_complete = states
-        closure = states.copy()
+        index = self.transition_index()
+        closure = set(states)
+        stack = list(closure)
 
-        while True:
-            new_states = set()
+        while stack:
+            state = stack.pop()
+            for target in index.get(state, {}).get(None, ()):
+                if target not in closure:
+                    closure.add(target)
+                    stack.append(target)
 
-            for transition in self.transitions:
-                if transition.initial_state in states_to_complete and not transition.symbol:
-                    new_states.add(transition.final_state)
-
-            if new_states.issubset(closure):
-                break
-            states_to_complete = new_states - closure
-            closure.update(new_states)
-        
         return closure
 
     def state_from_state_set(self, states_set: Set[State]) -> State:
         if not states_set:
             return State("empty")
         return State(
-            name="".join([state.name for state in states_set]),
+            name="".join(sorted(state.name for state in states_set)),
             is_final=any(state.is_final for state in states_set)
         )
 
@@ -119,24 +248,174 @@ class FiniteAutomaton(
             transitions=new_transitions
         )
 
+    def _restrict(self, keep: Collection[State]) -> "FiniteAutomaton":
+        return FiniteAutomaton(
+            initial_state=self.initial_state,
+            states=dict.fromkeys(s for s in self.states if s in keep),
+            symbols=self.symbols,
+            transitions=[
+                t for t in self.transitions
+                if t.initial_state in keep and t.final_state in keep
+            ],
+        )
+
     def eliminate_unreachable_states(self) -> "FiniteAutomaton":
-        reachable_states = []
-        reachable_stack = [self.initial_state]
-        while reachable_stack:
-            state = reachable_stack.pop()
-            reachable_states.append(state)
-            for transition in self.transitions:
-                if transition.initial_state == state:
-                    if not transition.final_state in reachable_states and not transition.final_state in reachable_stack:
-                        reachable_stack.append(transition.final_state)
+        return self._restrict(self.accessible_states())
+
+    def trim(self) -> "FiniteAutomaton":
+        """
+        Remove unreachable and dead (non co-accessible) states.
+
+        The initial state is always kept, even if no final state can be
+        reached from it. Note that trimming a complete deterministic
+        automaton removes its sink state, so the result may be partial.
+
+        Returns:
+            Equivalent automaton containing only useful states.
+
+        """
+        keep = set(self.accessible_states() & self.co_accessible_states())
+        keep.add(self.initial_state)
+        return self._restrict(keep)
+
+    def reverse(self) -> "FiniteAutomaton":
+        """
+        Return an automaton accepting the reversed strings.
+
+        Transitions are reversed, the initial state becomes the only final
+        state, and a new initial state has lambda transitions to the states
+        that were final.
+
+        Returns:
+            Reversed (usually nondeterministic) automaton.
+
+        """
+        names = {state.name for state in self.states}
+        initial_name = "reverse_initial"
+        while initial_name in names:
+            initial_name += "_"
+
+        states = {
+            state: State(state.name, is_final=state == self.initial_state)
+            for state in self.states
+        }
+        initial_state = State(initial_name)
 
         return FiniteAutomaton(
-            initial_state=self.initial_state,
-            states=set(reachable_states),
+            initial_state=initial_state,
+            states=dict.fromkeys([initial_state, *states.values()]),
             symbols=self.symbols,
-            transitions=[t for t in self.transitions if t.final_state in reachable_states and t.initial_state in reachable_states]
+            transitions=[
+                *(
+                    Transition(initial_state, None, states[state])
+                    for state in self.states
+                    if state.is_final
+                ),
+                *(
+                    Transition(
+                        states[t.final_state],
+                        t.symbol,
+                        states[t.initial_state],
+                    )
+                    for t in self.transitions
+                ),
+            ],
         )
 
+    def simulation_preorder(self) -> Mapping[State, FrozenSet[State]]:
+        """
+        Compute the direct forward simulation preorder.
+
+        A state ``q`` simulates ``p`` if ``q`` is final whenever ``p`` is,
+        and every transition of ``p`` can be matched by a transition of
+        ``q`` with the same symbol to a state simulating its target.
+        Lambda transitions are matched as if they were another symbol. If
+        ``q`` simulates ``p``, every string accepted from ``p`` is accepted
+        from ``q``.
+
+        Returns:
+            Mapping from each state to the set of states simulating it.
+
+        """
+        index = self.transition_index()
+        simulated_by = {
+            p: {q for q in self.states if q.is_final or not p.is_final}
+            for p in self.states
+        }
+
+        changed = True
+        while changed:
+            changed = False
+            for p, candidates in simulated_by.items():
+                for q in list(candidates):
+                    q_transitions = index.get(q, {})
+                    for symbol, p_targets in index.get(p, {}).items():
+                        q_targets = q_transitions.get(symbol, frozenset())
+                        if any(
+                            simulated_by[p_target].isdisjoint(q_targets)
+                            for p_target in p_targets
+                        ):
+                            candidates.remove(q)
+                            changed = True
+                            break
+
+        return {p: frozenset(q) for p, q in simulated_by.items()}
+
+    def reduce(self) -> "FiniteAutomaton":
+        """
+        Return an equivalent automaton with fewer states and transitions.
+
+        Useless states are removed, states that simulate each other are
+        merged, and a transition is removed if there is another one from
+        the same state with the same symbol to a state that strictly
+        simulates its target. This is cheaper than determinization and
+        reduces its cost on automata such as those created by
+        :class:`~automata.re_parser.REParser`.
+
+        Returns:
+            Reduced automaton, which may still be nondeterministic.
+
+        """
+        automaton = self.trim()
+        simulated_by = automaton.simulation_preorder()
+
+        representatives: Dict[State, State] = {}
+        for state in automaton.states:
+            representatives[state] = next(
+                (
+                    r for r in representatives.values()
+                    if r in simulated_by[state] and state in simulated_by[r]
+                ),
+                state,
+            )
+
+        targets: DefaultDict[
+            Tuple[State, Optional[str]],
+            Set[State],
+        ] = defaultdict(set)
+        for t in automaton.transitions:
+            source = representatives[t.initial_state]
+            target = representatives[t.final_state]
+            if t.symbol is not None or source != target:
+                targets[source, t.symbol].add(target)
+
+        transitions = [
+            Transition(source, symbol, target)
+            for (source, symbol), reached in targets.items()
+            for target in reached
+            if not any(
+                other != target and other in simulated_by[target]
+                for other in reached
+            )
+        ]
+
+        return FiniteAutomaton(
+            initial_state=representatives[automaton.initial_state],
+            states=dict.fromkeys(representatives.values()),
+            symbols=automaton.symbols,
+            transitions=transitions,
+        ).trim()
+
     def to_minimized(
         self,
     ) -> "FiniteAutomaton":
@@ -8,7 +8,15 @@ from automata.interfaces import AbstractFiniteAutomatonEvaluator
 class FiniteAutomatonEvaluator(
     AbstractFiniteAutomatonEvaluator[FiniteAutomaton, State],
 ):
-    """Evaluator of an automaton."""
+    """
+    Evaluator of an automaton.
+
+    Processing of a string stops as soon as the current set of states is
+    empty or contains only dead states (states from which no final state
+    can be reached), as the string can no longer be accepted. The rest of
+    the string is still checked against the alphabet.
+
+    """
 
     def process_symbol(self, symbol: str) -> None:
         new_states = set()
@@ -16,17 +24,30 @@ class FiniteAutomatonEvaluator(
         if symbol not in self.automaton.symbols and symbol:
             raise ValueError(f"Symbol {symbol} is not a valid symbol {self.automaton.symbols}")
 
+        index = self.automaton.transition_index()
         for state in self.current_states:
-            for transition in self.automaton.transitions:
-                if state == transition.initial_state and symbol == transition.symbol and symbol:
-                    new_states.add(transition.final_state)
+            new_states.update(index.get(state, {}).get(symbol, ()))
 
         self._complete_lambdas(new_states)
         self.current_states = new_states
 
+    def process_string(self, string: str) -> None:
+        live_states = self.automaton.co_accessible_states()
+
+        for i, symbol in enumerate(string):
+            self.process_symbol(symbol)
+            if live_states.isdisjoint(self.current_states):
+                self._check_symbols(string[i + 1:])
+                return
+
+    def _check_symbols(self, string: str) -> None:
+        invalid = set(string).difference(self.automaton.symbols)
+        if invalid:
+            symbol = next(s for s in string if s in invalid)
+            raise ValueError(f"Symbol {symbol} is not a valid symbol {self.automaton.symbols}")
+
     def _complete_lambdas(self, set_to_complete: Set[State]) -> None:
         set_to_complete.update(self.automaton.get_closure(set_to_complete))
 
     def is_accepting(self) -> bool:
         return any(state.is_final for state in self.current_states)
-
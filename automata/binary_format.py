@@ -0,0 +1,279 @@
+"""Binary, memory-mappable format for automata."""
+import mmap
+import struct
+import sys
+from array import array
+from typing import BinaryIO, List, Optional, Sequence, Tuple
+
+import automata.automaton as aut
+from automata.csr import CSRAutomaton, CSREvaluator
+
+
+class BinaryFormatError(Exception):
+    """Exception for invalid binary automaton files."""
+
+
+MAGIC = b"AUTB"
+VERSION = 1
+
+FLAG_BIG_ENDIAN = 1
+FLAG_TABLE = 2
+
+# Magic, version, flags, number of states, number of symbols, initial
+# state and the (offset, length) in bytes of each section.
+_SECTIONS = (
+    "symbols",
+    "state_names",
+    "finals",
+    "offsets",
+    "symbol_ids",
+    "targets",
+    "lambda_offsets",
+    "lambda_targets",
+    "table",
+)
+_HEADER = struct.Struct("<4sHHQQQ" + "QQ" * len(_SECTIONS))
+_ALIGNMENT = 8
+
+
+def _encode_strings(strings: Sequence[str]) -> bytes:
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets = array("q", [0])
+    for s in encoded:
+        offsets.append(offsets[-1] + len(s))
+
+    return offsets.tobytes() + b"".join(encoded)
+
+
+def _decode_strings(data: memoryview, count: int) -> Tuple[str, ...]:
+    offsets = data[:8 * (count + 1)].cast("q")
+    blob = data[8 * (count + 1):]
+    return tuple(
+        str(blob[offsets[i]:offsets[i + 1]], "utf-8") for i in range(count)
+    )
+
+
+def _dense_table(csr: CSRAutomaton) -> Optional["array[int]"]:
+    """Return the dense table of a deterministic automaton, if it is."""
+    if len(csr.lambda_targets):
+        return None
+
+    n_symbols = len(csr.symbols)
+    table = array("i", [-1]) * (csr.n_states * n_symbols)
+    for state, symbol_id, target in csr.edges():
+        position = state * n_symbols + symbol_id
+        if table[position] != -1:
+            return None
+        table[position] = target
+
+    return table
+
+
+def dump_binary(automaton: aut.FiniteAutomaton, fp: BinaryIO) -> None:
+    """
+    Write an automaton in the binary format.
+
+    The file contains a header, the symbol and state name tables, the
+    finality of each state, the transitions in CSR form (see
+    :class:`~automata.csr.CSRAutomaton`) and, for deterministic automata,
+    a dense table with ``-1`` for missing transitions. Arrays are stored
+    in native byte order and aligned to 8 bytes.
+
+    Args:
+        automaton: Automaton to write.
+        fp: Binary file object.
+
+    """
+    csr = CSRAutomaton.from_automaton(automaton)
+    table = _dense_table(csr)
+
+    sections: List[bytes] = [
+        _encode_strings(csr.symbols),
+        _encode_strings(csr.state_names),
+        bytes(csr.finals),
+        csr.offsets.tobytes(),
+        csr.symbol_ids.tobytes(),
+        csr.targets.tobytes(),
+        csr.lambda_offsets.tobytes(),
+        csr.lambda_targets.tobytes(),
+        b"" if table is None else table.tobytes(),
+    ]
+
+    flags = FLAG_BIG_ENDIAN if sys.byteorder == "big" else 0
+    if table is not None:
+        flags |= FLAG_TABLE
+
+    position = _HEADER.size
+    layout: List[int] = []
+    for section in sections:
+        position += -position % _ALIGNMENT
+        layout += [position, len(section)]
+        position += len(section)
+
+    fp.write(_HEADER.pack(
+        MAGIC,
+        VERSION,
+        flags,
+        csr.n_states,
+        len(csr.symbols),
+        csr.initial,
+        *layout,
+    ))
+    position = _HEADER.size
+    for offset, section in zip(layout[::2], sections):
+        fp.write(b"\0" * (offset - position))
+        fp.write(section)
+        position = offset + len(section)
+
+
+def write_binary(automaton: aut.FiniteAutomaton, path: str) -> None:
+    """Write an automaton in the binary format to a path."""
+    with open(path, "wb") as f:
+        dump_binary(automaton, f)
+
+
+class BinaryAutomaton():
+    """
+    Automaton opened from a binary file without parsing it.
+
+    The file is memory-mapped and the arrays are exposed as
+    :class:`memoryview` objects over the mapping, so no data is copied.
+    They can also be wrapped without copies by other libraries, such as
+    ``numpy.frombuffer``.
+
+    Args:
+        path: Path of the file.
+
+    Attributes:
+        initial: Index of the initial state.
+        symbols: Symbols of the automaton.
+        finals: Finality of each state.
+        offsets, symbol_ids, targets, lambda_offsets, lambda_targets:
+            Transitions in CSR form.
+        table: Dense transition table (``table[state * len(symbols) +
+            symbol_id]``), or ``None`` if the automaton is not
+            deterministic.
+
+    """
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._load()
+        except BaseException:
+            self.close()
+            raise
+
+    def _load(self) -> None:
+        if len(self._mmap) < _HEADER.size:
+            raise BinaryFormatError("File too short")
+
+        magic, version, flags, n_states, n_symbols, initial, *layout = (
+            _HEADER.unpack_from(self._mmap)
+        )
+        if magic != MAGIC:
+            raise BinaryFormatError("Not an automaton file")
+
+        if version != VERSION:
+            raise BinaryFormatError(f"Unsupported version {version}")
+
+        if bool(flags & FLAG_BIG_ENDIAN) != (sys.byteorder == "big"):
+            raise BinaryFormatError("File written with another byte order")
+
+        self._view = view = memoryview(self._mmap)
+        sections = {}
+        for name, offset, length in zip(_SECTIONS, layout[::2], layout[1::2]):
+            if offset + length > len(view):
+                raise BinaryFormatError(f"Section {name} out of bounds")
+            sections[name] = view[offset:offset + length]
+
+        self.n_states = n_states
+        self.initial = initial
+        self.symbols = _decode_strings(sections["symbols"], n_symbols)
+        self._state_names = sections["state_names"]
+        self.finals = sections["finals"]
+        self.offsets = sections["offsets"].cast("q")
+        self.symbol_ids = sections["symbol_ids"].cast("i")
+        self.targets = sections["targets"].cast("i")
+        self.lambda_offsets = sections["lambda_offsets"].cast("q")
+        self.lambda_targets = sections["lambda_targets"].cast("i")
+        self.table = (
+            sections["table"].cast("i") if flags & FLAG_TABLE else None
+        )
+        self._symbol_ids = {s: i for i, s in enumerate(self.symbols)}
+
+    def close(self) -> None:
+        """Release the views and close the mapping."""
+        for name in (
+            "_state_names",
+            "finals",
+            "offsets",
+            "symbol_ids",
+            "targets",
+            "lambda_offsets",
+            "lambda_targets",
+            "table",
+        ):
+            view = getattr(self, name, None)
+            if view is not None:
+                view.release()
+                setattr(self, name, None)
+
+        if getattr(self, "_view", None) is not None:
+            self._view.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "BinaryAutomaton":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    @property
+    def state_names(self) -> Tuple[str, ...]:
+        """Names of the states (decoded on each access)."""
+        return _decode_strings(self._state_names, self.n_states)
+
+    def to_csr(self) -> CSRAutomaton:
+        """Return a CSR automaton whose arrays are views of the file."""
+        return CSRAutomaton(
+            initial=self.initial,
+            state_names=self.state_names,
+            finals=self.finals,  # type: ignore[arg-type]
+            symbols=self.symbols,
+            offsets=self.offsets,  # type: ignore[arg-type]
+            symbol_ids=self.symbol_ids,  # type: ignore[arg-type]
+            targets=self.targets,  # type: ignore[arg-type]
+            lambda_offsets=self.lambda_offsets,  # type: ignore[arg-type]
+            lambda_targets=self.lambda_targets,  # type: ignore[arg-type]
+        )
+
+    def to_automaton(self) -> aut.FiniteAutomaton:
+        """Build the finite automaton stored in the file."""
+        return self.to_csr().to_automaton()
+
+    def accepts(self, string: str) -> bool:
+        """
+        Return if a string is accepted.
+
+        Deterministic automata are evaluated directly on the dense table.
+
+        """
+        if self.table is None:
+            return CSREvaluator(self.to_csr()).accepts(string)
+
+        table, symbol_ids = self.table, self._symbol_ids
+        n_symbols = len(self.symbols)
+        state = self.initial
+        for symbol in string:
+            symbol_id = symbol_ids.get(symbol)
+            if symbol_id is None:
+                raise ValueError(
+                    f"Symbol {symbol} is not a valid symbol {self.symbols}",
+                )
+            if state != -1:
+                state = table[state * n_symbols + symbol_id]
+
+        return state != -1 and bool(self.finals[state])
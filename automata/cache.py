@@ -0,0 +1,246 @@
+"""Persistent cache of automata transformations."""
+import hashlib
+import json
+import os
+import tempfile
+import zlib
+from typing import Callable, Dict, Optional
+
+import automata.automaton as aut
+
+# Increase when the result of a cached transformation changes, so that
+# entries written by previous versions are not used.
+ALGORITHM_VERSION = 1
+
+
+def automaton_digest(automaton: aut.FiniteAutomaton) -> str:
+    """
+    Return a hash of the exact structure of an automaton.
+
+    Unlike :func:`~automata.utils.canonical_key`, state names matter, but
+    the order of states, symbols and transitions does not.
+
+    Args:
+        automaton: Automaton to hash.
+
+    Returns:
+        Hexadecimal SHA-256 digest.
+
+    """
+    description = [
+        automaton.initial_state.name,
+        sorted([s.name, s.is_final] for s in automaton.states),
+        sorted(automaton.symbols),
+        sorted(
+            [
+                t.initial_state.name,
+                t.symbol is None,
+                t.symbol or "",
+                t.final_state.name,
+            ]
+            for t in automaton.transitions
+        ),
+    ]
+    return hashlib.sha256(
+        json.dumps(description, ensure_ascii=False).encode("utf-8"),
+    ).hexdigest()
+
+
+def _encode(automaton: aut.FiniteAutomaton) -> bytes:
+    state_ids = {s: i for i, s in enumerate(automaton.states)}
+    description = {
+        "initial": state_ids[automaton.initial_state],
+        "states": [[s.name, s.is_final] for s in automaton.states],
+        "symbols": list(automaton.symbols),
+        "transitions": [
+            [state_ids[t.initial_state], t.symbol, state_ids[t.final_state]]
+            for t in automaton.transitions
+        ],
+    }
+    return zlib.compress(
+        json.dumps(description, ensure_ascii=False).encode("utf-8"),
+    )
+
+
+def _decode(data: bytes) -> aut.FiniteAutomaton:
+    description = json.loads(zlib.decompress(data).decode("utf-8"))
+    states = [
+        aut.State(name, is_final=is_final)
+        for name, is_final in description["states"]
+    ]
+
+    return aut.FiniteAutomaton(
+        initial_state=states[description["initial"]],
+        states=dict.fromkeys(states),
+        symbols=description["symbols"],
+        transitions=[
+            aut.Transition(states[source], symbol, states[target])
+            for source, symbol, target in description["transitions"]
+        ],
+    )
+
+
+class AutomatonCache():
+    """
+    On-disk cache of determinized and minimized automata.
+
+    Entries are keyed by the digest of the input automaton, the operation
+    and :data:`ALGORITHM_VERSION`, and stored as compressed JSON. Files are
+    written atomically, so several processes can share the same directory.
+    When the total size exceeds ``max_bytes``, the least recently used
+    entries are removed.
+
+    Args:
+        directory: Directory of the cache. It is created if needed.
+        max_bytes: Maximum total size of the entries.
+
+    Attributes:
+        hits: Number of transformations read from the cache.
+        misses: Number of transformations computed.
+        evictions: Number of entries removed to respect the size limit.
+
+    """
+
+    suffix = ".automaton.z"
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        max_bytes: int = 256 * 1024 * 1024,
+    ) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, operation: str, automaton: aut.FiniteAutomaton) -> str:
+        key = f"{operation}-v{ALGORITHM_VERSION}-{automaton_digest(automaton)}"
+        return os.path.join(self.directory, key + self.suffix)
+
+    def _read(self, path: str) -> Optional[aut.FiniteAutomaton]:
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            # Mark the entry as recently used
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+
+        try:
+            return _decode(data)
+        except (ValueError, KeyError, IndexError, TypeError, zlib.error):
+            # Corrupted entry: recompute it
+            self._remove(path)
+            return None
+
+    def _write(self, path: str, automaton: aut.FiniteAutomaton) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_encode(automaton))
+            os.replace(tmp_path, path)
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+
+        self._evict()
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def _entries(self) -> Dict[str, os.stat_result]:
+        entries = {}
+        for name in os.listdir(self.directory):
+            if name.endswith(self.suffix):
+                path = os.path.join(self.directory, name)
+                try:
+                    entries[path] = os.stat(path)
+                except FileNotFoundError:
+                    pass
+
+        return entries
+
+    def _evict(self) -> None:
+        entries = self._entries()
+        total = sum(stat.st_size for stat in entries.values())
+        for path in sorted(entries, key=lambda p: entries[p].st_mtime):
+            if total <= self.max_bytes:
+                break
+            total -= entries[path].st_size
+            if self._remove(path):
+                self.evictions += 1
+
+    def get(
+        self,
+        operation: str,
+        automaton: aut.FiniteAutomaton,
+        compute: Callable[[aut.FiniteAutomaton], aut.FiniteAutomaton],
+    ) -> aut.FiniteAutomaton:
+        """
+        Return a cached transformation, computing it if needed.
+
+        Args:
+            operation: Name of the transformation, part of the key.
+            automaton: Input automaton.
+            compute: Function computing the transformation.
+
+        Returns:
+            Transformed automaton.
+
+        """
+        path = self._path(operation, automaton)
+        result = self._read(path)
+        if result is not None:
+            self.hits += 1
+            return result
+
+        self.misses += 1
+        result = compute(automaton)
+        self._write(path, result)
+        return result
+
+    def to_deterministic(
+        self,
+        automaton: aut.FiniteAutomaton,
+    ) -> aut.FiniteAutomaton:
+        """Cached :meth:`~automata.automaton.FiniteAutomaton.to_deterministic`."""
+        return self.get(
+            "to_deterministic",
+            automaton,
+            aut.FiniteAutomaton.to_deterministic,
+        )
+
+    def to_minimized(
+        self,
+        automaton: aut.FiniteAutomaton,
+    ) -> aut.FiniteAutomaton:
+        """Cached :meth:`~automata.automaton.FiniteAutomaton.to_minimized`."""
+        return self.get(
+            "to_minimized",
+            automaton,
+            aut.FiniteAutomaton.to_minimized,
+        )
+
+    def stats(self) -> Dict[str, int]:
+        """Return the statistics of the cache."""
+        entries = self._entries()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(entries),
+            "bytes": sum(stat.st_size for stat in entries.values()),
+        }
+
+    def clear(self) -> None:
+        """Remove all the entries of the cache."""
+        for path in self._entries():
+            self._remove(path)
@@ -0,0 +1,305 @@
+"""Regular expressions with capture groups."""
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from automata.automaton import FiniteAutomaton, State, Transition
+from automata.re_parser import REParser
+
+Span = Tuple[int, int]
+
+
+def _capture_re_to_rpn(re_string: str) -> List[str]:
+    """
+    Convert re with capture groups to reverse polish notation (RPN).
+
+    Groups are written ``{...}`` and numbered from 0 by their opening
+    brace. The end of group ``n`` is the token ``{n}`` in the result.
+
+    Args:
+        re_string: Regular expression in infix notation.
+
+    Returns:
+        Tokens of the regular expression in reverse polish notation.
+
+    """
+    stack: List[str] = []
+    rpn: List[str] = []
+    n_groups = 0
+    for x in re_string:
+        if x == "+":
+            while len(stack) > 0 and stack[-1][0] not in "({":
+                rpn.append(stack.pop())
+            stack.append(x)
+        elif x == ".":
+            while len(stack) > 0 and stack[-1] == ".":
+                rpn.append(stack.pop())
+            stack.append(x)
+        elif x == "(":
+            stack.append(x)
+        elif x == "{":
+            stack.append(f"{{{n_groups}")
+            n_groups += 1
+        elif x == ")":
+            while stack[-1] != "(":
+                rpn.append(stack.pop())
+            stack.pop()
+        elif x == "}":
+            while stack[-1][0] != "{":
+                rpn.append(stack.pop())
+            rpn.append(stack.pop() + "}")
+        else:
+            rpn.append(x)
+
+    while len(stack) > 0:
+        rpn.append(stack.pop())
+
+    return rpn
+
+
+class CaptureREParser(REParser):
+    """
+    Parser of regular expressions with capture groups.
+
+    Groups are written between braces, such as ``{a.b}*.{c}``. The entry
+    and exit of each group are lambda transitions, recorded in
+    :attr:`tags`. Lambda transitions are created in order of priority, and
+    repetitions of a star are preferred to leaving it (greedy star).
+
+    Attributes:
+        tags: Tag of the tagged lambda transitions, by names of their
+            initial and final states. Tag ``2 * n`` is the start of group
+            ``n`` and tag ``2 * n + 1`` its end.
+        n_groups: Number of groups of the last regular expression.
+
+    """
+
+    tags: Dict[Tuple[str, str], int]
+    n_groups: int
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.tags = {}
+        self.n_groups = 0
+
+    def _create_automaton_star(
+        self,
+        automaton: FiniteAutomaton,
+    ) -> FiniteAutomaton:
+        initial_state = State(f"q{self.state_counter}")
+        final_state = State(f"q{self.state_counter+1}", is_final=True)
+        self.state_counter += 2
+
+        automaton.final_state.is_final = False
+
+        transitions = [
+            Transition(initial_state, None, automaton.initial_state),
+            Transition(initial_state, None, final_state),
+            Transition(automaton.final_state, None, automaton.initial_state),
+            Transition(automaton.final_state, None, final_state),
+        ]
+
+        return FiniteAutomaton(
+            initial_state=initial_state,
+            states=[initial_state] + list(automaton.states) + [final_state],
+            symbols=automaton.symbols,
+            transitions=transitions + list(automaton.transitions),
+        )
+
+    def _create_automaton_group(
+        self,
+        automaton: FiniteAutomaton,
+        group: int,
+    ) -> FiniteAutomaton:
+        initial_state = State(f"q{self.state_counter}")
+        final_state = State(f"q{self.state_counter+1}", is_final=True)
+        self.state_counter += 2
+
+        automaton.final_state.is_final = False
+        self.tags[initial_state.name, automaton.initial_state.name] = 2 * group
+        self.tags[automaton.final_state.name, final_state.name] = 2 * group + 1
+
+        transitions = [
+            Transition(initial_state, None, automaton.initial_state),
+            Transition(automaton.final_state, None, final_state),
+        ]
+
+        return FiniteAutomaton(
+            initial_state=initial_state,
+            states=[initial_state] + list(automaton.states) + [final_state],
+            symbols=automaton.symbols,
+            transitions=transitions + list(automaton.transitions),
+        )
+
+    def create_automaton(
+        self,
+        re_string: str,
+    ) -> FiniteAutomaton:
+        self.tags = {}
+        self.n_groups = 0
+        if not re_string:
+            return self._create_automaton_empty()
+
+        stack: List[FiniteAutomaton] = []
+        self.state_counter = 0
+        for x in _capture_re_to_rpn(re_string):
+            if x == "*":
+                aut = stack.pop()
+                stack.append(self._create_automaton_star(aut))
+            elif x == "+":
+                aut2 = stack.pop()
+                aut1 = stack.pop()
+                stack.append(self._create_automaton_union(aut1, aut2))
+            elif x == ".":
+                aut2 = stack.pop()
+                aut1 = stack.pop()
+                stack.append(self._create_automaton_concat(aut1, aut2))
+            elif x == "λ":
+                stack.append(self._create_automaton_lambda())
+            elif len(x) > 1:
+                group = int(x[1:-1])
+                self.n_groups = max(self.n_groups, group + 1)
+                aut = stack.pop()
+                stack.append(self._create_automaton_group(aut, group))
+            else:
+                stack.append(self._create_automaton_symbol(x))
+
+        return stack.pop()
+
+
+# Thread of the simulation: state and positions of the group boundaries
+_Thread = Tuple[State, Tuple[int, ...]]
+
+
+class CaptureEvaluator():
+    """
+    Evaluator returning the spans of the capture groups.
+
+    The tagged automaton is simulated in a single pass over the string
+    (Pike VM): a list of threads, each with a state and the positions of
+    the group boundaries seen, is kept in order of priority, and only the
+    first thread that reaches each state survives. Priorities follow the
+    order of the lambda transitions, so alternatives are preferred from
+    left to right and stars are greedy, as in backtracking engines, but
+    the time is linear in the length of the string.
+
+    Args:
+        automaton: Automaton created by :class:`CaptureREParser`.
+        tags: Tags of the parser.
+        n_groups: Number of groups.
+
+    """
+
+    def __init__(
+        self,
+        automaton: FiniteAutomaton,
+        tags: Dict[Tuple[str, str], int],
+        n_groups: int,
+    ) -> None:
+        self.automaton = automaton
+        self.n_groups = n_groups
+        self._lambdas: Dict[State, List[Tuple[State, Optional[int]]]] = {}
+        self._moves: Dict[State, Dict[str, List[State]]] = {}
+        for t in automaton.transitions:
+            if t.symbol is None:
+                self._lambdas.setdefault(t.initial_state, []).append((
+                    t.final_state,
+                    tags.get((t.initial_state.name, t.final_state.name)),
+                ))
+            else:
+                self._moves.setdefault(t.initial_state, {}).setdefault(
+                    t.symbol,
+                    [],
+                ).append(t.final_state)
+
+    @classmethod
+    def from_regex(cls, regex: str) -> "CaptureEvaluator":
+        """Create the evaluator of a regular expression with groups."""
+        parser = CaptureREParser()
+        automaton = parser.create_automaton(regex)
+        return cls(automaton, parser.tags, parser.n_groups)
+
+    def _add_thread(
+        self,
+        threads: List[_Thread],
+        visited: Dict[State, None],
+        state: State,
+        captures: Tuple[int, ...],
+        position: int,
+    ) -> None:
+        """Add a thread and those reached with lambdas, by priority."""
+        pending = [(state, captures)]
+        while pending:
+            state, captures = pending.pop()
+            if state in visited:
+                continue
+            visited[state] = None
+            threads.append((state, captures))
+
+            lambdas = self._lambdas.get(state, ())
+            for target, tag in reversed(lambdas):
+                if tag is None:
+                    pending.append((target, captures))
+                else:
+                    pending.append((
+                        target,
+                        captures[:tag] + (position,) + captures[tag + 1:],
+                    ))
+
+    def match(self, string: str) -> Optional[Tuple[Optional[Span], ...]]:
+        """
+        Match a whole string and return the spans of the groups.
+
+        Args:
+            string: String to match.
+
+        Returns:
+            ``None`` if the string is not accepted. Otherwise, the
+            ``(start, end)`` span of the last match of each group, in the
+            order of their opening braces, or ``None`` for groups that
+            didn't participate in the match.
+
+        """
+        threads: List[_Thread] = []
+        self._add_thread(
+            threads,
+            {},
+            self.automaton.initial_state,
+            (-1,) * (2 * self.n_groups),
+            0,
+        )
+
+        for i, symbol in enumerate(string):
+            if symbol not in self.automaton.symbols:
+                raise ValueError(
+                    f"Symbol {symbol} is not a valid symbol "
+                    f"{self.automaton.symbols}",
+                )
+
+            next_threads: List[_Thread] = []
+            visited: Dict[State, None] = {}
+            for state, captures in threads:
+                for target in self._moves.get(state, {}).get(symbol, ()):
+                    self._add_thread(
+                        next_threads,
+                        visited,
+                        target,
+                        captures,
+                        i + 1,
+                    )
+            threads = next_threads
+
+        for state, captures in threads:
+            if state.is_final:
+                return _spans(captures)
+
+        return None
+
+    def accepts(self, string: str) -> bool:
+        """Return if a string is accepted."""
+        return self.match(string) is not None
+
+
+def _spans(captures: Sequence[int]) -> Tuple[Optional[Span], ...]:
+    return tuple(
+        None if start == -1 or end == -1 else (start, end)
+        for start, end in zip(captures[::2], captures[1::2])
+    )
@@ -0,0 +1,109 @@
+"""Generation of specialized Python matchers for deterministic automata."""
+from typing import Callable, Dict
+
+import automata.automaton as aut
+from automata.dense import DenseDFA
+
+Matcher = Callable[[str], bool]
+
+
+def to_python_source(
+    automaton: aut.FiniteAutomaton,
+    function_name: str = "match",
+) -> str:
+    """
+    Write Python source code of a matcher for a deterministic automaton.
+
+    The generated function receives a string and returns whether it is
+    accepted, raising ``ValueError`` for symbols outside the alphabet, like
+    :class:`~automata.automaton_evaluator.FiniteAutomatonEvaluator`.
+
+    Each state is a dictionary from symbol to next state that only contains
+    transitions to live states, so the alphabet check and the early exit on
+    dead states happen outside the main loop.
+
+    Args:
+        automaton: Deterministic automaton.
+        function_name: Name of the generated function.
+
+    Returns:
+        Python source code defining the function.
+
+    """
+    dfa = DenseDFA(automaton)
+
+    rows = []
+    for state, row in enumerate(dfa.table):
+        transitions: Dict[str, int] = {
+            symbol: row[symbol_id]
+            for symbol_id, symbol in enumerate(dfa.symbols)
+            if state not in dfa.dead and row[symbol_id] not in dfa.dead
+        }
+        rows.append(f"    {transitions!r},\n")
+
+    if 0 in dfa.dead:
+        body = (
+            "    if not _symbols.issuperset(string):\n"
+            "        _raise_invalid(string)\n"
+            "    return False\n"
+        )
+    else:
+        body = (
+            "    state = 0\n"
+            "    try:\n"
+            "        for symbol in string:\n"
+            "            state = _table[state][symbol]\n"
+            "    except KeyError:\n"
+            "        if not _symbols.issuperset(string):\n"
+            "            _raise_invalid(string)\n"
+            "        return False\n"
+            "    return state in _finals\n"
+        )
+
+    return (
+        f"_ALPHABET = {dfa.symbols!r}\n"
+        f"_SYMBOLS = frozenset(_ALPHABET)\n"
+        f"_FINALS = frozenset({sorted(dfa.finals)!r})\n"
+        "_TABLE = (\n"
+        + "".join(rows)
+        + ")\n"
+        "\n"
+        "\n"
+        "def _raise_invalid(string):\n"
+        "    symbol = next(s for s in string if s not in _SYMBOLS)\n"
+        "    raise ValueError(\n"
+        "        f\"Symbol {symbol} is not a valid symbol {_ALPHABET}\",\n"
+        "    )\n"
+        "\n"
+        "\n"
+        f"def {function_name}(\n"
+        "    string,\n"
+        "    _table=_TABLE,\n"
+        "    _finals=_FINALS,\n"
+        "    _symbols=_SYMBOLS,\n"
+        "):\n"
+        + body
+    )
+
+
+def compile_codegen(automaton: aut.FiniteAutomaton) -> Matcher:
+    """
+    Compile a specialized matcher for a deterministic automaton.
+
+    The compiled function is cached in the automaton, so calling this
+    function again with the same automaton is cheap.
+
+    Args:
+        automaton: Deterministic automaton.
+
+    Returns:
+        Function that returns whether a string is accepted.
+
+    """
+    def compile_matcher() -> Matcher:
+        source = to_python_source(automaton)
+        namespace: Dict[str, object] = {}
+        exec(compile(source, "<automaton matcher>", "exec"), namespace)
+        return namespace["match"]  # type: ignore[return-value]
+
+    return automaton.cached("codegen", compile_matcher)
@@ -0,0 +1,279 @@
+"""Row displacement (comb) compression of deterministic automata tables."""
+from array import array
+from collections import Counter
+from typing import Dict, List, Tuple
+
+import automata.automaton as aut
+from automata.utils import is_deterministic
+
+# Bases tried for a row before the holes behind are no longer used, so
+# that holes that rarely fit are not probed again and again.
+_MAX_PROBES = 32
+
+
+class CombTable():
+    """
+    Compressed transition table of a deterministic automaton.
+
+    Each state has a default next state (the most common target of its
+    row, where missing transitions go to an added sink state). The
+    remaining transitions of every row are stored in the shared ``next``
+    and ``check`` arrays, displaced by the ``base`` of the row, so
+    that the next state from ``state`` with symbol ``c`` is
+    ``next[base[state] + c]`` if ``check[base[state] + c] == state`` and
+    ``default[state]`` otherwise.
+
+    The table and the dead states are computed from the sparse rows of
+    the transitions, without materializing the dense table, and rows are
+    placed first-fit skipping occupied slots and with a bounded number of
+    probes, so large automata can be compressed.
+
+    Args:
+        automaton: Deterministic automaton to compress.
+
+    """
+
+    def __init__(self, automaton: aut.FiniteAutomaton) -> None:
+        if not is_deterministic(automaton):
+            raise ValueError("Automaton is not deterministic")
+
+        states = (automaton.initial_state,) + tuple(
+            s for s in automaton.states if s != automaton.initial_state
+        )
+        state_ids = {s: i for i, s in enumerate(states)}
+        self.symbols = tuple(automaton.symbols)
+        self.symbol_ids = {s: i for i, s in enumerate(self.symbols)}
+        n_symbols = len(self.symbols)
+
+        # Sparse rows, built directly from the transitions
+        explicit: List[Dict[int, int]] = [{} for _ in states]
+        for t in automaton.transitions:
+            explicit[state_ids[t.initial_state]][
+                self.symbol_ids[t.symbol]  # type: ignore[index]
+            ] = state_ids[t.final_state]
+
+        # Missing transitions go to an additional sink state
+        sink = len(states)
+        has_sink = any(len(row) < n_symbols for row in explicit)
+        self.n_states = len(states) + has_sink
+        if has_sink:
+            explicit.append({})
+
+        self.finals = bytearray(state.is_final for state in states)
+        if has_sink:
+            self.finals.append(0)
+
+        # Dead states: those not reaching a final state (nor the sink)
+        predecessors: List[List[int]] = [[] for _ in range(self.n_states)]
+        for state, row in enumerate(explicit):
+            for target in set(row.values()):
+                predecessors[target].append(state)
+        self.dead = bytearray([1]) * self.n_states
+        pending = [i for i, state in enumerate(states) if state.is_final]
+        for state in pending:
+            self.dead[state] = 0
+        while pending:
+            for source in predecessors[pending.pop()]:
+                if self.dead[source]:
+                    self.dead[source] = 0
+                    pending.append(source)
+
+        self.default = array("i", [0] * self.n_states)
+        self.base = array("i", [0] * self.n_states)
+        rows: List[Tuple[int, List[Tuple[int, int]]]] = []
+        for state, row in enumerate(explicit):
+            if state == sink:
+                # The sink row is full of transitions to itself
+                self.default[state] = sink
+                continue
+
+            missing = n_symbols - len(row)
+            counts = Counter(row.values())
+            default, count = (
+                counts.most_common(1)[0] if counts else (sink, 0)
+            )
+            if missing > count:
+                default = sink
+            self.default[state] = default
+
+            entries = [(c, t) for c, t in row.items() if t != default]
+            if missing and default != sink:
+                entries += [
+                    (c, sink) for c in range(n_symbols) if c not in row
+                ]
+            if entries:
+                entries.sort()
+                rows.append((state, entries))
+
+        check: List[int] = []
+        next_states: List[int] = []
+        # free[i] leads to the first free slot at or after i (union-find
+        # with path compression), so occupied slots are skipped at once.
+        free = [0]
+        low = 0  # Minimum base of the rows not placed yet
+
+        def find_free(i: int) -> int:
+            root = i
+            while free[root] != root:
+                root = free[root]
+            while free[i] != root:
+                free[i], i = root, free[i]
+            return root
+
+        def reserve(size: int) -> None:
+            while len(check) < size:
+                check.append(-1)
+                next_states.append(0)
+                free.append(len(free))
+
+        rows.sort(key=lambda r: len(r[1]), reverse=True)
+        for state, entries in rows:
+            first = entries[0][0]
+            # Only bases placing the first entry in a free slot are tried
+            reserve(low + first)
+            slot = find_free(low + first)
+            probes = 0
+            while True:
+                base = slot - first
+                reserve(base + n_symbols)
+                if all(check[base + c] == -1 for c, _ in entries):
+                    break
+                probes += 1
+                if probes >= _MAX_PROBES:
+                    # Give up the holes before this base for good
+                    low = base
+                slot = find_free(slot + 1)
+
+            self.base[state] = base
+            for symbol_id, target in entries:
+                check[base + symbol_id] = state
+                next_states[base + symbol_id] = target
+                free[base + symbol_id] = base + symbol_id + 1
+
+        reserve(n_symbols)
+        self.check = array("i", check)
+        self.next = array("i", next_states)
+
+    def next_state(self, state: int, symbol_id: int) -> int:
+        """
+        Return the next state of a transition.
+
+        Args:
+            state: Index of the current state.
+            symbol_id: Index of the symbol consumed.
+
+        Returns:
+            Index of the next state.
+
+        """
+        i = self.base[state] + symbol_id
+        if self.check[i] == state:
+            return self.next[i]
+        return self.default[state]
+
+    @property
+    def dense_size(self) -> int:
+        """Number of entries of the equivalent dense table."""
+        return self.n_states * len(self.symbols)
+
+    @property
+    def compressed_size(self) -> int:
+        """Number of entries of the compressed arrays."""
+        return (
+            len(self.default)
+            + len(self.base)
+            + len(self.next)
+            + len(self.check)
+        )
+
+    @property
+    def compression_ratio(self) -> float:
+        """Ratio between the dense and the compressed table sizes."""
+        return self.dense_size / self.compressed_size
+
+
+class CombTableEvaluator():
+    """
+    Evaluator reading a compressed table directly.
+
+    Args:
+        table: Compressed table of the automaton to evaluate.
+
+    Attributes:
+        current_state: Index of the current state.
+
+    """
+
+    table: CombTable
+    current_state: int
+
+    def __init__(self, table: CombTable) -> None:
+        self.table = table
+        self.current_state = 0
+
+    def process_symbol(self, symbol: str) -> None:
+        """
+        Process one symbol.
+
+        Args:
+            symbol: Symbol to consume.
+
+        """
+        symbol_id = self.table.symbol_ids.get(symbol)
+        if symbol_id is None:
+            raise ValueError(
+                f"Symbol {symbol} is not a valid symbol {self.table.symbols}",
+            )
+
+        self.current_state = self.table.next_state(
+            self.current_state,
+            symbol_id,
+        )
+
+    def process_string(self, string: str) -> None:
+        """
+        Process a full string of symbols.
+
+        Processing stops early if a dead state is reached, but the rest of
+        the string is still checked against the alphabet.
+
+        Args:
+            string: String to process.
+
+        """
+        table = self.table
+        base, check, next_states = table.base, table.check, table.next
+        default, dead, symbol_ids = table.default, table.dead, table.symbol_ids
+        state = self.current_state
+
+        try:
+            for i, symbol in enumerate(string):
+                j = base[state] + symbol_ids[symbol]
+                state = next_states[j] if check[j] == state else default[state]
+                if dead[state]:
+                    invalid = set(string[i + 1:]).difference(symbol_ids)
+                    if invalid:
+                        symbol = next(s for s in string if s in invalid)
+                        raise KeyError(symbol)
+                    break
+        except KeyError:
+            raise ValueError(
+                f"Symbol {symbol} is not a valid symbol {table.symbols}",
+            ) from None
+        finally:
+            self.current_state = state
+
+    def is_accepting(self) -> bool:
+        """Check if the current state is an accepting one."""
+        return bool(self.table.finals[self.current_state])
+
+    def accepts(self, string: str) -> bool:
+        """Return if a string is accepted without changing state."""
+        old_state = self.current_state
+        try:
+            self.process_string(string)
+            accepted = self.is_accepting()
+        finally:
+            self.current_state = old_state
+
+        return accepted
@@ -0,0 +1,642 @@
+"""Compressed sparse row (CSR) representation of automata."""
+from array import array
+from bisect import bisect_left
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+import automata.automaton as aut
+
+
+def refine_partition(
+    partition: Sequence[int],
+    rows: Sequence[Sequence[int]],
+) -> List[int]:
+    """
+    Refine a partition of the states of a deterministic automaton.
+
+    Classes are split (Moore's algorithm) until the states of each class
+    go to the same classes with each symbol, so starting from the
+    partition by finality gives the classes of the minimal automaton.
+
+    Args:
+        partition: Initial class of each state.
+        rows: Next state of each state by symbol index, or ``-1`` if
+            there is no transition.
+
+    Returns:
+        Class of each state, numbered from ``0`` in order of appearance.
+
+    """
+    classes = list(partition)
+    n_classes = len(set(classes))
+    while True:
+        signatures: Dict[Tuple[int, ...], int] = {}
+        classes = [
+            signatures.setdefault(
+                (classes[s],) + tuple(
+                    -1 if t == -1 else classes[t] for t in row
+                ),
+                len(signatures),
+            )
+            for s, row in enumerate(rows)
+        ]
+        if len(signatures) == n_classes:
+            return classes
+        n_classes = len(signatures)
+
+
+class CSRAutomaton():
+    """
+    Automaton whose transitions are stored in flat integer arrays.
+
+    States and symbols are identified by their indexes. The symbol
+    transitions of state ``s`` are the positions ``offsets[s]`` to
+    ``offsets[s + 1]`` of the parallel arrays ``symbol_ids`` and
+    ``targets``, sorted by symbol. Lambda transitions are stored in the
+    same way in ``lambda_offsets`` and ``lambda_targets``.
+
+    Args:
+        initial: Index of the initial state.
+        state_names: Names of the states.
+        finals: ``1`` for final states and ``0`` otherwise, by state.
+        symbols: Symbols of the automaton.
+        offsets: Start of the symbol transitions of each state.
+        symbol_ids: Symbol of each transition.
+        targets: Final state of each transition.
+        lambda_offsets: Start of the lambda transitions of each state.
+        lambda_targets: Final state of each lambda transition.
+
+    """
+
+    initial: int
+    state_names: Tuple[str, ...]
+    finals: bytearray
+    symbols: Tuple[str, ...]
+    offsets: "array[int]"
+    symbol_ids: "array[int]"
+    targets: "array[int]"
+    lambda_offsets: "array[int]"
+    lambda_targets: "array[int]"
+
+    def __init__(
+        self,
+        *,
+        initial: int,
+        state_names: Sequence[str],
+        finals: bytearray,
+        symbols: Sequence[str],
+        offsets: "array[int]",
+        symbol_ids: "array[int]",
+        targets: "array[int]",
+        lambda_offsets: "array[int]",
+        lambda_targets: "array[int]",
+    ) -> None:
+        n_states = len(state_names)
+        if not 0 <= initial < n_states:
+            raise ValueError(f"Initial state {initial} is not a valid state")
+
+        if len(finals) != n_states:
+            raise ValueError("There must be a final flag for each state")
+
+        for name, starts, length in (
+            ("offsets", offsets, len(targets)),
+            ("lambda_offsets", lambda_offsets, len(lambda_targets)),
+        ):
+            if len(starts) != n_states + 1 or starts[-1] != length:
+                raise ValueError(f"Invalid {name} array")
+
+        if len(symbol_ids) != len(targets):
+            raise ValueError("Symbols and targets have different lengths")
+
+        self.initial = initial
+        self.state_names = tuple(state_names)
+        self.finals = finals
+        self.symbols = tuple(symbols)
+        self.offsets = offsets
+        self.symbol_ids = symbol_ids
+        self.targets = targets
+        self.lambda_offsets = lambda_offsets
+        self.lambda_targets = lambda_targets
+        self._symbol_index = {s: i for i, s in enumerate(self.symbols)}
+        self._live: Optional[bytearray] = None
+
+    @classmethod
+    def _from_edges(
+        cls,
+        *,
+        initial: int,
+        state_names: Sequence[str],
+        finals: bytearray,
+        symbols: Sequence[str],
+        edges: Iterable[Tuple[int, int, int]],
+        lambda_edges: Iterable[Tuple[int, int]],
+    ) -> "CSRAutomaton":
+        n_states = len(state_names)
+
+        sorted_edges = sorted(set(edges))
+        offsets = array("q", [0] * (n_states + 1))
+        for source, _, _ in sorted_edges:
+            offsets[source + 1] += 1
+
+        sorted_lambdas = sorted(set(lambda_edges))
+        lambda_offsets = array("q", [0] * (n_states + 1))
+        for source, _ in sorted_lambdas:
+            lambda_offsets[source + 1] += 1
+
+        for i in range(n_states):
+            offsets[i + 1] += offsets[i]
+            lambda_offsets[i + 1] += lambda_offsets[i]
+
+        return cls(
+            initial=initial,
+            state_names=state_names,
+            finals=finals,
+            symbols=symbols,
+            offsets=offsets,
+            symbol_ids=array("i", [e[1] for e in sorted_edges]),
+            targets=array("i", [e[2] for e in sorted_edges]),
+            lambda_offsets=lambda_offsets,
+            lambda_targets=array("i", [e[1] for e in sorted_lambdas]),
+        )
+
+    @classmethod
+    def from_automaton(
+        cls,
+        automaton: aut.FiniteAutomaton,
+    ) -> "CSRAutomaton":
+        """
+        Convert a finite automaton to the CSR representation.
+
+        Args:
+            automaton: Automaton to convert.
+
+        Returns:
+            Equivalent automaton in CSR form.
+
+        """
+        state_ids = {s: i for i, s in enumerate(automaton.states)}
+        symbol_ids = {s: i for i, s in enumerate(automaton.symbols)}
+
+        edges = []
+        lambda_edges = []
+        for t in automaton.transitions:
+            source = state_ids[t.initial_state]
+            target = state_ids[t.final_state]
+            if t.symbol is None:
+                lambda_edges.append((source, target))
+            else:
+                edges.append((source, symbol_ids[t.symbol], target))
+
+        return cls._from_edges(
+            initial=state_ids[automaton.initial_state],
+            state_names=[s.name for s in automaton.states],
+            finals=bytearray(s.is_final for s in automaton.states),
+            symbols=automaton.symbols,
+            edges=edges,
+            lambda_edges=lambda_edges,
+        )
+
+    def to_automaton(self) -> aut.FiniteAutomaton:
+        """
+        Convert back to a finite automaton.
+
+        Returns:
+            Equivalent finite automaton.
+
+        """
+        states = [
+            aut.State(name, is_final=bool(final))
+            for name, final in zip(self.state_names, self.finals)
+        ]
+        transitions = [
+            aut.Transition(states[source], self.symbols[symbol], states[target])
+            for source, symbol, target in self.edges()
+        ] + [
+            aut.Transition(states[source], None, states[target])
+            for source, target in self.lambda_edges()
+        ]
+
+        return aut.FiniteAutomaton(
+            initial_state=states[self.initial],
+            states=dict.fromkeys(states),
+            symbols=self.symbols,
+            transitions=transitions,
+        )
+
+    @property
+    def n_states(self) -> int:
+        """Number of states."""
+        return len(self.state_names)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate size in bytes of the transition arrays."""
+        return sum(
+            a.itemsize * len(a)
+            for a in (
+                self.offsets,
+                self.symbol_ids,
+                self.targets,
+                self.lambda_offsets,
+                self.lambda_targets,
+            )
+        ) + len(self.finals)
+
+    def edges(self) -> Iterator[Tuple[int, int, int]]:
+        """Iterate over the symbol transitions as index triples."""
+        for state in range(self.n_states):
+            for i in range(self.offsets[state], self.offsets[state + 1]):
+                yield state, self.symbol_ids[i], self.targets[i]
+
+    def lambda_edges(self) -> Iterator[Tuple[int, int]]:
+        """Iterate over the lambda transitions as index pairs."""
+        for state in range(self.n_states):
+            start = self.lambda_offsets[state]
+            for i in range(start, self.lambda_offsets[state + 1]):
+                yield state, self.lambda_targets[i]
+
+    def symbol_id(self, symbol: str) -> int:
+        """
+        Return the index of a symbol.
+
+        Raises:
+            ValueError: If the symbol is not in the alphabet.
+
+        """
+        try:
+            return self._symbol_index[symbol]
+        except KeyError:
+            raise ValueError(
+                f"Symbol {symbol} is not a valid symbol {self.symbols}",
+            ) from None
+
+    def successors(self, state: int, symbol_id: int) -> "array[int]":
+        """Return the states reached from a state with a symbol."""
+        start = self.offsets[state]
+        end = self.offsets[state + 1]
+        lo = bisect_left(self.symbol_ids, symbol_id, start, end)
+        hi = lo
+        while hi < end and self.symbol_ids[hi] == symbol_id:
+            hi += 1
+
+        return self.targets[lo:hi]
+
+    def get_closure(self, states: Iterable[int]) -> Set[int]:
+        """Return the states reachable with lambda transitions."""
+        closure = set(states)
+        stack = list(closure)
+        lambda_offsets, lambda_targets = self.lambda_offsets, self.lambda_targets
+
+        while stack:
+            state = stack.pop()
+            for i in range(lambda_offsets[state], lambda_offsets[state + 1]):
+                target = lambda_targets[i]
+                if target not in closure:
+                    closure.add(target)
+                    stack.append(target)
+
+        return closure
+
+    def step(self, states: Iterable[int], symbol_id: int) -> Set[int]:
+        """Return the lambda closure of the states reached with a symbol."""
+        reached: Set[int] = set()
+        for state in states:
+            reached.update(self.successors(state, symbol_id))
+
+        return self.get_closure(reached)
+
+    def _adjacency(
+        self,
+        reverse: bool,
+    ) -> Sequence[Tuple["array[int]", "array[int]"]]:
+        """
+        Return the adjacency of the states as CSR arrays.
+
+        The forward adjacency is given by the transition arrays themselves.
+        The reverse one is built with a counting pass over the targets,
+        without materializing per state lists.
+
+        """
+        if not reverse:
+            return (
+                (self.offsets, self.targets),
+                (self.lambda_offsets, self.lambda_targets),
+            )
+
+        n_states = self.n_states
+        counts = array("q", [0] * (n_states + 1))
+        for target in self.targets:
+            counts[target + 1] += 1
+        for target in self.lambda_targets:
+            counts[target + 1] += 1
+        for state in range(n_states):
+            counts[state + 1] += counts[state]
+
+        sources = array("i", [0] * counts[n_states])
+        positions = array("q", counts)
+        for offsets, targets in (
+            (self.offsets, self.targets),
+            (self.lambda_offsets, self.lambda_targets),
+        ):
+            for state in range(n_states):
+                for i in range(offsets[state], offsets[state + 1]):
+                    target = targets[i]
+                    sources[positions[target]] = state
+                    positions[target] += 1
+
+        return ((counts, sources),)
+
+    def _traverse(
+        self,
+        start: Iterable[int],
+        adjacency: Sequence[Tuple["array[int]", "array[int]"]],
+    ) -> bytearray:
+        visited = bytearray(self.n_states)
+        stack = []
+        for state in start:
+            if not visited[state]:
+                visited[state] = 1
+                stack.append(state)
+
+        while stack:
+            state = stack.pop()
+            for offsets, targets in adjacency:
+                for i in range(offsets[state], offsets[state + 1]):
+                    target = targets[i]
+                    if not visited[target]:
+                        visited[target] = 1
+                        stack.append(target)
+
+        return visited
+
+    def _live_states(self) -> bytearray:
+        if self._live is None:
+            self._live = self._traverse(
+                (s for s in range(self.n_states) if self.finals[s]),
+                self._adjacency(reverse=True),
+            )
+        return self._live
+
+    def co_accessible_states(self) -> FrozenSet[int]:
+        """Return the states from which a final state can be reached."""
+        live = self._live_states()
+        return frozenset(s for s in range(self.n_states) if live[s])
+
+    def _restrict(self, keep: bytearray) -> "CSRAutomaton":
+        kept = [s for s in range(self.n_states) if keep[s]]
+        new_ids = {old: new for new, old in enumerate(kept)}
+        return CSRAutomaton._from_edges(
+            initial=new_ids[self.initial],
+            state_names=[self.state_names[s] for s in kept],
+            finals=bytearray(self.finals[s] for s in kept),
+            symbols=self.symbols,
+            edges=(
+                (new_ids[source], symbol, new_ids[target])
+                for source, symbol, target in self.edges()
+                if keep[source] and keep[target]
+            ),
+            lambda_edges=(
+                (new_ids[source], new_ids[target])
+                for source, target in self.lambda_edges()
+                if keep[source] and keep[target]
+            ),
+        )
+
+    def eliminate_unreachable_states(self) -> "CSRAutomaton":
+        """Remove the states not reachable from the initial state."""
+        return self._restrict(self._traverse(
+            [self.initial],
+            self._adjacency(reverse=False),
+        ))
+
+    def trim(self) -> "CSRAutomaton":
+        """Remove unreachable and dead states, keeping the initial one."""
+        keep = self._traverse([self.initial], self._adjacency(reverse=False))
+        live = self._live_states()
+        for state in range(self.n_states):
+            keep[state] &= live[state]
+        keep[self.initial] = 1
+        return self._restrict(keep)
+
+    def _state_set_name(self, states: FrozenSet[int]) -> str:
+        if not states:
+            return "empty"
+        return "".join(sorted(self.state_names[s] for s in states))
+
+    def subset_table(
+        self,
+        *,
+        max_states: Optional[int] = None,
+    ) -> Tuple[List[FrozenSet[int]], List[List[int]]]:
+        """
+        Determinize the automaton with the subset construction.
+
+        Args:
+            max_states: Maximum number of subsets. By default, there is no
+                limit.
+
+        Returns:
+            The subsets of states reachable from the lambda closure of the
+            initial state, which is the first one, and the index of the
+            next subset of each subset by symbol index. The empty subset is
+            included if it is reachable.
+
+        Raises:
+            ValueError: If there are more than ``max_states`` subsets.
+
+        """
+        n_symbols = len(self.symbols)
+        offsets, symbol_ids, targets = (
+            self.offsets,
+            self.symbol_ids,
+            self.targets,
+        )
+
+        initial = frozenset(self.get_closure([self.initial]))
+        subset_ids: Dict[FrozenSet[int], int] = {initial: 0}
+        subsets = [initial]
+        rows: List[List[int]] = []
+        for subset in subsets:
+            # Successors of all the symbols, in a pass over the subset
+            reached: Dict[int, Set[int]] = {}
+            for state in subset:
+                for i in range(offsets[state], offsets[state + 1]):
+                    reached.setdefault(symbol_ids[i], set()).add(targets[i])
+
+            row = []
+            for symbol_id in range(n_symbols):
+                target = frozenset(
+                    self.get_closure(reached.get(symbol_id, ())),
+                )
+                target_id = subset_ids.get(target)
+                if target_id is None:
+                    target_id = len(subsets)
+                    if max_states is not None and target_id >= max_states:
+                        raise ValueError(
+                            f"Deterministic automaton has more than "
+                            f"{max_states} states",
+                        )
+                    subset_ids[target] = target_id
+                    subsets.append(target)
+                row.append(target_id)
+            rows.append(row)
+
+        return subsets, rows
+
+    def to_deterministic(
+        self,
+        *,
+        max_states: Optional[int] = None,
+    ) -> "CSRAutomaton":
+        """
+        Return an equivalent complete deterministic automaton.
+
+        States are named as in
+        :meth:`~automata.automaton.FiniteAutomaton.to_deterministic`.
+
+        Args:
+            max_states: Maximum number of states of the result. By
+                default, there is no limit.
+
+        Raises:
+            ValueError: If the result would have more than ``max_states``
+                states.
+
+        """
+        subsets, rows = self.subset_table(max_states=max_states)
+        edges = [
+            (state, symbol_id, target)
+            for state, row in enumerate(rows)
+            for symbol_id, target in enumerate(row)
+        ]
+
+        return CSRAutomaton._from_edges(
+            initial=0,
+            state_names=[self._state_set_name(s) for s in subsets],
+            finals=bytearray(
+                any(self.finals[s] for s in subset) for subset in subsets
+            ),
+            symbols=self.symbols,
+            edges=edges,
+            lambda_edges=(),
+        )
+
+    def to_minimized(self) -> "CSRAutomaton":
+        """
+        Return an equivalent minimal deterministic automaton.
+
+        The automaton must be deterministic. States are named ``q<n>``.
+
+        """
+        if len(self.lambda_targets):
+            raise ValueError("Automaton is not deterministic")
+
+        automaton = self.eliminate_unreachable_states()
+        n_symbols = len(automaton.symbols)
+        rows = []
+        for state in range(automaton.n_states):
+            row = [-1] * n_symbols
+            start, end = automaton.offsets[state], automaton.offsets[state + 1]
+            for i in range(start, end):
+                if row[automaton.symbol_ids[i]] != -1:
+                    raise ValueError("Automaton is not deterministic")
+                row[automaton.symbol_ids[i]] = automaton.targets[i]
+            rows.append(row)
+
+        classes = refine_partition(automaton.finals, rows)
+        n_classes = len(set(classes))
+
+        finals = bytearray(n_classes)
+        for state, class_id in enumerate(classes):
+            finals[class_id] = automaton.finals[state]
+
+        return CSRAutomaton._from_edges(
+            initial=classes[automaton.initial],
+            state_names=[f"q{n}" for n in range(n_classes)],
+            finals=finals,
+            symbols=automaton.symbols,
+            edges=(
+                (classes[source], symbol, classes[target])
+                for source, symbol, target in automaton.edges()
+            ),
+            lambda_edges=(),
+        )
+
+
+class CSREvaluator():
+    """
+    Evaluator of an automaton in CSR form.
+
+    Args:
+        automaton: Automaton to evaluate.
+
+    Attributes:
+        current_states: Set of indexes of the current states.
+
+    """
+
+    automaton: CSRAutomaton
+    current_states: Set[int]
+
+    def __init__(self, automaton: CSRAutomaton) -> None:
+        self.automaton = automaton
+        self.current_states = automaton.get_closure([automaton.initial])
+
+    def process_symbol(self, symbol: str) -> None:
+        """
+        Process one symbol.
+
+        Args:
+            symbol: Symbol to consume.
+
+        """
+        self.current_states = self.automaton.step(
+            self.current_states,
+            self.automaton.symbol_id(symbol),
+        )
+
+    def process_string(self, string: str) -> None:
+        """
+        Process a full string of symbols.
+
+        Processing stops early if no live state remains, but the rest of
+        the string is still checked against the alphabet.
+
+        Args:
+            string: String to process.
+
+        """
+        live_states = self.automaton._live_states()
+
+        for i, symbol in enumerate(string):
+            self.process_symbol(symbol)
+            if not any(live_states[s] for s in self.current_states):
+                symbols = self.automaton.symbols
+                for symbol in string[i + 1:]:
+                    if symbol not in symbols:
+                        self.automaton.symbol_id(symbol)
+                return
+
+    def is_accepting(self) -> bool:
+        """Check if the current state is an accepting one."""
+        return any(self.automaton.finals[s] for s in self.current_states)
+
+    def accepts(self, string: str) -> bool:
+        """Return if a string is accepted without changing state."""
+        old_states = self.current_states
+        try:
+            self.process_string(string)
+            accepted = self.is_accepting()
+        finally:
+            self.current_states = old_states
+
+        return accepted
@@ -0,0 +1,90 @@
+"""Integer table representation of deterministic automata."""
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+import automata.automaton as aut
+from automata.utils import is_deterministic
+
+
+class DenseDFA():
+    """
+    Deterministic automaton stored as a table of state indexes.
+
+    The initial state always has index ``0``. Missing transitions go to an
+    additional sink state, so the table is complete.
+
+    Args:
+        automaton: Deterministic automaton to convert.
+
+    Attributes:
+        states: States of the automaton, by index. The sink state, if added,
+            has no entry.
+        symbols: Symbols of the automaton, by index.
+        symbol_ids: Index of each symbol.
+        table: ``table[state][symbol_id]`` is the index of the next state.
+        finals: Indexes of the final states.
+        dead: Indexes of the states from which no final state is reachable.
+        sink: Index of the added sink state, or ``None`` if the automaton
+            was already complete.
+
+    """
+
+    states: Tuple[aut.State, ...]
+    symbols: Tuple[str, ...]
+    symbol_ids: Dict[str, int]
+    table: List[List[int]]
+    finals: FrozenSet[int]
+    dead: FrozenSet[int]
+    sink: Optional[int]
+
+    def __init__(self, automaton: aut.FiniteAutomaton) -> None:
+        if not is_deterministic(automaton):
+            raise ValueError("Automaton is not deterministic")
+
+        self.states = (automaton.initial_state,) + tuple(
+            s for s in automaton.states if s != automaton.initial_state
+        )
+        self.symbols = tuple(automaton.symbols)
+        self.symbol_ids = {s: i for i, s in enumerate(self.symbols)}
+
+        state_ids = {s: i for i, s in enumerate(self.states)}
+        sink = len(self.states)
+        self.table = [[sink] * len(self.symbols) for _ in self.states]
+        for t in automaton.transitions:
+            self.table[state_ids[t.initial_state]][
+                self.symbol_ids[t.symbol]  # type: ignore[index]
+            ] = state_ids[t.final_state]
+
+        if any(sink in row for row in self.table):
+            self.table.append([sink] * len(self.symbols))
+            self.sink = sink
+        else:
+            self.sink = None
+
+        self.finals = frozenset(
+            i for i, s in enumerate(self.states) if s.is_final
+        )
+        live = automaton.co_accessible_states()
+        self.dead = frozenset(
+            i for i in range(len(self.table))
+            if i == self.sink or self.states[i] not in live
+        )
+
+    @property
+    def n_states(self) -> int:
+        """Number of rows of the table, including the sink state."""
+        return len(self.table)
+
+    def symbol_id(self, symbol: str) -> int:
+        """
+        Return the index of a symbol.
+
+        Raises:
+            ValueError: If the symbol is not in the alphabet.
+
+        """
+        try:
+            return self.symbol_ids[symbol]
+        except KeyError:
+            raise ValueError(
+                f"Symbol {symbol} is not a valid symbol {self.symbols}",
+            ) from None
@@ -0,0 +1,88 @@
+"""Language equivalence of automata."""
+from collections import deque
+from typing import Deque, Dict, Hashable, Optional, Tuple
+
+import automata.automaton as aut
+from automata.lazy_dfa import LazyDFA, StateSet
+
+
+class _UnionFind():
+    """Disjoint sets with path halving."""
+
+    def __init__(self) -> None:
+        self.parent: Dict[Hashable, Hashable] = {}
+
+    def find(self, item: Hashable) -> Hashable:
+        parent = self.parent
+        parent.setdefault(item, item)
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+
+        return item
+
+    def union(self, item1: Hashable, item2: Hashable) -> None:
+        self.parent[self.find(item1)] = self.find(item2)
+
+
+def distinguishing_string(
+    automaton1: aut.FiniteAutomaton,
+    automaton2: aut.FiniteAutomaton,
+) -> Optional[str]:
+    """
+    Find a shortest string accepted by only one of two automata.
+
+    Uses the algorithm of Hopcroft and Karp: pairs of subsets of both
+    automata are explored in breadth-first order while a union-find
+    structure merges the subsets assumed equivalent, so no automaton needs
+    to be determinized or minimized first. Symbols not in the alphabet of
+    one automaton are rejected by it.
+
+    Args:
+        automaton1: First automaton.
+        automaton2: Second automaton.
+
+    Returns:
+        Shortest distinguishing string, or ``None`` if both automata
+        accept the same language.
+
+    """
+    dfa1 = LazyDFA(automaton1)
+    dfa2 = LazyDFA(automaton2)
+    symbols = sorted(set(automaton1.symbols) | set(automaton2.symbols))
+
+    sets = _UnionFind()
+    pending: Deque[Tuple[StateSet, StateSet, str]] = deque(
+        [(dfa1.initial, dfa2.initial, "")],
+    )
+    while pending:
+        states1, states2, string = pending.popleft()
+        node1, node2 = (1, states1), (2, states2)
+        if sets.find(node1) == sets.find(node2):
+            continue
+
+        if dfa1.is_final(states1) != dfa2.is_final(states2):
+            return string
+
+        sets.union(node1, node2)
+        for symbol in symbols:
+            pending.append((
+                dfa1.step(states1, symbol),
+                dfa2.step(states2, symbol),
+                string + symbol,
+            ))
+
+    return None
+
+
+def equivalent(
+    automaton1: aut.FiniteAutomaton,
+    automaton2: aut.FiniteAutomaton,
+) -> bool:
+    """
+    Check if two automata accept the same language.
+
+    See :func:`distinguishing_string`.
+
+    """
+    return distinguishing_string(automaton1, automaton2) is None
@@ -0,0 +1,98 @@
+"""Language inclusion of automata."""
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+import automata.automaton as aut
+from automata.lazy_dfa import LazyDFA, StateSet
+
+
+def _insert_antichain(antichain: List[StateSet], states: StateSet) -> bool:
+    """
+    Insert a set of states in an antichain of minimal sets.
+
+    Returns:
+        ``False`` if the set is subsumed by (is a superset of) one of the
+        antichain, ``True`` if it was inserted.
+
+    """
+    if any(other <= states for other in antichain):
+        return False
+
+    antichain[:] = [other for other in antichain if not states <= other]
+    antichain.append(states)
+    return True
+
+
+def inclusion_counterexample(
+    automaton1: aut.FiniteAutomaton,
+    automaton2: aut.FiniteAutomaton,
+) -> Optional[str]:
+    """
+    Find a string accepted by the first automaton but not by the second.
+
+    The first automaton is explored state by state, while the second one
+    is determinized on demand. Pairs are pruned with an antichain: a pair
+    ``(p, S)`` is not explored if a pair ``(p, S')`` with ``S'`` a subset
+    of ``S`` was already found, as any string rejected from ``S`` is also
+    rejected from ``S'``. This usually avoids building the full powerset
+    of the second automaton.
+
+    Args:
+        automaton1: Automaton whose language should be included.
+        automaton2: Automaton whose language should include the other.
+
+    Returns:
+        A string in the language of the first automaton but not in the
+        language of the second, or ``None`` if the first language is
+        included in the second.
+
+    """
+    dfa2 = LazyDFA(automaton2)
+    index1 = automaton1.transition_index()
+    live1 = automaton1.co_accessible_states()
+    symbols = sorted(automaton1.symbols)
+
+    antichains: Dict[aut.State, List[StateSet]] = {}
+    pending: Deque[Tuple[aut.State, StateSet, str]] = deque()
+
+    def add(state: aut.State, states2: StateSet, string: str) -> None:
+        if state in live1 and _insert_antichain(
+            antichains.setdefault(state, []),
+            states2,
+        ):
+            pending.append((state, states2, string))
+
+    for state in automaton1.get_closure({automaton1.initial_state}):
+        add(state, dfa2.initial, "")
+
+    while pending:
+        state, states2, string = pending.popleft()
+        if states2 not in antichains[state]:
+            continue
+
+        if state.is_final and not dfa2.is_final(states2):
+            return string
+
+        for symbol in symbols:
+            next_states = automaton1.get_closure(
+                set(index1.get(state, {}).get(symbol, ())),
+            )
+            if next_states:
+                next_states2 = dfa2.step(states2, symbol)
+                for next_state in next_states:
+                    add(next_state, next_states2, string + symbol)
+
+    return None
+
+
+def is_included(
+    automaton1: aut.FiniteAutomaton,
+    automaton2: aut.FiniteAutomaton,
+) -> bool:
+    """
+    Check if the language of an automaton is included in another one.
+
+    See :func:`inclusion_counterexample`.
+
+    """
+    return inclusion_counterexample(automaton1, automaton2) is None
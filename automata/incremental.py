@@ -0,0 +1,292 @@
+"""Incremental minimization of deterministic automata."""
+from typing import Collection, Dict, List, Optional, Set, Tuple
+
+import automata.automaton as aut
+from automata.csr import refine_partition
+from automata.utils import is_deterministic
+
+
+class AutomatonDelta():
+    """
+    Changes to apply to a deterministic automaton.
+
+    States are referred to by name.
+
+    Args:
+        states: New states to add. Their transitions must be given in
+            ``transitions``.
+        transitions: Triples ``(state, symbol, next_state)`` that add a
+            transition or replace the existing one for the same state and
+            symbol.
+        final_flips: States whose finality is inverted.
+
+    """
+
+    states: Tuple[aut.State, ...]
+    transitions: Tuple[Tuple[str, str, str], ...]
+    final_flips: Tuple[str, ...]
+
+    def __init__(
+        self,
+        *,
+        states: Collection[aut.State] = (),
+        transitions: Collection[Tuple[str, str, str]] = (),
+        final_flips: Collection[str] = (),
+    ) -> None:
+        self.states = tuple(states)
+        self.transitions = tuple(transitions)
+        self.final_flips = tuple(final_flips)
+
+
+class _DeltaTable():
+    """Complete transition table of a deterministic automaton plus delta."""
+
+    def __init__(
+        self,
+        automaton: aut.FiniteAutomaton,
+        delta: AutomatonDelta,
+    ) -> None:
+        if not is_deterministic(automaton):
+            raise ValueError("Automaton is not deterministic")
+
+        self.symbols = automaton.symbols
+        symbol_ids = {s: i for i, s in enumerate(self.symbols)}
+        self.names = [s.name for s in automaton.states]
+        self.names += [s.name for s in delta.states]
+        self.ids = {name: i for i, name in enumerate(self.names)}
+        if len(self.ids) != len(self.names):
+            raise ValueError("There are repeated states")
+
+        self.finals = [s.is_final for s in automaton.states]
+        self.finals += [s.is_final for s in delta.states]
+        self.rows: List[List[int]] = [
+            [-1] * len(self.symbols) for _ in self.names
+        ]
+        for t in automaton.transitions:
+            self.rows[self.ids[t.initial_state.name]][
+                symbol_ids[t.symbol]  # type: ignore[index]
+            ] = self.ids[t.final_state.name]
+
+        self.changed: Set[int] = {
+            self.ids[s.name] for s in delta.states
+        }
+        try:
+            for name in delta.final_flips:
+                state = self.ids[name]
+                self.finals[state] = not self.finals[state]
+                self.changed.add(state)
+
+            for source_name, symbol, target_name in delta.transitions:
+                source = self.ids[source_name]
+                self.rows[source][symbol_ids[symbol]] = self.ids[target_name]
+                self.changed.add(source)
+        except KeyError as e:
+            raise ValueError(f"Unknown state or symbol {e}") from None
+
+        for state, row in enumerate(self.rows):
+            if -1 in row:
+                raise ValueError(
+                    f"State {self.names[state]} has no transition with "
+                    f"symbol {self.symbols[row.index(-1)]}",
+                )
+
+        self.initial = self.ids[automaton.initial_state.name]
+
+    def reachable(self) -> Set[int]:
+        """Return the states reachable from the initial one."""
+        visited = {self.initial}
+        stack = [self.initial]
+        while stack:
+            for target in self.rows[stack.pop()]:
+                if target not in visited:
+                    visited.add(target)
+                    stack.append(target)
+
+        return visited
+
+    def affected(self, reachable: Set[int]) -> Set[int]:
+        """Return the reachable states that can reach a changed state."""
+        predecessors: Dict[int, Set[int]] = {}
+        for state in reachable:
+            for target in self.rows[state]:
+                predecessors.setdefault(target, set()).add(state)
+
+        visited = self.changed & reachable
+        stack = list(visited)
+        while stack:
+            for source in predecessors.get(stack.pop(), ()):
+                if source not in visited:
+                    visited.add(source)
+                    stack.append(source)
+
+        return visited
+
+
+def _match_unaffected(
+    table: _DeltaTable,
+    state: int,
+    candidate: int,
+    affected: Set[int],
+) -> Optional[Dict[int, int]]:
+    """
+    Check if an affected state is equivalent to an unaffected one.
+
+    Unaffected states are pairwise distinguishable and closed under
+    transitions, so each affected state can only match one of them and
+    the check only explores affected states.
+
+    Returns:
+        Mapping from the affected states explored to their equivalent
+        unaffected states, or ``None`` if they are not equivalent.
+
+    """
+    assumed: Dict[int, int] = {}
+    pending = [(state, candidate)]
+    while pending:
+        state, candidate = pending.pop()
+        if state not in affected:
+            if state != candidate:
+                return None
+            continue
+
+        previous = assumed.get(state)
+        if previous is not None:
+            if previous != candidate:
+                return None
+            continue
+
+        if table.finals[state] != table.finals[candidate]:
+            return None
+
+        assumed[state] = candidate
+        pending.extend(zip(table.rows[state], table.rows[candidate]))
+
+    return assumed
+
+
+def update_minimized(
+    automaton: aut.FiniteAutomaton,
+    delta: AutomatonDelta,
+    *,
+    max_affected_ratio: float = 0.25,
+) -> aut.FiniteAutomaton:
+    """
+    Minimize a minimal automaton after applying some changes.
+
+    Only the states that can reach a changed state need to be
+    reclassified, as the rest keep their (pairwise different) languages.
+    If those states are more than ``max_affected_ratio`` of the reachable
+    states, the whole automaton is minimized again.
+
+    Unchanged states keep their names. The rest are named after one of
+    the states of their equivalence class.
+
+    Args:
+        automaton: Minimal complete deterministic automaton, such as the
+            result of :meth:`~automata.automaton.FiniteAutomaton.to_minimized`.
+        delta: Changes to apply.
+        max_affected_ratio: Fraction of affected states above which the
+            automaton is minimized from scratch.
+
+    Returns:
+        Minimal automaton with the changes applied.
+
+    """
+    table = _DeltaTable(automaton, delta)
+    reachable = table.reachable()
+    affected = table.affected(reachable)
+    if len(affected) > max_affected_ratio * len(reachable):
+        affected = reachable
+
+    classes: Dict[int, int] = {s: s for s in reachable - affected}
+
+    if len(affected) < len(reachable):
+        predecessors: Dict[Tuple[int, int], Set[int]] = {}
+        for state in classes:
+            for symbol_id, target in enumerate(table.rows[state]):
+                predecessors.setdefault((symbol_id, target), set()).add(state)
+
+        for state in sorted(affected):
+            if state in classes:
+                continue
+
+            candidates: Optional[Set[int]] = None
+            for symbol_id, target in enumerate(table.rows[state]):
+                target = classes.get(target, target)
+                if target in affected:
+                    continue
+                sources = predecessors.get((symbol_id, target), set())
+                candidates = (
+                    sources if candidates is None else candidates & sources
+                )
+            if candidates is None:
+                candidates = {
+                    s for s in reachable - affected
+                    if table.finals[s] == table.finals[state]
+                }
+
+            for candidate in sorted(candidates):
+                matched = _match_unaffected(table, state, candidate, affected)
+                if matched is not None:
+                    classes.update(matched)
+                    break
+
+    # Classes of the remaining states get ids after the state indexes,
+    # which are used as the ids of the unaffected classes. These classes
+    # are fixed: each one is refined as a single state with its own class,
+    # which can't be split nor merged with the others.
+    offset = len(table.names)
+    remaining = sorted(affected - set(classes))
+    local = {state: i for i, state in enumerate(remaining)}
+    fixed: Dict[int, int] = {}
+    rows: List[List[int]] = []
+    for state in remaining:
+        row = []
+        for target in table.rows[state]:
+            if target in local:
+                row.append(local[target])
+            else:
+                row.append(fixed.setdefault(
+                    classes[target],
+                    len(remaining) + len(fixed),
+                ))
+        rows.append(row)
+    rows.extend([i] * len(table.symbols) for i in fixed.values())
+
+    refined = refine_partition(
+        [int(table.finals[s]) for s in remaining]
+        + [2 + i for i in range(len(fixed))],
+        rows,
+    )
+    classes.update(
+        (state, offset + refined[i]) for i, state in enumerate(remaining)
+    )
+
+    members: Dict[int, List[int]] = {}
+    for state in sorted(reachable):
+        members.setdefault(classes[state], []).append(state)
+
+    new_states = {
+        class_id: aut.State(
+            table.names[class_id] if class_id < offset
+            else min(table.names[s] for s in states),
+            is_final=table.finals[states[0]],
+        )
+        for class_id, states in members.items()
+    }
+    transitions = [
+        aut.Transition(
+            new_states[class_id],
+            table.symbols[symbol_id],
+            new_states[classes[target]],
+        )
+        for class_id, states in members.items()
+        for symbol_id, target in enumerate(table.rows[states[0]])
+    ]
+
+    return aut.FiniteAutomaton(
+        initial_state=new_states[classes[table.initial]],
+        states=dict.fromkeys(new_states.values()),
+        symbols=table.symbols,
+        transitions=transitions,
+    )
@@ -0,0 +1,146 @@
+"""Evaluation of strings that are edited over time."""
+from bisect import bisect_left, bisect_right
+from typing import List
+
+import automata.automaton as aut
+from automata.lazy_dfa import LazyDFA, StateSet
+
+
+class IncrementalEvaluator():
+    """
+    Evaluator of a text that is re-evaluated after each edit.
+
+    The sets of states reached at some positions of the text (checkpoints)
+    are kept, at most ``checkpoint_interval`` symbols apart. After an
+    edit, the evaluation resumes from the last checkpoint before it, and
+    stops as soon as the set of states after the edit is the same as in
+    the previous evaluation at the same (shifted) checkpoint, as the rest
+    of the evaluation would not change. Sets of states come from a
+    :class:`~automata.lazy_dfa.LazyDFA`, so checkpoints share them.
+
+    Args:
+        automaton: Automaton to evaluate.
+        checkpoint_interval: Maximum number of symbols between
+            checkpoints. Smaller intervals use more memory, but edits
+            converge sooner.
+
+    Attributes:
+        last_steps: Number of symbols processed in the last update.
+
+    """
+
+    def __init__(
+        self,
+        automaton: aut.FiniteAutomaton,
+        checkpoint_interval: int = 64,
+    ) -> None:
+        if checkpoint_interval < 1:
+            raise ValueError("The checkpoint interval must be positive")
+
+        self.automaton = automaton
+        self.checkpoint_interval = checkpoint_interval
+        self._dfa = LazyDFA(automaton)
+        self._text = ""
+        self._positions: List[int] = [0]
+        self._states: List[StateSet] = [self._dfa.initial]
+        self._final: StateSet = self._dfa.initial
+        self.last_steps = 0
+
+    @property
+    def text(self) -> str:
+        """Current text."""
+        return self._text
+
+    @property
+    def n_checkpoints(self) -> int:
+        """Number of checkpoints stored."""
+        return len(self._positions)
+
+    def _check_symbols(self, string: str) -> None:
+        invalid = set(string).difference(self.automaton.symbols)
+        if invalid:
+            symbol = next(s for s in string if s in invalid)
+            raise ValueError(
+                f"Symbol {symbol} is not a valid symbol "
+                f"{self.automaton.symbols}",
+            )
+
+    def set_text(self, text: str) -> None:
+        """Replace the whole text."""
+        self.edit(0, len(self._text), text)
+
+    def edit(self, start: int, end: int, replacement: str = "") -> None:
+        """
+        Replace a slice of the text and update the evaluation.
+
+        Args:
+            start: Start of the replaced slice.
+            end: End of the replaced slice.
+            replacement: New contents of the slice.
+
+        """
+        if not 0 <= start <= end <= len(self._text):
+            raise ValueError(f"Invalid slice {start}:{end} of the text")
+        self._check_symbols(replacement)
+
+        old_positions, old_states = self._positions, self._states
+        text = self._text[:start] + replacement + self._text[end:]
+        shift = len(replacement) - (end - start)
+        edit_end = start + len(replacement)
+
+        k = bisect_right(old_positions, start) - 1
+        positions, states_list = old_positions[:k + 1], old_states[:k + 1]
+        position, states = positions[-1], states_list[-1]
+        # Next old checkpoint that may be reached again after the edit
+        j = bisect_left(old_positions, end)
+        steps = 0
+
+        while True:
+            if position >= edit_end:
+                while (
+                    j < len(old_positions)
+                    and old_positions[j] + shift < position
+                ):
+                    j += 1
+                if (
+                    j < len(old_positions)
+                    and old_positions[j] + shift == position
+                    and old_states[j] == states
+                ):
+                    # Converged: the rest of the evaluation is the same
+                    if positions[-1] == position:
+                        positions.pop()
+                        states_list.pop()
+                    positions += [p + shift for p in old_positions[j:]]
+                    states_list += old_states[j:]
+                    final = self._final
+                    break
+
+            if position == len(text):
+                final = states
+                break
+
+            states = self._dfa.step(states, text[position])
+            position += 1
+            steps += 1
+            if position - positions[-1] >= self.checkpoint_interval:
+                positions.append(position)
+                states_list.append(states)
+
+        self._text = text
+        self._positions = positions
+        self._states = states_list
+        self._final = final
+        self.last_steps = steps
+
+    def insert(self, position: int, string: str) -> None:
+        """Insert a string at a position of the text."""
+        self.edit(position, position, string)
+
+    def delete(self, start: int, end: int) -> None:
+        """Delete a slice of the text."""
+        self.edit(start, end)
+
+    def is_accepting(self) -> bool:
+        """Return if the current text is accepted."""
+        return self._dfa.is_final(self._final)
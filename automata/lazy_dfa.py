@@ -0,0 +1,74 @@
+"""Deterministic view of an automaton built on demand."""
+from typing import Dict, FrozenSet, Tuple
+
+import automata.automaton as aut
+
+StateSet = FrozenSet[aut.State]
+
+
+class LazyDFA():
+    """
+    Subset construction of an automaton computed only when needed.
+
+    Each deterministic state is the frozen set of states of the original
+    automaton (closed under lambda transitions). Transitions are computed
+    on first use and cached.
+
+    Symbols not in the alphabet of the automaton lead to the empty set
+    instead of raising an error, so automata over different alphabets can
+    be explored together.
+
+    Args:
+        automaton: Automaton to determinize.
+
+    Attributes:
+        initial: Initial set of states.
+
+    """
+
+    automaton: aut.FiniteAutomaton
+    initial: StateSet
+
+    def __init__(self, automaton: aut.FiniteAutomaton) -> None:
+        self.automaton = automaton
+        self.initial = frozenset(
+            automaton.get_closure({automaton.initial_state}),
+        )
+        self._transitions: Dict[Tuple[StateSet, str], StateSet] = {}
+
+    def step(self, states: StateSet, symbol: str) -> StateSet:
+        """
+        Return the set of states reached with a symbol.
+
+        Args:
+            states: Current set of states.
+            symbol: Symbol to consume.
+
+        Returns:
+            Next set of states, closed under lambda transitions.
+
+        """
+        key = (states, symbol)
+        next_states = self._transitions.get(key)
+        if next_states is None:
+            index = self.automaton.transition_index()
+            reached = set()
+            for state in states:
+                reached.update(index.get(state, {}).get(symbol, ()))
+
+            next_states = frozenset(self.automaton.get_closure(reached))
+            self._transitions[key] = next_states
+
+        return next_states
+
+    def step_string(self, states: StateSet, string: str) -> StateSet:
+        """Return the set of states reached with a string."""
+        for symbol in string:
+            states = self.step(states, symbol)
+
+        return states
+
+    @staticmethod
+    def is_final(states: StateSet) -> bool:
+        """Check if a set of states is accepting."""
+        return any(state.is_final for state in states)
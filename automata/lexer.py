@@ -0,0 +1,167 @@
+"""Lexical analysis with automata."""
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Sequence,
+    TextIO,
+    Tuple,
+)
+
+from automata.multi_pattern import TaggedDFA
+from automata.re_parser import REParser
+
+
+class LexerError(Exception):
+    """Exception for inputs that can't be split in tokens."""
+
+    def __init__(self, position: int) -> None:
+        super().__init__(f"No token matches at position {position}")
+        self.position = position
+
+
+class Token(NamedTuple):
+    """Token found by a :class:`Lexer`."""
+
+    kind: str
+    text: str
+    position: int
+
+
+class Lexer():
+    """
+    Lexer defined by a list of token kinds and regular expressions.
+
+    All the rules are compiled into a single :class:`TaggedDFA`. At each
+    position, the longest nonempty match of any rule is taken (maximal
+    munch), and ties are broken in favor of the first rule of the list.
+    Each character is read once per token attempt, with no backtracking
+    over the rules, and an attempt reaching a position and state already
+    visited by a previous one reuses its result instead of reading the
+    text again, so tokenizing is linear in the length of the text.
+
+    Args:
+        rules: Pairs of token kind and regular expression, by priority.
+
+    """
+
+    def __init__(self, rules: Sequence[Tuple[str, str]]) -> None:
+        self.kinds = tuple(kind for kind, _ in rules)
+        self.dfa = TaggedDFA([
+            REParser().create_automaton(regex) for _, regex in rules
+        ])
+        self._rule_of_state: List[int] = [
+            min(tags) if tags else -1 for tags in self.dfa.tags
+        ]
+
+    def tokenize(self, text: str) -> Iterator[Token]:
+        """
+        Split a text in tokens.
+
+        Args:
+            text: Text to split.
+
+        Yields:
+            Tokens, lazily.
+
+        Raises:
+            LexerError: If no rule matches at some position.
+
+        """
+        return self._tokenize([text])
+
+    def tokenize_file(
+        self,
+        fp: TextIO,
+        chunk_size: int = 64 * 1024,
+    ) -> Iterator[Token]:
+        """
+        Split the contents of a file in tokens, reading it in chunks.
+
+        Only the chunks containing the current token are kept in memory.
+
+        Args:
+            fp: Text file object.
+            chunk_size: Number of characters read at once.
+
+        Yields:
+            Tokens, lazily.
+
+        Raises:
+            LexerError: If no rule matches at some position.
+
+        """
+        return self._tokenize(iter(lambda: fp.read(chunk_size), ""))
+
+    def _tokenize(self, chunks: Iterable[str]) -> Iterator[Token]:
+        dfa = self.dfa
+        table, dead, symbol_ids = dfa.table, dfa.dead, dfa.symbol_ids
+        rule_of_state = self._rule_of_state
+        chunk_iterator = iter(chunks)
+
+        buffer = ""
+        base = 0  # Position of the start of the buffer in the input
+        position = 0  # Start of the next token in the buffer
+        exhausted = False
+
+        # Furthest token end and its rule (or -1) reachable from each
+        # pair of input position and state already visited
+        ends: Dict[Tuple[int, int], Tuple[int, int]] = {}
+
+        while True:
+            state = dfa.initial
+            i = position
+            path = []
+            end = -1
+            rule = -1
+
+            while True:
+                if i == len(buffer):
+                    chunk = None if exhausted else next(chunk_iterator, None)
+                    if chunk is None:
+                        exhausted = True
+                        break
+
+                    # Drop the tokens already yielded
+                    buffer = buffer[position:] + chunk
+                    base += position
+                    i -= position
+                    position = 0
+                    ends = {k: v for k, v in ends.items() if k[0] > base}
+                    continue
+
+                symbol_id = symbol_ids.get(buffer[i])
+                if symbol_id is None:
+                    break
+
+                state = table[state][symbol_id]
+                if dead[state]:
+                    break
+
+                i += 1
+                key = (base + i, state)
+                known = ends.get(key)
+                if known is not None:
+                    end, rule = known
+                    break
+                path.append(key)
+
+            for key in reversed(path):
+                if end == -1 and rule_of_state[key[1]] != -1:
+                    end, rule = key[0], rule_of_state[key[1]]
+                ends[key] = (end, rule)
+
+            if rule == -1:
+                if exhausted and position == len(buffer):
+                    return
+                raise LexerError(base + position)
+
+            end -= base
+            yield Token(
+                self.kinds[rule],
+                buffer[position:end],
+                base + position,
+            )
+            position = end
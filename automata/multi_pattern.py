@@ -0,0 +1,181 @@
+"""Matching of many regular expressions at once."""
+from typing import Dict, FrozenSet, List, Sequence, Set, Tuple
+
+import automata.automaton as aut
+from automata.csr import CSRAutomaton, refine_partition
+from automata.re_parser import REParser
+
+
+def _union(
+    automata: Sequence[aut.FiniteAutomaton],
+) -> Tuple[aut.FiniteAutomaton, List[int]]:
+    """
+    Union of automata, with the pattern of each state.
+
+    Returns:
+        The union, whose initial state has lambda transitions to the
+        initial states of the automata, and the index of the pattern of
+        each of its states (``-1`` for the initial state), in order.
+
+    """
+    initial_state = aut.State("start")
+    states = [initial_state]
+    patterns = [-1]
+    symbols: Set[str] = set()
+    transitions = []
+
+    for i, automaton in enumerate(automata):
+        renamed = {
+            state: aut.State(f"p{i}_{state.name}", is_final=state.is_final)
+            for state in automaton.states
+        }
+        states.extend(renamed.values())
+        patterns.extend(i for _ in renamed)
+        symbols.update(automaton.symbols)
+        transitions.append(aut.Transition(
+            initial_state,
+            None,
+            renamed[automaton.initial_state],
+        ))
+        transitions.extend(
+            aut.Transition(
+                renamed[t.initial_state],
+                t.symbol,
+                renamed[t.final_state],
+            )
+            for t in automaton.transitions
+        )
+
+    return aut.FiniteAutomaton(
+        initial_state=initial_state,
+        states=dict.fromkeys(states),
+        symbols=sorted(symbols),
+        transitions=transitions,
+    ), patterns
+
+
+class TaggedDFA():
+    """
+    Minimal deterministic automaton of several patterns.
+
+    Each state is tagged with the set of patterns whose language contains
+    the strings that lead to it.
+
+    The union of the patterns is determinized with the subset
+    construction, tagging each subset with the patterns of its final
+    states, and minimized starting from the partition of the states by
+    their tags, so states accepting different sets of patterns are never
+    merged.
+
+    Args:
+        automata: Automaton of each pattern. Patterns are identified by
+            their index.
+
+    Attributes:
+        symbols: Symbols of the patterns.
+        symbol_ids: Index of each symbol.
+        initial: Index of the initial state.
+        table: Next state of each state, by symbol index.
+        tags: Patterns accepted in each state.
+        dead: ``1`` for the states from which no pattern can be accepted.
+
+    """
+
+    def __init__(self, automata: Sequence[aut.FiniteAutomaton]) -> None:
+        union, patterns = _union(automata)
+        nfa = CSRAutomaton.from_automaton(union)
+        subsets, subset_rows = nfa.subset_table()
+        subset_tags = [
+            frozenset(patterns[s] for s in subset if nfa.finals[s])
+            for subset in subsets
+        ]
+
+        tag_ids: Dict[FrozenSet[int], int] = {}
+        classes = refine_partition(
+            [tag_ids.setdefault(t, len(tag_ids)) for t in subset_tags],
+            subset_rows,
+        )
+        n_classes = len(set(classes))
+
+        rows: List[List[int]] = [[] for _ in range(n_classes)]
+        tags: List[FrozenSet[int]] = [frozenset()] * n_classes
+        for subset, class_id in enumerate(classes):
+            if not rows[class_id]:
+                rows[class_id] = [classes[t] for t in subset_rows[subset]]
+                tags[class_id] = subset_tags[subset]
+
+        self.symbols = nfa.symbols
+        self.symbol_ids = {s: i for i, s in enumerate(self.symbols)}
+        self.initial = classes[0]
+        self.table = rows
+        self.tags = tuple(tags)
+
+        live = {s for s, t in enumerate(self.tags) if t}
+        pending = list(live)
+        reverse: List[List[int]] = [[] for _ in rows]
+        for state, row in enumerate(rows):
+            for target in row:
+                reverse[target].append(state)
+        while pending:
+            for source in reverse[pending.pop()]:
+                if source not in live:
+                    live.add(source)
+                    pending.append(source)
+        self.dead = bytearray(s not in live for s in range(len(rows)))
+
+    @property
+    def n_states(self) -> int:
+        """Number of states."""
+        return len(self.table)
+
+    def symbol_id(self, symbol: str) -> int:
+        """Return the index of a symbol, checking that it is valid."""
+        symbol_id = self.symbol_ids.get(symbol)
+        if symbol_id is None:
+            raise ValueError(
+                f"Symbol {symbol} is not a valid symbol {self.symbols}",
+            )
+        return symbol_id
+
+
+class MultiPatternMatcher():
+    """
+    Matcher of a string against several regular expressions at once.
+
+    The regular expressions are compiled into a single
+    :class:`TaggedDFA`, so a string is processed in one pass regardless of
+    the number of patterns.
+
+    Args:
+        regexes: Regular expressions, identified by their index.
+
+    """
+
+    def __init__(self, regexes: Sequence[str]) -> None:
+        self.regexes = tuple(regexes)
+        self.dfa = TaggedDFA([
+            REParser().create_automaton(regex) for regex in self.regexes
+        ])
+
+    def match(self, string: str) -> FrozenSet[int]:
+        """
+        Return the patterns that accept a string.
+
+        Args:
+            string: String to match.
+
+        Returns:
+            Indexes of the regular expressions matching the whole string.
+
+        """
+        dfa = self.dfa
+        table, dead = dfa.table, dfa.dead
+        state = dfa.initial
+        for i, symbol in enumerate(string):
+            state = table[state][dfa.symbol_id(symbol)]
+            if dead[state]:
+                for rest_symbol in string[i + 1:]:
+                    dfa.symbol_id(rest_symbol)
+                return frozenset()
+
+        return dfa.tags[state]
@@ -0,0 +1,178 @@
+"""Parallel evaluation of long strings with deterministic automata."""
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from operator import itemgetter
+from typing import Deque, Dict, Mapping, Optional, Sequence, Tuple
+
+import automata.automaton as aut
+from automata.dense import DenseDFA
+
+# Transition function of a string: the state reached from each state
+TransitionFunction = Tuple[int, ...]
+
+Columns = Mapping[str, Sequence[int]]
+
+# Number of symbols between merges of the states tracked
+_BLOCK = 256
+
+
+def _column(columns: Columns, symbol: str) -> Sequence[int]:
+    try:
+        return columns[symbol]
+    except KeyError:
+        raise ValueError(
+            f"Symbol {symbol} is not a valid symbol {tuple(columns)}",
+        ) from None
+
+
+def dense_columns(dfa: DenseDFA) -> Dict[str, Tuple[int, ...]]:
+    """Return the next state of each state, by symbol."""
+    return {
+        symbol: tuple(row[i] for row in dfa.table)
+        for i, symbol in enumerate(dfa.symbols)
+    }
+
+
+def transition_function(
+    columns: Columns,
+    n_states: int,
+    string: str,
+) -> TransitionFunction:
+    """
+    Compute the state reached with a string from every state.
+
+    The states reached from all the states are advanced together, with a
+    gather (:func:`operator.itemgetter`) on the column of each symbol.
+    Paths that reach the same state are merged periodically, so usually
+    only a few states are tracked.
+
+    Args:
+        columns: Next state of each state, by symbol.
+        n_states: Number of states.
+        string: String to consume.
+
+    Returns:
+        Transition function of the string.
+
+    """
+    distinct: Sequence[int] = range(n_states)
+    origins = list(range(n_states))
+    i = 0
+    while i < len(string) and len(distinct) > 1:
+        block = string[i:i + _BLOCK]
+        for symbol in block:
+            distinct = itemgetter(*distinct)(_column(columns, symbol))
+        i += len(block)
+
+        ids: Dict[int, int] = {}
+        for state in distinct:
+            ids.setdefault(state, len(ids))
+        origins = [ids[distinct[origin]] for origin in origins]
+        distinct = tuple(ids)
+
+    if i < len(string):
+        state = distinct[0]
+        for symbol in string[i:]:
+            state = _column(columns, symbol)[state]
+        distinct = (state,)
+
+    return tuple(distinct[origin] for origin in origins)
+
+
+def compose(
+    first: TransitionFunction,
+    second: TransitionFunction,
+) -> TransitionFunction:
+    """Return the transition function of two consecutive strings."""
+    if len(first) == 1:
+        return (second[first[0]],)
+    return itemgetter(*first)(second)
+
+
+# Table of the automaton in the worker processes
+_worker_columns: Columns = {}
+_worker_n_states = 0
+
+
+def _init_worker(columns: Columns, n_states: int) -> None:
+    global _worker_columns, _worker_n_states
+    _worker_columns = columns
+    _worker_n_states = n_states
+
+
+def _worker_transition_function(string: str) -> TransitionFunction:
+    return transition_function(_worker_columns, _worker_n_states, string)
+
+
+class ParallelEvaluator():
+    """
+    Evaluator splitting long strings in chunks processed in parallel.
+
+    The transition function of each chunk (see :func:`transition_function`)
+    is computed in a process pool without knowing the state at the start
+    of the chunk. Then the functions are applied in order from the initial
+    state. At most two chunks per process are submitted at a time, so only
+    those are copied to the workers while the string is processed.
+    Strings shorter than two chunks are evaluated directly.
+
+    Args:
+        automaton: Deterministic automaton.
+        processes: Maximum number of worker processes. By default, the
+            number of processors.
+        chunk_size: Number of symbols of each chunk.
+
+    """
+
+    def __init__(
+        self,
+        automaton: aut.FiniteAutomaton,
+        *,
+        processes: Optional[int] = None,
+        chunk_size: int = 1 << 20,
+    ) -> None:
+        self.dfa = DenseDFA(automaton)
+        self.processes = processes
+        self.chunk_size = chunk_size
+        self.columns = dense_columns(self.dfa)
+
+    def final_state(self, string: str) -> int:
+        """
+        Return the index of the state reached with a string.
+
+        Args:
+            string: String to consume.
+
+        Returns:
+            Index of the state in the :class:`~automata.dense.DenseDFA`.
+
+        """
+        if len(string) < 2 * self.chunk_size:
+            state = 0
+            for symbol in string:
+                state = _column(self.columns, symbol)[state]
+            return state
+
+        processes = self.processes or os.cpu_count() or 1
+        pending: Deque["Future[TransitionFunction]"] = deque()
+        state = 0
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=_init_worker,
+            initargs=(self.columns, self.dfa.n_states),
+        ) as executor:
+            for i in range(0, len(string), self.chunk_size):
+                if len(pending) >= 2 * processes:
+                    state = pending.popleft().result()[state]
+                pending.append(executor.submit(
+                    _worker_transition_function,
+                    string[i:i + self.chunk_size],
+                ))
+            while pending:
+                state = pending.popleft().result()[state]
+
+        return state
+
+    def accepts(self, string: str) -> bool:
+        """Return if a string is accepted."""
+        return self.final_state(string) in self.dfa.finals
@@ -0,0 +1,214 @@
+"""Literal prefilters to skip text that can't contain a match."""
+from typing import Dict, FrozenSet, Iterator, List, Set, Tuple
+
+import automata.automaton as aut
+from automata.csr import CSRAutomaton
+from automata.re_parser import REParser
+
+
+def _dominators(
+    initial: int,
+    n_states: int,
+    predecessors: List[Set[int]],
+) -> List[Set[int]]:
+    """Dominators of each state (states in every path from the initial)."""
+    all_states = set(range(n_states))
+    dominators = [set(all_states) for _ in range(n_states)]
+    dominators[initial] = {initial}
+
+    changed = True
+    while changed:
+        changed = False
+        for state in range(n_states):
+            if state == initial:
+                continue
+            new = set(all_states)
+            for predecessor in predecessors[state]:
+                new &= dominators[predecessor]
+            new.add(state)
+            if new != dominators[state]:
+                dominators[state] = new
+                changed = True
+
+    return dominators
+
+
+class Prefilter():
+    """
+    Literals required by the strings accepted by an automaton.
+
+    The automaton is determinized, minimized and trimmed. Then:
+
+    - the required prefix is the path followed from the initial state
+      while states are not final and have a single transition;
+    - the required factor is the longest such path around a state that
+      dominates all final states, that is, that appears in every
+      accepting path, extended backwards while all the transitions to a
+      state have the same symbol;
+    - the first symbols are the symbols of the transitions of the initial
+      state.
+
+    These are computed for the language of the automaton, including the
+    empty string, so an automaton accepting it has no required literals.
+
+    If the deterministic automaton would have more than ``max_states``
+    states, the analysis is abandoned, as its cost would exceed the time
+    saved by the prefilter: there are no required literals and the first
+    symbols are those of the transitions leaving the initial states.
+
+    Args:
+        automaton: Automaton to analyze.
+        max_states: Maximum number of states of the deterministic
+            automaton.
+
+    Attributes:
+        prefix: Literal that starts every accepted string.
+        factor: Literal contained in every accepted string.
+        first_symbols: Symbols that can start an accepted string.
+
+    """
+
+    prefix: str
+    factor: str
+    first_symbols: FrozenSet[str]
+
+    def __init__(
+        self,
+        automaton: aut.FiniteAutomaton,
+        *,
+        max_states: int = 256,
+    ) -> None:
+        nfa = CSRAutomaton.from_automaton(automaton)
+        try:
+            dfa = nfa.to_deterministic(
+                max_states=max_states,
+            ).to_minimized().trim()
+        except ValueError:
+            self.prefix = ""
+            self.factor = ""
+            self.first_symbols = frozenset(
+                nfa.symbols[nfa.symbol_ids[i]]
+                for state in nfa.get_closure([nfa.initial])
+                for i in range(nfa.offsets[state], nfa.offsets[state + 1])
+            )
+            self._empty = False
+            return
+
+        successors: List[Dict[str, int]] = [{} for _ in range(dfa.n_states)]
+        predecessors: List[Set[int]] = [set() for _ in range(dfa.n_states)]
+        for state, symbol_id, target in dfa.edges():
+            successors[state][dfa.symbols[symbol_id]] = target
+            predecessors[target].add(state)
+
+        def literal(state: int) -> str:
+            symbols = []
+            visited = {state}
+            while not dfa.finals[state] and len(successors[state]) == 1:
+                (symbol, state), = successors[state].items()
+                if state in visited:
+                    break
+                visited.add(state)
+                symbols.append(symbol)
+            return "".join(symbols)
+
+        def literal_before(state: int) -> str:
+            symbols = []
+            visited = {state}
+            while state != dfa.initial:
+                incoming = {
+                    symbol
+                    for predecessor in predecessors[state]
+                    for symbol, target in successors[predecessor].items()
+                    if target == state
+                }
+                if len(incoming) != 1:
+                    break
+                symbols.append(incoming.pop())
+                if len(predecessors[state]) != 1:
+                    break
+                state, = predecessors[state]
+                if state in visited:
+                    break
+                visited.add(state)
+            return "".join(reversed(symbols))
+
+        finals = [s for s in range(dfa.n_states) if dfa.finals[s]]
+        required: Set[int] = set()
+        if finals:
+            dominators = _dominators(dfa.initial, dfa.n_states, predecessors)
+            required = set.intersection(*(dominators[f] for f in finals))
+
+        self.prefix = literal(dfa.initial) if finals else ""
+        self.factor = max(
+            (literal_before(state) + literal(state) for state in required),
+            key=len,
+            default="",
+        )
+        self.first_symbols = frozenset(successors[dfa.initial])
+        self._empty = not finals
+
+    @classmethod
+    def from_regex(cls, regex: str) -> "Prefilter":
+        """Create the prefilter of a regular expression."""
+        return cls(REParser().create_automaton(regex))
+
+    def may_match(self, text: str) -> bool:
+        """
+        Check if a substring of a text may be accepted.
+
+        Args:
+            text: Text to check.
+
+        Returns:
+            ``False`` if no substring of the text can be accepted.
+
+        """
+        return not self._empty and self.factor in text
+
+    def candidates(self, text: str, start: int = 0) -> Iterator[int]:
+        """
+        Find the positions where a nonempty match may start.
+
+        Occurrences of the required prefix are found with :meth:`str.find`.
+        Without a prefix, the positions of the first symbols are found in
+        the same way when there are few of them, and all the positions are
+        returned otherwise.
+
+        Args:
+            text: Text to search.
+            start: Position where the search starts.
+
+        Yields:
+            Candidate positions, in increasing order. Every position where
+            a nonempty match starts is included.
+
+        """
+        if not self.may_match(text):
+            return
+
+        if self.prefix:
+            position = text.find(self.prefix, start)
+            while position != -1:
+                yield position
+                position = text.find(self.prefix, position + 1)
+            return
+
+        if len(self.first_symbols) > 4:
+            yield from range(start, len(text))
+            return
+
+        next_positions: List[Tuple[int, str]] = []
+        for symbol in self.first_symbols:
+            position = text.find(symbol, start)
+            if position != -1:
+                next_positions.append((position, symbol))
+
+        while next_positions:
+            next_positions.sort()
+            position, symbol = next_positions[0]
+            yield position
+            following = text.find(symbol, position + 1)
+            if following == -1:
+                next_positions.pop(0)
+            else:
+                next_positions[0] = (following, symbol)
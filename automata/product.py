@@ -0,0 +1,303 @@
+"""Product constructions of automata."""
+from collections import deque
+from typing import Callable, Collection, Deque, Dict, Optional, Tuple
+
+import automata.automaton as aut
+from automata.lazy_dfa import LazyDFA, StateSet
+
+# For each operation, whether a pair is accepting given the acceptance of
+# each component, and whether a pair can still become accepting given
+# which components can still reach a final state.
+_Operation = Tuple[Callable[[bool, bool], bool], Callable[[bool, bool], bool]]
+
+_OPERATIONS: Dict[str, _Operation] = {
+    "intersection": (
+        lambda final1, final2: final1 and final2,
+        lambda live1, live2: live1 and live2,
+    ),
+    "difference": (
+        lambda final1, final2: final1 and not final2,
+        lambda live1, live2: live1,
+    ),
+    "symmetric_difference": (
+        lambda final1, final2: final1 != final2,
+        lambda live1, live2: live1 or live2,
+    ),
+}
+
+
+def _get_operation(operation: str) -> _Operation:
+    try:
+        return _OPERATIONS[operation]
+    except KeyError:
+        raise ValueError(
+            f"Unknown operation {operation}, "
+            f"expected one of {tuple(_OPERATIONS)}",
+        ) from None
+
+
+def _is_live(automaton: aut.FiniteAutomaton, states: StateSet) -> bool:
+    return not automaton.co_accessible_states().isdisjoint(states)
+
+
+def product(
+    automaton1: aut.FiniteAutomaton,
+    automaton2: aut.FiniteAutomaton,
+    operation: str,
+) -> aut.FiniteAutomaton:
+    """
+    Build the product of two automata.
+
+    Only the pairs of (determinized) states reachable from the initial
+    pair are built. All pairs that can no longer be accepted are merged in
+    a single ``empty`` state.
+
+    Args:
+        automaton1: First automaton.
+        automaton2: Second automaton.
+        operation: One of ``"intersection"``, ``"difference"`` or
+            ``"symmetric_difference"``.
+
+    Returns:
+        Deterministic automaton over the union of both alphabets.
+
+    """
+    accept, alive = _get_operation(operation)
+    dfa1 = LazyDFA(automaton1)
+    dfa2 = LazyDFA(automaton2)
+    symbols = sorted(set(automaton1.symbols) | set(automaton2.symbols))
+
+    def is_alive(pair: Tuple[StateSet, StateSet]) -> bool:
+        return alive(
+            _is_live(automaton1, pair[0]),
+            _is_live(automaton2, pair[1]),
+        )
+
+    states: Dict[Optional[Tuple[StateSet, StateSet]], aut.State] = {}
+
+    def get_state(pair: Optional[Tuple[StateSet, StateSet]]) -> aut.State:
+        state = states.get(pair)
+        if state is None:
+            if pair is None:
+                state = aut.State("empty")
+            else:
+                state = aut.State(
+                    f"q{len(states)}",
+                    is_final=accept(dfa1.is_final(pair[0]), dfa2.is_final(pair[1])),
+                )
+            states[pair] = state
+            pending.append(pair)
+
+        return state
+
+    pending: Deque[Optional[Tuple[StateSet, StateSet]]] = deque()
+    initial_pair = (dfa1.initial, dfa2.initial)
+    initial_state = get_state(initial_pair if is_alive(initial_pair) else None)
+    transitions = []
+
+    while pending:
+        pair = pending.popleft()
+        state = states[pair]
+        for symbol in symbols:
+            if pair is None:
+                next_pair = None
+            else:
+                next_pair = (
+                    dfa1.step(pair[0], symbol),
+                    dfa2.step(pair[1], symbol),
+                )
+                if not is_alive(next_pair):
+                    next_pair = None
+
+            transitions.append(aut.Transition(
+                state,
+                symbol,
+                get_state(next_pair),
+            ))
+
+    return aut.FiniteAutomaton(
+        initial_state=initial_state,
+        states=dict.fromkeys(states.values()),
+        symbols=symbols,
+        transitions=transitions,
+    )
+
+
+def intersection(
+    automaton1: aut.FiniteAutomaton,
+    automaton2: aut.FiniteAutomaton,
+) -> aut.FiniteAutomaton:
+    """Build an automaton accepting the strings accepted by both."""
+    return product(automaton1, automaton2, "intersection")
+
+
+def difference(
+    automaton1: aut.FiniteAutomaton,
+    automaton2: aut.FiniteAutomaton,
+) -> aut.FiniteAutomaton:
+    """Build an automaton accepting the strings accepted only by the first."""
+    return product(automaton1, automaton2, "difference")
+
+
+def symmetric_difference(
+    automaton1: aut.FiniteAutomaton,
+    automaton2: aut.FiniteAutomaton,
+) -> aut.FiniteAutomaton:
+    """Build an automaton accepting the strings accepted by only one."""
+    return product(automaton1, automaton2, "symmetric_difference")
+
+
+def complement(
+    automaton: aut.FiniteAutomaton,
+    symbols: Optional[Collection[str]] = None,
+) -> aut.FiniteAutomaton:
+    """
+    Build an automaton accepting the strings rejected by another.
+
+    The automaton is determinized from its initial state only as far as
+    needed, and the sink state is only added if some transition is
+    missing.
+
+    Args:
+        automaton: Automaton to complement.
+        symbols: Alphabet of the complement. By default, the alphabet of
+            the automaton.
+
+    Returns:
+        Complete deterministic automaton of the complement.
+
+    """
+    dfa = LazyDFA(automaton)
+    alphabet = tuple(automaton.symbols if symbols is None else symbols)
+
+    states: Dict[StateSet, aut.State] = {}
+    pending: Deque[StateSet] = deque()
+
+    def get_state(subset: StateSet) -> aut.State:
+        state = states.get(subset)
+        if state is None:
+            state = aut.State(
+                automaton.state_from_state_set(set(subset)).name,
+                is_final=not dfa.is_final(subset),
+            )
+            states[subset] = state
+            pending.append(subset)
+
+        return state
+
+    initial_state = get_state(dfa.initial)
+    transitions = []
+    while pending:
+        subset = pending.popleft()
+        for symbol in alphabet:
+            transitions.append(aut.Transition(
+                states[subset],
+                symbol,
+                get_state(dfa.step(subset, symbol)),
+            ))
+
+    return aut.FiniteAutomaton(
+        initial_state=initial_state,
+        states=dict.fromkeys(states.values()),
+        symbols=alphabet,
+        transitions=transitions,
+    )
+
+
+class ProductEvaluator():
+    """
+    Evaluator of the product of two automata without building it.
+
+    Both automata are run in lockstep over lazily determinized states.
+    Processing of a string stops as soon as the pair can no longer be
+    accepted (for example, when one side of an intersection is dead).
+
+    Args:
+        automaton1: First automaton.
+        automaton2: Second automaton.
+        operation: One of ``"intersection"``, ``"difference"`` or
+            ``"symmetric_difference"``.
+
+    Attributes:
+        current_states: Pair of current sets of states.
+
+    """
+
+    current_states: Tuple[StateSet, StateSet]
+
+    def __init__(
+        self,
+        automaton1: aut.FiniteAutomaton,
+        automaton2: aut.FiniteAutomaton,
+        operation: str = "intersection",
+    ) -> None:
+        self._accept, self._alive = _get_operation(operation)
+        self.automaton1 = automaton1
+        self.automaton2 = automaton2
+        self.symbols = frozenset(automaton1.symbols) | frozenset(
+            automaton2.symbols,
+        )
+        self._dfa1 = LazyDFA(automaton1)
+        self._dfa2 = LazyDFA(automaton2)
+        self.current_states = (self._dfa1.initial, self._dfa2.initial)
+
+    def _check_symbol(self, symbol: str) -> None:
+        if symbol not in self.symbols:
+            raise ValueError(
+                f"Symbol {symbol} is not a valid symbol {tuple(self.symbols)}",
+            )
+
+    def _is_alive(self) -> bool:
+        return self._alive(
+            _is_live(self.automaton1, self.current_states[0]),
+            _is_live(self.automaton2, self.current_states[1]),
+        )
+
+    def process_symbol(self, symbol: str) -> None:
+        """
+        Process one symbol.
+
+        Args:
+            symbol: Symbol to consume.
+
+        """
+        self._check_symbol(symbol)
+        states1, states2 = self.current_states
+        self.current_states = (
+            self._dfa1.step(states1, symbol),
+            self._dfa2.step(states2, symbol),
+        )
+
+    def process_string(self, string: str) -> None:
+        """
+        Process a full string of symbols.
+
+        Args:
+            string: String to process.
+
+        """
+        for i, symbol in enumerate(string):
+            if not self._is_alive():
+                for symbol in string[i:]:
+                    self._check_symbol(symbol)
+                return
+            self.process_symbol(symbol)
+
+    def is_accepting(self) -> bool:
+        """Check if the current pair is an accepting one."""
+        states1, states2 = self.current_states
+        return self._accept(
+            self._dfa1.is_final(states1),
+            self._dfa2.is_final(states2),
+        )
+
+    def accepts(self, string: str) -> bool:
+        """Return if a string is accepted without changing state."""
+        old_states = self.current_states
+        try:
+            self.process_string(string)
+            accepted = self.is_accepting()
+        finally:
+            self.current_states = old_states
+
+        return accepted
@@ -0,0 +1,107 @@
+"""Rendering of automata images with Graphviz."""
+import hashlib
+import json
+import os
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Mapping, Optional
+
+import automata.automaton as aut
+from automata.cache import automaton_digest
+from automata.utils import write_dot
+
+
+def _render(prog: str, fmt: str, dot: str, path: str) -> None:
+    """Render a dot description to a path, atomically."""
+    directory = os.path.dirname(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    os.close(fd)
+    try:
+        subprocess.run(
+            [prog, f"-T{fmt}", "-o", tmp_path],
+            input=dot.encode("utf-8"),
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def render_automata(
+    automata: Mapping[str, aut.FiniteAutomaton],
+    output_dir: str,
+    *,
+    processes: Optional[int] = None,
+    prog: str = "dot",
+    fmt: str = "png",
+    **dot_options: Any,
+) -> Dict[str, str]:
+    """
+    Render images of several automata in parallel.
+
+    Each image is named after a hash of the automaton (see
+    :func:`~automata.cache.automaton_digest`), the dot options, the
+    program and the format, which does not depend on the order of the
+    states and transitions. It is only rendered if it does not exist yet,
+    so unchanged automata are not rendered again, even from another
+    process, and equal automata are rendered once. The file
+    ``index.json`` of the directory maps the name of each automaton to
+    its image, and is updated with the new names.
+
+    Args:
+        automata: Mapping from name to automaton.
+        output_dir: Directory of the images. It is created if needed.
+        processes: Maximum number of parallel renders. By default, the
+            number of processors.
+        prog: Graphviz layout program.
+        fmt: Output format.
+        dot_options: Options of :func:`~automata.utils.write_dot`.
+
+    Returns:
+        Mapping from the name of each automaton to its image file, relative
+        to the directory.
+
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    files: Dict[str, str] = {}
+    pending: Dict[str, str] = {}
+    for name, automaton in automata.items():
+        key = hashlib.sha256(
+            json.dumps(
+                [prog, fmt, automaton_digest(automaton), dot_options],
+                ensure_ascii=False,
+                sort_keys=True,
+            ).encode("utf-8"),
+        ).hexdigest()
+        files[name] = f"{key}.{fmt}"
+        path = os.path.join(output_dir, files[name])
+        if not os.path.exists(path) and path not in pending:
+            pending[path] = write_dot(automaton, **dot_options)
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = [
+                executor.submit(_render, prog, fmt, dot, path)
+                for path, dot in pending.items()
+            ]
+            for future in futures:
+                future.result()
+
+    index_path = os.path.join(output_dir, "index.json")
+    index: Dict[str, str] = {}
+    if os.path.exists(index_path):
+        with open(index_path, encoding="utf-8") as f:
+            index = json.load(f)
+    index.update(files)
+
+    fd, tmp_path = tempfile.mkstemp(dir=output_dir, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, index_path)
+
+    return files
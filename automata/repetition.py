@@ -0,0 +1,104 @@
+"""Evaluation of strings described by repetitions of blocks."""
+from typing import Any, Sequence, Tuple, Union
+
+import automata.automaton as aut
+from automata.dense import DenseDFA
+from automata.parallel import (
+    TransitionFunction,
+    compose,
+    dense_columns,
+    transition_function,
+)
+
+# A string, or a pair of a block and its number of repetitions. The block
+# is a string or, recursively, a sequence of parts.
+Part = Union[str, Tuple[Any, int]]
+
+
+def power(function: TransitionFunction, exponent: int) -> TransitionFunction:
+    """
+    Return the transition function of a string repeated several times.
+
+    The power is computed by repeated squaring, with ``O(log exponent)``
+    compositions.
+
+    Args:
+        function: Transition function of the string.
+        exponent: Number of repetitions.
+
+    Returns:
+        Transition function of the repeated string.
+
+    """
+    if exponent < 0:
+        raise ValueError("The number of repetitions can't be negative")
+
+    result = tuple(range(len(function)))
+    while exponent:
+        if exponent & 1:
+            result = compose(result, function)
+        exponent >>= 1
+        if exponent:
+            function = compose(function, function)
+
+    return result
+
+
+class RepetitionEvaluator():
+    """
+    Evaluator of strings described as repetitions of blocks.
+
+    For example, ``["head", (["ab", ("c", 3)], 10 ** 9)]`` describes
+    ``"head"`` followed by ``10 ** 9`` repetitions of ``"abccc"``. The
+    transition function of each block is computed once and raised to its
+    number of repetitions, so the cost depends on the size of the
+    description and the logarithm of the counts, not on the length of the
+    string.
+
+    Args:
+        automaton: Deterministic automaton.
+
+    """
+
+    def __init__(self, automaton: aut.FiniteAutomaton) -> None:
+        self.dfa = DenseDFA(automaton)
+        self.columns = dense_columns(self.dfa)
+
+    def function(self, parts: Sequence[Part]) -> TransitionFunction:
+        """
+        Return the transition function of a described string.
+
+        Args:
+            parts: Description of the string.
+
+        Returns:
+            State reached from each state of the
+            :class:`~automata.dense.DenseDFA`.
+
+        """
+        n_states = self.dfa.n_states
+        result = tuple(range(n_states))
+        for part in parts:
+            if isinstance(part, str):
+                function = transition_function(self.columns, n_states, part)
+            else:
+                block, count = part
+                function = power(
+                    (
+                        transition_function(self.columns, n_states, block)
+                        if isinstance(block, str)
+                        else self.function(block)
+                    ),
+                    count,
+                )
+            result = compose(result, function)
+
+        return result
+
+    def final_state(self, parts: Sequence[Part]) -> int:
+        """Return the index of the state reached with a described string."""
+        return self.function(parts)[0]
+
+    def accepts(self, parts: Sequence[Part]) -> bool:
+        """Return if a described string is accepted."""
+        return self.final_state(parts) in self.dfa.finals
@@ -0,0 +1,226 @@
+"""Search of the strings accepted by an automaton inside a text."""
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import automata.automaton as aut
+from automata.lazy_dfa import LazyDFA, StateSet
+from automata.prefilter import Prefilter
+
+Span = Tuple[int, int]
+
+
+class _UnanchoredDFA():
+    """
+    Lazy DFA of ``Σ*`` followed by the language of an automaton.
+
+    Before each symbol the initial states are added again, so a match can
+    start at any position. Only nonempty matches are considered.
+
+    """
+
+    def __init__(self, automaton: aut.FiniteAutomaton) -> None:
+        self.dfa = LazyDFA(automaton)
+        self.start: StateSet = frozenset()
+        self._transitions: Dict[Tuple[StateSet, str], StateSet] = {}
+
+    def step(self, states: StateSet, symbol: str) -> StateSet:
+        key = (states, symbol)
+        next_states = self._transitions.get(key)
+        if next_states is None:
+            next_states = self.dfa.step(states | self.dfa.initial, symbol)
+            self._transitions[key] = next_states
+
+        return next_states
+
+
+class Searcher():
+    """
+    Search of the strings accepted by an automaton inside a text.
+
+    The text is scanned with lazily determinized automata, so each pass
+    over the text is linear. Symbols of the text outside the alphabet of
+    the automaton are allowed, but cannot be part of a match. Empty
+    matches are not reported.
+
+    A :class:`~automata.prefilter.Prefilter` is used to skip texts without
+    the literals required by the matches and, when all matches start with
+    the same literal, to jump to its occurrences.
+
+    Args:
+        automaton: Automaton whose accepted strings are searched.
+        use_prefilter: Use the prefilter.
+
+    """
+
+    def __init__(
+        self,
+        automaton: aut.FiniteAutomaton,
+        *,
+        use_prefilter: bool = True,
+    ) -> None:
+        self.automaton = automaton
+        self.prefilter = Prefilter(automaton) if use_prefilter else None
+        self._forward = _UnanchoredDFA(automaton)
+        self._reverse = _UnanchoredDFA(automaton.reverse())
+        self._anchored = self._forward.dfa
+        self._live = automaton.co_accessible_states()
+        self._alive: Dict[StateSet, bool] = {}
+
+    def match_ends(self, text: str) -> Iterator[int]:
+        """
+        Find the positions where a match ends, in a single forward pass.
+
+        Args:
+            text: Text to search.
+
+        Yields:
+            Each position ``end`` such that ``text[start:end]`` is accepted
+            for some ``start < end``, in increasing order.
+
+        """
+        forward = self._forward
+        is_final = LazyDFA.is_final
+        states = forward.start
+        for i, symbol in enumerate(text):
+            states = forward.step(states, symbol)
+            if is_final(states):
+                yield i + 1
+
+    def match_starts(self, text: str) -> bytearray:
+        """
+        Find the positions where a match starts, in a single reverse pass.
+
+        Args:
+            text: Text to search.
+
+        Returns:
+            For each position ``start`` of the text, ``1`` if
+            ``text[start:end]`` is accepted for some ``end > start`` and
+            ``0`` otherwise.
+
+        """
+        reverse = self._reverse
+        is_final = LazyDFA.is_final
+        starts = bytearray(len(text))
+        states = reverse.start
+        for i in range(len(text) - 1, -1, -1):
+            states = reverse.step(states, text[i])
+            starts[i] = is_final(states)
+
+        return starts
+
+    def _is_alive(self, states: StateSet) -> bool:
+        alive = self._alive.get(states)
+        if alive is None:
+            alive = not self._live.isdisjoint(states)
+            self._alive[states] = alive
+
+        return alive
+
+    def _longest_end(
+        self,
+        text: str,
+        start: int,
+        ends: Dict[Tuple[int, StateSet], int],
+    ) -> int:
+        """
+        Return the end of the longest match starting at a position.
+
+        ``ends`` maps each pair of position and states already visited by
+        a previous run to the furthest end of a match reachable from it
+        (``-1`` if there is none). A run reaching one of these pairs stops
+        there, as it would continue as the previous run did, so each pair
+        is stepped from at most once.
+
+        """
+        dfa = self._anchored
+        is_final = dfa.is_final
+        states = dfa.initial
+        path = []
+        end = -1
+        i = start
+        while i < len(text):
+            states = dfa.step(states, text[i])
+            i += 1
+            if not self._is_alive(states):
+                break
+            key = (i, states)
+            known = ends.get(key)
+            if known is not None:
+                end = known
+                break
+            path.append(key)
+
+        for key in reversed(path):
+            if end == -1 and is_final(key[1]):
+                end = key[0]
+            ends[key] = end
+
+        return start if end == -1 else end
+
+    def finditer(self, text: str) -> Iterator[Span]:
+        """
+        Find the leftmost-longest, non-overlapping matches.
+
+        The starts of the matches are found with a pass of the reversed
+        automaton from the end of the text, or are searched among the
+        occurrences of the required prefix if there is one. Then, from
+        each start, the automaton is run until no final state can be
+        reached, to find the end of the longest match, and the search
+        continues after that end. The runs reaching the same states at the
+        same position as a previous run reuse its result instead of
+        scanning the text again, so the search is linear in the length of
+        the text.
+
+        Args:
+            text: Text to search.
+
+        Yields:
+            The ``(start, end)`` span of each match, from left to right.
+
+        """
+        prefilter = self.prefilter
+        if prefilter is not None:
+            if not prefilter.may_match(text):
+                return
+
+            if prefilter.prefix:
+                yield from self._finditer_candidates(text, prefilter)
+                return
+
+        starts = self.match_starts(text)
+        ends: Dict[Tuple[int, StateSet], int] = {}
+        position = 0
+        while position < len(text):
+            try:
+                start = starts.index(1, position)
+            except ValueError:
+                return
+
+            end = self._longest_end(text, start, ends)
+            yield start, end
+            position = end
+
+    def _finditer_candidates(
+        self,
+        text: str,
+        prefilter: Prefilter,
+    ) -> Iterator[Span]:
+        ends: Dict[Tuple[int, StateSet], int] = {}
+        position = 0
+        while True:
+            for start in prefilter.candidates(text, position):
+                end = self._longest_end(text, start, ends)
+                if end > start:
+                    yield start, end
+                    position = end
+                    break
+            else:
+                return
+
+    def search(self, text: str) -> Optional[Span]:
+        """Return the span of the leftmost-longest match, if any."""
+        return next(self.finditer(text), None)
+
+    def findall(self, text: str) -> List[str]:
+        """Return the strings of the leftmost-longest matches."""
+        return [text[start:end] for start, end in self.finditer(text)]
@@ -0,0 +1,172 @@
+"""Immutable evaluation sessions that can be forked and serialized."""
+import json
+from typing import Dict, List, NamedTuple, Set, Tuple
+
+import automata.automaton as aut
+from automata.cache import automaton_digest
+from automata.utils import is_deterministic
+
+
+class Session(NamedTuple):
+    """
+    Immutable handle of the evaluation of a string.
+
+    Consuming symbols returns a new session, so a session can be kept as a
+    snapshot or used as the start of several branches without copies, and
+    shared between threads.
+
+    Attributes:
+        engine: Engine of the automaton.
+        state: Index of the current state for deterministic automata (``-1``
+            once a transition is missing), or bitmask of the current
+            states otherwise.
+        position: Number of symbols consumed.
+
+    """
+
+    engine: "SessionEngine"
+    state: int
+    position: int
+
+    def feed(self, string: str) -> "Session":
+        """Return the session after consuming a string."""
+        step = self.engine.step
+        state = self.state
+        for symbol in string:
+            state = step(state, symbol)
+
+        return Session(self.engine, state, self.position + len(string))
+
+    def is_accepting(self) -> bool:
+        """Return if the string consumed is accepted."""
+        return self.engine.is_accepting(self.state)
+
+    def dumps(self) -> str:
+        """Serialize the session, see :meth:`SessionEngine.loads`."""
+        return json.dumps({
+            "digest": self.engine.digest,
+            "state": self.state,
+            "position": self.position,
+        })
+
+
+class SessionEngine():
+    """
+    Transitions of an automaton on state handles.
+
+    States are numbered in order of name, so that engines created from
+    equal automata in different processes agree on the handles. Handles
+    of deterministic automata are state indexes, while those of
+    nondeterministic automata are bitmasks of states closed under lambda
+    transitions, whose transitions are cached.
+
+    Args:
+        automaton: Automaton to evaluate.
+
+    Attributes:
+        digest: Digest of the automaton, see
+            :func:`~automata.cache.automaton_digest`.
+        deterministic: If the automaton is deterministic.
+
+    """
+
+    def __init__(self, automaton: aut.FiniteAutomaton) -> None:
+        self.automaton = automaton
+        self.digest = automaton_digest(automaton)
+        self.deterministic = is_deterministic(automaton)
+        self.states = tuple(sorted(
+            automaton.states,
+            key=lambda s: (s.name, s.is_final),
+        ))
+        state_ids = {s: i for i, s in enumerate(self.states)}
+        self._symbols = frozenset(automaton.symbols)
+        index = automaton.transition_index()
+
+        if self.deterministic:
+            self._rows: List[Dict[str, int]] = [
+                {
+                    symbol: state_ids[target]
+                    for symbol, targets in index.get(state, {}).items()
+                    for target in targets
+                }
+                for state in self.states
+            ]
+            self._finals = [state.is_final for state in self.states]
+            self.initial = state_ids[automaton.initial_state]
+        else:
+            def mask(states: Set[aut.State]) -> int:
+                return sum(1 << state_ids[s] for s in states)
+
+            self._moves: List[Dict[str, int]] = [
+                {
+                    symbol: mask(automaton.get_closure(set(targets)))
+                    for symbol, targets in index.get(state, {}).items()
+                    if symbol is not None
+                }
+                for state in self.states
+            ]
+            self._final_mask = mask(
+                {state for state in self.states if state.is_final},
+            )
+            self._steps: Dict[Tuple[int, str], int] = {}
+            self.initial = mask(
+                automaton.get_closure({automaton.initial_state}),
+            )
+
+    def start(self) -> Session:
+        """Return a session at the start of a string."""
+        return Session(self, self.initial, 0)
+
+    def step(self, state: int, symbol: str) -> int:
+        """
+        Return the handle reached from a handle with a symbol.
+
+        Raises:
+            ValueError: If the symbol is not in the alphabet.
+
+        """
+        if symbol not in self._symbols:
+            raise ValueError(
+                f"Symbol {symbol} is not a valid symbol "
+                f"{self.automaton.symbols}",
+            )
+
+        if self.deterministic:
+            return -1 if state == -1 else self._rows[state].get(symbol, -1)
+
+        key = (state, symbol)
+        next_state = self._steps.get(key)
+        if next_state is None:
+            next_state = 0
+            remaining = state
+            while remaining:
+                lowest = remaining & -remaining
+                moves = self._moves[lowest.bit_length() - 1]
+                next_state |= moves.get(symbol, 0)
+                remaining ^= lowest
+            self._steps[key] = next_state
+
+        return next_state
+
+    def is_accepting(self, state: int) -> bool:
+        """Return if a handle is accepting."""
+        if self.deterministic:
+            return state != -1 and self._finals[state]
+        return bool(state & self._final_mask)
+
+    def loads(self, data: str) -> Session:
+        """
+        Restore a session serialized with :meth:`Session.dumps`.
+
+        The session may come from another process, but must have been
+        created from an equal automaton.
+
+        Raises:
+            ValueError: If the session belongs to another automaton.
+
+        """
+        description = json.loads(data)
+        if description["digest"] != self.digest:
+            raise ValueError("Session of a different automaton")
+
+        return Session(self, description["state"], description["position"])
@@ -1,17 +1,61 @@
 """General utilities to work with automatas."""
+import hashlib
+import io
+import json
 import re
+import time
 from collections import defaultdict, deque
-from typing import DefaultDict, Dict, Mapping, Optional, Set
+from typing import (
+    Any,
+    Collection,
+    DefaultDict,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    TextIO,
+    Tuple,
+)
 
 from typing_extensions import Final
 
 import automata.automaton as aut
+from automata.csr import CSRAutomaton
 
 
 class FormatParseError(Exception):
     """Exception for parsing problems."""
 
 
+class ParseStats():
+    """
+    Statistics of a parse with :meth:`AutomataFormat.load`.
+
+    Attributes:
+        lines: Number of lines read.
+        characters: Number of characters read.
+        seconds: Time spent parsing.
+
+    """
+
+    def __init__(self) -> None:
+        self.lines = 0
+        self.characters = 0
+        self.seconds = 0.0
+
+    @property
+    def lines_per_second(self) -> float:
+        """Parsed lines per second."""
+        return self.lines / self.seconds if self.seconds else 0.0
+
+    @property
+    def characters_per_second(self) -> float:
+        """Parsed characters per second."""
+        return self.characters / self.seconds if self.seconds else 0.0
+
+
 class AutomataFormat():
     """Custom format to write and read automata."""
 
@@ -23,107 +67,203 @@ class AutomataFormat():
     re_transition: Final = re.compile(r"\s*(\w+)\s*-(\S)?->\s*(\w+)\s*")
     re_symbols: Final = re.compile(r"\s*Symbols:\s*(\S*)\s*")
 
+    # All the line kinds in one pattern, tried in the same order as the
+    # individual ones. The name of the outer group is the kind of line.
+    re_line: Final = re.compile(
+        r"(?P<comment>\s*#\.*)"
+        r"|(?P<empty>\s*)"
+        r"|(?P<automaton>\s*Automaton:\s*)"
+        r"|(?P<symbols>\s*Symbols:\s*(?P<symbols_str>\S*)\s*)"
+        r"|(?P<state>\s*(?P<state_name>\w+)(?:\s*(?P<final>final))?\s*)"
+        r"|(?P<initial>\s*-->\s*(?P<initial_name>\w+)\s*)"
+        r"|(?P<transition>"
+        r"\s*(?P<source>\w+)\s*-(?P<symbol>\S)?->\s*(?P<target>\w+)\s*"
+        r")",
+    )
+
     @classmethod
-    def read(cls, description: str) -> aut.FiniteAutomaton:
-        """Read the automaton description in our custom format."""
-        splitted_lines = description.splitlines()
+    def load(
+        cls,
+        fp: TextIO,
+        stats: Optional[ParseStats] = None,
+    ) -> aut.FiniteAutomaton:
+        """
+        Read an automaton in our custom format from a file object.
+
+        The file is processed line by line, so only the automaton being
+        built is kept in memory.
+
+        Args:
+            fp: Text file object.
+            stats: If given, it is filled with the statistics of the parse.
+
+        Returns:
+            Automaton read.
+
+        """
+        start = time.perf_counter()
+        n_lines = n_characters = 0
         prelude_read = False
 
         initial_state: Optional[aut.State] = None
+        symbols: Optional[Tuple[str, ...]] = None
         states: Dict[str, aut.State] = {}
         transitions: Set[aut.Transition] = set()
 
-        for line in splitted_lines:
-            if cls.re_comment.fullmatch(line) or cls.re_empty.fullmatch(line):
+        for line in fp:
+            n_lines += 1
+            n_characters += len(line)
+            line = line.rstrip("\r\n")
+            match = cls.re_line.fullmatch(line)
+            kind = match.lastgroup if match else None
+
+            if kind in ("comment", "empty"):
                 continue
 
-            if prelude_read:
-                match = cls.re_symbols.fullmatch(line)
-                if match:
-                    symbols_str = match.groups()[0]
-                    symbols = tuple(symbols_str)
+            if kind == "automaton":
+                if not prelude_read:
+                    prelude_read = True
                     continue
 
-                match = cls.re_state.fullmatch(line)
-                if match:
-                    state_name, final_text = match.groups()
+            elif prelude_read and match:
+                if kind == "symbols":
+                    symbols = tuple(match["symbols_str"])
+
+                elif kind == "state":
+                    state_name = match["state_name"]
                     states[state_name] = aut.State(
                         name=state_name,
-                        is_final=bool(final_text),
+                        is_final=bool(match["final"]),
                     )
-                    continue
-
-                match = cls.re_initial.fullmatch(line)
-                if match:
-                    state_name = match.groups()[0]
-                    initial_state = states[state_name]
-                    continue
 
-                match = cls.re_transition.fullmatch(line)
-                if match:
-                    state1_name, symbol, state2_name = match.groups()
-
-                    state1 = states[state1_name]
-                    state2 = states[state2_name]
+                elif kind == "initial":
+                    initial_state = states[match["initial_name"]]
 
+                else:
                     transitions.add(aut.Transition(
-                        initial_state=state1,
-                        symbol=symbol,
-                        final_state=state2,
+                        initial_state=states[match["source"]],
+                        symbol=match["symbol"],
+                        final_state=states[match["target"]],
                     ))
-                    continue
 
-            elif cls.re_automaton.fullmatch(line):
-                prelude_read = True
                 continue
 
             raise FormatParseError(f"Invalid line: {line}")
 
+        if stats is not None:
+            stats.lines = n_lines
+            stats.characters = n_characters
+            stats.seconds = time.perf_counter() - start
+
         if initial_state is None:
             raise FormatParseError("No initial state defined")
 
+        if symbols is None:
+            raise FormatParseError("No symbols defined")
+
         return aut.FiniteAutomaton(
             initial_state=initial_state,
             symbols=symbols,
-            states=states.values(),
+            states=dict.fromkeys(states.values()),
             transitions=transitions,
         )
 
     @classmethod
-    def write(cls, automaton: aut.FiniteAutomaton) -> str:
-        """Write the automaton description in our custom format."""
-        return (
-            "Automaton:\n"
-            + "\tSymbols: "
-            + "".join(
-                f"{s}"
-                for s in automaton.symbols
-            )
-            + "\n\n"
-            + "".join(
-                f"\t{s.name}{' final' if s.is_final else ''}\n"
-                for s in automaton.states
-            )
-            + "\n"
-            + f"\t--> {automaton.initial_state.name}\n"
-            + "".join(
+    def read(cls, description: str) -> aut.FiniteAutomaton:
+        """Read the automaton description in our custom format."""
+        return cls.load(io.StringIO(description))
+
+    @classmethod
+    def dump(cls, automaton: aut.FiniteAutomaton, fp: TextIO) -> None:
+        """Write the automaton in our custom format to a file object."""
+        fp.write("Automaton:\n")
+        fp.write(f"\tSymbols: {''.join(automaton.symbols)}\n\n")
+        for s in automaton.states:
+            fp.write(f"\t{s.name}{' final' if s.is_final else ''}\n")
+
+        fp.write(f"\n\t--> {automaton.initial_state.name}\n")
+        for t in automaton.transitions:
+            fp.write(
                 f"\t{t.initial_state.name} "
                 f"-{t.symbol if t.symbol is not None else ''}->"
-                f" {t.final_state.name}\n"
-                for t in automaton.transitions
+                f" {t.final_state.name}\n",
             )
-        )
 
+    @classmethod
+    def write(cls, automaton: aut.FiniteAutomaton) -> str:
+        """Write the automaton description in our custom format."""
+        output = io.StringIO()
+        cls.dump(automaton, output)
+        return output.getvalue()
+
+
+def _symbols_label(symbols: Iterable[Optional[str]]) -> str:
+    """Label for a set of symbols, with runs of 3+ characters as ranges."""
+    parts = ["λ"] if None in symbols else []
+    codes = sorted({ord(s) for s in symbols if s is not None and len(s) == 1})
+    others = sorted(s for s in symbols if s is not None and len(s) != 1)
+
+    i = 0
+    while i < len(codes):
+        j = i
+        while j + 1 < len(codes) and codes[j + 1] == codes[j] + 1:
+            j += 1
+        if j - i >= 2:
+            parts.append(f"{chr(codes[i])}-{chr(codes[j])}")
+        else:
+            parts.extend(chr(c) for c in codes[i:j + 1])
+        i = j + 1
+
+    return ",".join(parts + others)
 
-def write_dot(automaton: aut.FiniteAutomaton) -> str:
+
+def _neighborhood(
+    automaton: aut.FiniteAutomaton,
+    center: aut.State,
+    max_states: int,
+) -> Set[aut.State]:
+    """States closest to a state, following transitions in both ways."""
+    index = automaton.transition_index()
+    reverse_index = automaton.reverse_transition_index()
+    selected = {center}
+    pending = deque([center])
+    while pending and len(selected) < max_states:
+        state = pending.popleft()
+        for adjacency in (index, reverse_index):
+            for targets in adjacency.get(state, {}).values():
+                for target in sorted(targets, key=lambda s: s.name):
+                    if target not in selected and len(selected) < max_states:
+                        selected.add(target)
+                        pending.append(target)
+
+    return selected
+
+
+def dump_dot(
+    automaton: aut.FiniteAutomaton,
+    fp: TextIO,
+    *,
+    merge_edges: bool = False,
+    collapse_sink: bool = False,
+    max_states: Optional[int] = None,
+    center: Optional[str] = None,
+) -> None:
     """
-    Write a dot representation of the automaton.
+    Write a dot representation of the automaton to a file object.
 
     Args:
         automaton: Automaton to print.
-
-    Returns:
-        Representation of the automaton in dot (Graphviz) language.
+        fp: Text file object.
+        merge_edges: Draw a single edge between each pair of states, whose
+            label lists its symbols, with ranges such as ``a-z``.
+        collapse_sink: Omit the states from which no final state can be
+            reached (such as the ``empty`` state of a deterministic
+            automaton) and the transitions to them.
+        max_states: Maximum number of states to draw. If the automaton is
+            bigger, only the states closest to ``center`` are drawn, and
+            transitions leaving them point to a ``...`` node.
+        center: Name of the state around which the states are selected
+            when ``max_states`` is exceeded. By default, the initial state.
 
     """
     shape_dict = {
@@ -134,24 +274,91 @@ def write_dot(automaton: aut.FiniteAutomaton) -> str:
     def symbol_repr(symbol: Optional[str]) -> str:
         return "λ" if symbol is None else symbol
 
-    return (
+    states: Collection[aut.State] = automaton.states
+    if collapse_sink:
+        live = automaton.co_accessible_states()
+        states = [
+            s for s in states
+            if s in live or s == automaton.initial_state
+        ]
+
+    truncated = False
+    if max_states is not None and len(states) > max_states:
+        if center is None:
+            center_state = automaton.initial_state
+        else:
+            center_state = next(
+                (s for s in automaton.states if s.name == center),
+                None,
+            )
+            if center_state is None:
+                raise ValueError(f"State {center} is not a valid state")
+
+        selected = _neighborhood(automaton, center_state, max_states)
+        states = [s for s in states if s in selected]
+        truncated = True
+
+    drawn = set(states)
+    hidden = set(automaton.states) - drawn if collapse_sink else set()
+
+    fp.write(
         "digraph {\n"
         "  rankdir=LR;\n"
         "\n"
-        + "  node [shape = point]; __start_point__\n"
-        + "".join(
-            f"  {s.name}[shape={shape_dict[s.is_final]}]\n"
-            for s in automaton.states
+        "  node [shape = point]; __start_point__\n",
+    )
+    for s in states:
+        fp.write(f"  {s.name}[shape={shape_dict[s.is_final]}]\n")
+    if truncated:
+        fp.write("  __truncated__[shape=none, label=\"...\"]\n")
+
+    fp.write("\n")
+    if automaton.initial_state in drawn:
+        fp.write(f"  __start_point__ -> {automaton.initial_state.name}\n")
+
+    edges: Dict[Tuple[str, str], Set[Optional[str]]] = {}
+    for t in automaton.transitions:
+        if t.initial_state not in drawn or t.final_state in hidden:
+            continue
+
+        target = (
+            t.final_state.name if t.final_state in drawn else "__truncated__"
         )
-        + "\n"
-        + f"  __start_point__ -> {automaton.initial_state.name}\n"
-        + "".join(
-            f"  {t.initial_state.name} -> {t.final_state.name}"
-            f"[label=\"{symbol_repr(t.symbol)}\"]\n"
-            for t in automaton.transitions
+        if merge_edges or target == "__truncated__":
+            edges.setdefault((t.initial_state.name, target), set()).add(
+                t.symbol,
+            )
+        else:
+            fp.write(
+                f"  {t.initial_state.name} -> {target}"
+                f"[label=\"{symbol_repr(t.symbol)}\"]\n",
+            )
+
+    for (source, target), symbols in edges.items():
+        fp.write(
+            f"  {source} -> {target}[label=\"{_symbols_label(symbols)}\"]\n",
         )
-        + "}\n"
-    )
+    fp.write("}\n")
+
+
+def write_dot(
+    automaton: aut.FiniteAutomaton,
+    **options: Any,
+) -> str:
+    """
+    Write a dot representation of the automaton.
+
+    Args:
+        automaton: Automaton to print.
+        options: Options of :func:`dump_dot`.
+
+    Returns:
+        Representation of the automaton in dot (Graphviz) language.
+
+    """
+    output = io.StringIO()
+    dump_dot(automaton, output, **options)
+    return output.getvalue()
 
 
 def is_deterministic(
@@ -241,3 +448,93 @@ def deterministic_automata_isomorphism(
                 pending.appendleft((final1, final2))
 
     return equiv_map
+
+
+def canonical_form(
+    automaton: aut.FiniteAutomaton,
+) -> aut.FiniteAutomaton:
+    """
+    Return the canonical automaton of the language of an automaton.
+
+    The automaton is determinized, minimized and trimmed (with
+    :class:`~automata.csr.CSRAutomaton`), and its states are renamed
+    ``q0``, ``q1``... in breadth-first order from the initial state,
+    visiting symbols in sorted order. Two automata with the same
+    symbols and language have equal canonical forms.
+
+    Args:
+        automaton: Automaton to convert.
+
+    Returns:
+        Canonical (trimmed, so possibly partial) deterministic automaton.
+
+    """
+    minimized = CSRAutomaton.from_automaton(
+        automaton,
+    ).to_deterministic().to_minimized().trim()
+    symbols = sorted(minimized.symbols)
+    rows = [
+        {
+            minimized.symbols[minimized.symbol_ids[i]]: minimized.targets[i]
+            for i in range(minimized.offsets[s], minimized.offsets[s + 1])
+        }
+        for s in range(minimized.n_states)
+    ]
+
+    names = {minimized.initial: "q0"}
+    order = [minimized.initial]
+    for state in order:
+        for symbol in symbols:
+            target = rows[state].get(symbol)
+            if target is not None and target not in names:
+                names[target] = f"q{len(names)}"
+                order.append(target)
+
+    states = {
+        state: aut.State(names[state], is_final=bool(minimized.finals[state]))
+        for state in order
+    }
+
+    return aut.FiniteAutomaton(
+        initial_state=states[minimized.initial],
+        states=dict.fromkeys(states.values()),
+        symbols=symbols,
+        transitions=[
+            aut.Transition(states[state], symbol, states[rows[state][symbol]])
+            for state in order
+            for symbol in symbols
+            if symbol in rows[state]
+        ],
+    )
+
+
+def canonical_key(automaton: aut.FiniteAutomaton) -> str:
+    """
+    Return a hash of the canonical form of an automaton.
+
+    Automata with the same symbols and language have the same key, so it
+    can be used to deduplicate automata or as a cache key. The key is
+    cached in the automaton.
+
+    Args:
+        automaton: Automaton to hash.
+
+    Returns:
+        Hexadecimal SHA-256 digest.
+
+    """
+    def compute_key() -> str:
+        canonical = canonical_form(automaton)
+        description: List[object] = [
+            list(canonical.symbols),
+            [s.is_final for s in canonical.states],
+            [
+                [t.initial_state.name, t.symbol, t.final_state.name]
+                for t in canonical.transitions
+            ],
+        ]
+        return hashlib.sha256(
+            json.dumps(description, ensure_ascii=False).encode("utf-8"),
+        ).hexdigest()
+
+    return automaton.cached("canonical_key", compute_key)
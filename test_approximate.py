@@ -0,0 +1,81 @@
+"""Test approximate matching."""
+import itertools
+import unittest
+from typing import List, Optional
+
+from automata.approximate import ApproximateEvaluator
+from automata.lazy_dfa import LazyDFA
+from automata.re_parser import REParser
+from test_re_parser import TestREParser
+
+
+class TestExactMatching(TestREParser):
+    """Test that no edits means exact matching."""
+
+    def _create_evaluator(self, regex: str) -> ApproximateEvaluator:
+        return ApproximateEvaluator(REParser().create_automaton(regex), 0)
+
+
+def _levenshtein(string1: str, string2: str) -> int:
+    row = list(range(len(string2) + 1))
+    for i, symbol1 in enumerate(string1, 1):
+        previous, row[0] = row[0], i
+        for j, symbol2 in enumerate(string2, 1):
+            previous, row[j] = row[j], min(
+                row[j] + 1,
+                row[j - 1] + 1,
+                previous + (symbol1 != symbol2),
+            )
+    return row[-1]
+
+
+class TestApproximate(unittest.TestCase):
+    """Tests for ApproximateEvaluator."""
+
+    def test_reference(self) -> None:
+        """Test against the distance to every accepted string."""
+        # Strings up to length 4 are checked, so accepted strings up to
+        # length 4 + 2 edits are needed
+        strings = [
+            "".join(s)
+            for n in range(7)
+            for s in itertools.product("abc", repeat=n)
+        ]
+        for regex in ["a.b.a", "(a+b)*.a.b", "a.b*", "b.b.b.b.b"]:
+            dfa = LazyDFA(REParser().create_automaton(regex))
+            language: List[str] = [
+                s for s in strings
+                if dfa.is_final(dfa.step_string(dfa.initial, s))
+            ]
+            evaluators = [
+                ApproximateEvaluator(REParser().create_automaton(regex), k)
+                for k in range(3)
+            ]
+            for string in strings[:121]:
+                distance = min(_levenshtein(string, s) for s in language)
+                for k, evaluator in enumerate(evaluators):
+                    with self.subTest(regex=regex, string=string, k=k):
+                        expected: Optional[int] = (
+                            distance if distance <= k else None
+                        )
+                        self.assertEqual(evaluator.distance(string), expected)
+
+    def test_foreign_symbols(self) -> None:
+        """Test that symbols outside the alphabet can be edited."""
+        evaluator = ApproximateEvaluator(
+            REParser().create_automaton("a.b.c"),
+            1,
+        )
+
+        self.assertTrue(evaluator.accepts("axc"))
+        self.assertTrue(evaluator.accepts("abcx"))
+        self.assertFalse(evaluator.accepts("xbcx"))
+
+    def test_negative_edits(self) -> None:
+        """Test that the number of edits is checked."""
+        with self.assertRaises(ValueError):
+            ApproximateEvaluator(REParser().create_automaton("a"), -1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+"""Test the binary automaton format."""
+import os
+import tempfile
+import unittest
+
+from automata.binary_format import (
+    BinaryAutomaton,
+    BinaryFormatError,
+    write_binary,
+)
+from automata.re_parser import REParser
+
+from test_re_parser import TestREParser
+
+
+class _BinaryTest(TestREParser):
+    """Base class to run the regex tests on binary files."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def _open(self, automaton) -> BinaryAutomaton:  # type: ignore[no-untyped-def]
+        path = os.path.join(self.tmp.name, "automaton.bin")
+        write_binary(automaton, path)
+        binary = BinaryAutomaton(path)
+        self.addCleanup(binary.close)
+        return binary
+
+
+class ReTest(_BinaryTest):
+    """Test nondeterministic automata stored in binary files."""
+
+    def _create_evaluator(self, regex: str) -> BinaryAutomaton:  # type: ignore[override]
+        return self._open(REParser().create_automaton(regex))
+
+
+class ReTestDeterministic(_BinaryTest):
+    """Test deterministic automata stored in binary files."""
+
+    def _create_evaluator(self, regex: str) -> BinaryAutomaton:  # type: ignore[override]
+        return self._open(REParser().create_automaton(regex).to_deterministic())
+
+
+class TestBinaryFormat(_BinaryTest):
+    """Tests for the binary format."""
+
+    def test_round_trip(self) -> None:
+        """Test that automata are read back unchanged."""
+        automaton = REParser().create_automaton("(a+b)*.a.(b+λ)")
+        for a in (automaton, automaton.to_deterministic()):
+            with self.subTest(automaton=a):
+                binary = self._open(a)
+                self.assertEqual(binary.to_automaton(), a)
+
+    def test_table(self) -> None:
+        """Test that only deterministic automata have a dense table."""
+        automaton = REParser().create_automaton("(a+b)*.a")
+
+        self.assertIsNone(self._open(automaton).table)
+        binary = self._open(automaton.to_deterministic())
+        self.assertIsNotNone(binary.table)
+        self.assertEqual(
+            len(binary.table),  # type: ignore[arg-type]
+            binary.n_states * len(binary.symbols),
+        )
+        with self.assertRaises(ValueError):
+            binary.accepts("abc")
+
+    def test_invalid(self) -> None:
+        """Test that other files are rejected."""
+        path = os.path.join(self.tmp.name, "other.bin")
+        with open(path, "wb") as f:
+            f.write(b"\0" * 512)
+
+        with self.assertRaises(BinaryFormatError):
+            BinaryAutomaton(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
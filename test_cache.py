@@ -0,0 +1,99 @@
+"""Test the persistent cache of transformations."""
+import os
+import tempfile
+import time
+import unittest
+
+from automata.automaton import FiniteAutomaton, State, Transition
+from automata.cache import AutomatonCache, automaton_digest
+from automata.re_parser import REParser
+
+
+class TestCache(unittest.TestCase):
+    """Tests for the persistent cache."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.automaton = REParser().create_automaton("(a+b)*.a.b")
+
+    def test_hits(self) -> None:
+        """Test that results are reused across cache instances."""
+        cache = AutomatonCache(self.tmp.name)
+        deterministic = cache.to_deterministic(self.automaton)
+        minimized = cache.to_minimized(deterministic)
+
+        self.assertEqual(deterministic, self.automaton.to_deterministic())
+        self.assertEqual(cache.stats()["misses"], 2)
+        self.assertEqual(cache.stats()["entries"], 2)
+
+        other = AutomatonCache(self.tmp.name)
+        self.assertEqual(other.to_deterministic(self.automaton), deterministic)
+        self.assertEqual(other.to_minimized(deterministic), minimized)
+        self.assertEqual(other.hits, 2)
+        self.assertEqual(other.misses, 0)
+
+    def test_digest(self) -> None:
+        """Test that the digest does not depend on the order."""
+        automaton = REParser().create_automaton("(a+b)*.a.b")
+        reordered = type(automaton)(
+            initial_state=automaton.initial_state,
+            states=automaton.states[::-1],
+            symbols=automaton.symbols[::-1],
+            transitions=automaton.transitions[::-1],
+        )
+
+        self.assertEqual(automaton_digest(automaton), automaton_digest(reordered))
+        self.assertNotEqual(
+            automaton_digest(automaton),
+            automaton_digest(automaton.to_deterministic()),
+        )
+
+    def test_large_entry(self) -> None:
+        """Test that loading a large entry is not quadratic."""
+        states = [State(f"q{i}") for i in range(20000)]
+        automaton = FiniteAutomaton(
+            initial_state=states[0],
+            states=set(states),
+            symbols="a",
+            transitions=[
+                Transition(source, "a", target)
+                for source, target in zip(states, states[1:])
+            ],
+        )
+        AutomatonCache(self.tmp.name).get("copy", automaton, lambda a: a)
+
+        cache = AutomatonCache(self.tmp.name)
+        start = time.perf_counter()
+        loaded = cache.get("copy", automaton, lambda a: a)
+        self.assertLess(time.perf_counter() - start, 5)
+
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(automaton_digest(loaded), automaton_digest(automaton))
+
+    def test_eviction(self) -> None:
+        """Test that least recently used entries are evicted."""
+        cache = AutomatonCache(self.tmp.name, max_bytes=0)
+        cache.to_deterministic(self.automaton)
+
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(cache.stats()["entries"], 0)
+
+    def test_corrupted(self) -> None:
+        """Test that corrupted entries are recomputed."""
+        cache = AutomatonCache(self.tmp.name)
+        cache.to_deterministic(self.automaton)
+        for name in os.listdir(self.tmp.name):
+            with open(os.path.join(self.tmp.name, name), "wb") as f:
+                f.write(b"corrupted")
+
+        self.assertEqual(
+            cache.to_deterministic(self.automaton),
+            self.automaton.to_deterministic(),
+        )
+        self.assertEqual(cache.misses, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+"""Test canonical forms of automata."""
+import time
+import unittest
+
+from automata.automaton import FiniteAutomaton, State, Transition
+from automata.re_parser import REParser
+from automata.utils import (
+    canonical_form,
+    canonical_key,
+    deterministic_automata_isomorphism,
+)
+
+
+class TestCanonical(unittest.TestCase):
+    """Tests for canonical forms and keys."""
+
+    def test_equivalent(self) -> None:
+        """Test that equivalent automata have the same key."""
+        regexes = ["(a+b)*", "(a*.b*)*", "(b+a)*.(a+λ)"]
+        automata = [REParser().create_automaton(r) for r in regexes]
+        automata.append(automata[0].to_deterministic().to_minimized())
+
+        keys = {canonical_key(a) for a in automata}
+        self.assertEqual(len(keys), 1)
+        self.assertEqual(
+            canonical_form(automata[0]),
+            canonical_form(automata[1]),
+        )
+
+    def test_different(self) -> None:
+        """Test that different languages or alphabets have other keys."""
+        regexes = ["a*", "a.a*", "(a+b)*", "a*.(b+λ)", ""]
+        keys = {
+            canonical_key(REParser().create_automaton(r)) for r in regexes
+        }
+
+        self.assertEqual(len(keys), len(regexes))
+
+    def test_form(self) -> None:
+        """Test the canonical form itself."""
+        automaton = REParser().create_automaton("a.b*")
+        canonical = canonical_form(automaton)
+
+        self.assertEqual(canonical.initial_state.name, "q0")
+        self.assertEqual(
+            [s.name for s in canonical.states],
+            ["q0", "q1"],
+        )
+        self.assertIsNotNone(deterministic_automata_isomorphism(
+            canonical,
+            automaton.to_deterministic().to_minimized().trim(),
+        ))
+
+    def test_large(self) -> None:
+        """Test the keys of large automata with renamed states."""
+        n_states = 1025
+
+        def counter(offset: int) -> FiniteAutomaton:
+            states = [
+                State(f"s{(i + offset) % n_states}", is_final=i == 0)
+                for i in range(n_states)
+            ]
+            return FiniteAutomaton(
+                initial_state=states[0],
+                states=set(states),
+                symbols="ab",
+                transitions=[
+                    Transition(states[i], symbol, states[target % n_states])
+                    for i in range(n_states)
+                    for symbol, target in (("a", i + 1), ("b", 2 * i))
+                ],
+            )
+
+        start = time.perf_counter()
+        keys = {canonical_key(counter(offset)) for offset in (0, 7)}
+        self.assertLess(time.perf_counter() - start, 5)
+
+        self.assertEqual(len(keys), 1)
+        self.assertEqual(len(canonical_form(counter(0)).states), n_states)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+"""Test capture groups."""
+import itertools
+import re
+import unittest
+
+from automata.captures import CaptureEvaluator
+from test_re_parser import TestREParser
+
+
+class TestCaptureREParser(TestREParser):
+    """Test that regular expressions without groups are parsed as before."""
+
+    def _create_evaluator(self, regex: str) -> CaptureEvaluator:
+        return CaptureEvaluator.from_regex(regex)
+
+
+def _python_regex(regex: str) -> str:
+    return (
+        regex.replace("+", "|")
+        .replace(".", "")
+        .replace("λ", "")
+        .replace("{", "(")
+        .replace("}", ")")
+    )
+
+
+class TestCaptures(unittest.TestCase):
+    """Tests for CaptureEvaluator."""
+
+    def test_python_regex(self) -> None:
+        """Test that the spans are those of Python regular expressions."""
+        regexes = [
+            "{a*}.{a.b+b}",
+            "{a+a.b}.{b*}",
+            "{{a+b}.c}*.{a*}",
+            "{a*}.{a*}",
+            "a.{b+λ}.b*",
+            "{a.b+a}*.{b}*",
+            "{c}+{a.b*}",
+        ]
+        strings = [
+            "".join(s)
+            for n in range(6)
+            for s in itertools.product("abc", repeat=n)
+        ]
+        for regex in regexes:
+            evaluator = CaptureEvaluator.from_regex(regex)
+            python_regex = re.compile(_python_regex(regex))
+            for string in strings:
+                if not set(string) <= set(regex):
+                    continue
+                with self.subTest(regex=regex, string=string):
+                    match = python_regex.fullmatch(string)
+                    expected = None if match is None else tuple(
+                        None if match.start(g) == -1 else match.span(g)
+                        for g in range(1, python_regex.groups + 1)
+                    )
+                    self.assertEqual(evaluator.match(string), expected)
+
+    def test_invalid_symbol(self) -> None:
+        """Test that invalid symbols are rejected."""
+        evaluator = CaptureEvaluator.from_regex("{a}.b")
+
+        with self.assertRaises(ValueError):
+            evaluator.match("ax")
+
+
+if __name__ == '__main__':
+    unittest.main()
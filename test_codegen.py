@@ -0,0 +1,98 @@
+"""Test generated matchers."""
+import pickle
+import unittest
+
+from automata.codegen import Matcher, compile_codegen, to_python_source
+from automata.re_parser import REParser
+from automata.utils import AutomataFormat
+
+from test_re_parser import TestREParser
+
+
+class _MatcherEvaluator():
+    """Adapter to reuse the regex tests with a generated matcher."""
+
+    def __init__(self, matcher: Matcher) -> None:
+        self.matcher = matcher
+
+    def accepts(self, string: str) -> bool:
+        return self.matcher(string)
+
+
+class ReTest(TestREParser):
+    """Test that generated matchers accept the same strings."""
+
+    def _create_evaluator(self, regex: str) -> _MatcherEvaluator:  # type: ignore[override]
+        automaton = REParser().create_automaton(regex).to_deterministic()
+        return _MatcherEvaluator(compile_codegen(automaton))
+
+
+class TestCodegen(unittest.TestCase):
+    """Tests for the generated code."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        self.automaton = AutomataFormat.read("""
+        Automaton:
+            Symbols: Helo
+
+            Empty
+            H
+            He
+            Hel
+            Hell
+            Hello final
+
+            --> Empty
+            Empty -H-> H
+            H -e-> He
+            He -l-> Hel
+            Hel -l-> Hell
+            Hell -o-> Hello
+        """)
+
+    def test_partial(self) -> None:
+        """Test a partial deterministic automaton."""
+        match = compile_codegen(self.automaton)
+
+        self.assertTrue(match("Hello"))
+        self.assertFalse(match("Hell"))
+        self.assertFalse(match("Helloo"))
+        self.assertFalse(match(""))
+        with self.assertRaises(ValueError):
+            match("Hella")
+        with self.assertRaises(ValueError):
+            match("oHella")
+
+    def test_cached(self) -> None:
+        """Test that the compiled function is reused."""
+        self.assertIs(
+            compile_codegen(self.automaton),
+            compile_codegen(self.automaton),
+        )
+
+    def test_pickle(self) -> None:
+        """Test that automata with a compiled matcher can be pickled."""
+        compile_codegen(self.automaton)
+        automaton = pickle.loads(pickle.dumps(self.automaton))
+
+        self.assertEqual(automaton, self.automaton)
+        self.assertTrue(compile_codegen(automaton)("Hello"))
+
+    def test_source(self) -> None:
+        """Test that the source defines the requested function."""
+        source = to_python_source(self.automaton, function_name="hello")
+        namespace: dict = {}
+        exec(source, namespace)
+
+        self.assertTrue(namespace["hello"]("Hello"))
+
+    def test_non_deterministic(self) -> None:
+        """Test that nondeterministic automata are rejected."""
+        automaton = REParser().create_automaton("a*")
+        with self.assertRaises(ValueError):
+            compile_codegen(automaton)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+"""Test compressed transition tables."""
+import random
+import string
+import unittest
+
+from automata.automaton import FiniteAutomaton, State, Transition
+from automata.compressed import CombTable, CombTableEvaluator
+from automata.re_parser import REParser
+
+from test_re_parser import TestREParser
+
+
+class ReTest(TestREParser):
+    """Test that compressed tables accept the same strings."""
+
+    def _create_evaluator(self, regex: str) -> CombTableEvaluator:  # type: ignore[override]
+        automaton = REParser().create_automaton(regex).to_deterministic()
+        return CombTableEvaluator(CombTable(automaton))
+
+
+class TestCombTable(unittest.TestCase):
+    """Tests for the compressed table."""
+
+    def _keyword_automaton(self, keyword: str) -> FiniteAutomaton:
+        """Complete automaton for a keyword over the lowercase letters."""
+        states = [State(f"q{i}") for i in range(len(keyword))]
+        states.append(State(f"q{len(keyword)}", is_final=True))
+        empty = State("empty")
+        transitions = [
+            Transition(
+                state,
+                symbol,
+                states[i + 1]
+                if i < len(keyword) and symbol == keyword[i] else empty,
+            )
+            for i, state in enumerate(states + [empty])
+            for symbol in string.ascii_lowercase
+        ]
+
+        return FiniteAutomaton(
+            initial_state=states[0],
+            states=states + [empty],
+            symbols=string.ascii_lowercase,
+            transitions=transitions,
+        )
+
+    def test_compression(self) -> None:
+        """Test that rows sharing a default target are compressed."""
+        table = CombTable(self._keyword_automaton("automaton"))
+
+        self.assertEqual(table.dense_size, 11 * 26)
+        self.assertGreater(table.compression_ratio, 3)
+
+        evaluator = CombTableEvaluator(table)
+        self.assertTrue(evaluator.accepts("automaton"))
+        self.assertFalse(evaluator.accepts("automata"))
+        self.assertFalse(evaluator.accepts("automatonautomaton"))
+        with self.assertRaises(ValueError):
+            evaluator.accepts("a" * 10 + "A")
+
+    def test_lookup(self) -> None:
+        """Test that every lookup matches the original transitions."""
+        automaton = REParser().create_automaton(
+            "(a.b+b.a.c)*.c",
+        ).to_deterministic()
+        table = CombTable(automaton)
+        states = [automaton.initial_state] + [
+            s for s in automaton.states if s != automaton.initial_state
+        ]
+
+        for t in automaton.transitions:
+            state_id = states.index(t.initial_state)
+            next_id = table.next_state(state_id, table.symbol_ids[t.symbol])
+            self.assertEqual(states[next_id], t.final_state)
+
+    def test_large_sparse(self) -> None:
+        """Test a large partial automaton over 256 symbols."""
+        rng = random.Random(0)
+        symbols = [chr(i) for i in range(256)]
+        states = [State(f"q{i}", is_final=i % 7 == 0) for i in range(20000)]
+        rows = {state: rng.sample(range(256), 3) for state in states}
+        transitions = [
+            Transition(state, symbols[c], rng.choice(states))
+            for state, row in rows.items()
+            for c in row
+        ]
+        automaton = FiniteAutomaton(
+            initial_state=states[0],
+            states=set(states),
+            symbols=symbols,
+            transitions=transitions,
+        )
+        table = CombTable(automaton)
+
+        self.assertEqual(table.n_states, len(states) + 1)
+        self.assertGreater(table.compression_ratio, 20)
+
+        table_states = [states[0]] + [
+            s for s in automaton.states if s != states[0]
+        ]
+        ids = {state: i for i, state in enumerate(table_states)}
+        sink = len(states)
+        self.assertEqual(table.dead[sink], 1)
+        for t in rng.sample(transitions, 1000):
+            state_id = ids[t.initial_state]
+            self.assertEqual(
+                table.next_state(state_id, ord(t.symbol)),
+                ids[t.final_state],
+            )
+            missing = min(set(range(256)) - set(rows[t.initial_state]))
+            self.assertEqual(table.next_state(state_id, missing), sink)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+"""Test the compressed sparse row representation."""
+import time
+import unittest
+from array import array
+
+from automata.csr import CSRAutomaton, CSREvaluator, refine_partition
+from automata.re_parser import REParser
+from automata.utils import deterministic_automata_isomorphism
+
+from test_re_parser import TestREParser
+
+
+class ReTest(TestREParser):
+    """Test that CSR automata accept the same strings."""
+
+    def _create_evaluator(self, regex: str) -> CSREvaluator:  # type: ignore[override]
+        automaton = REParser().create_automaton(regex)
+        return CSREvaluator(CSRAutomaton.from_automaton(automaton))
+
+
+class ReTestDeterministic(TestREParser):
+    """Test the determinization and minimization of CSR automata."""
+
+    def _create_evaluator(self, regex: str) -> CSREvaluator:  # type: ignore[override]
+        automaton = CSRAutomaton.from_automaton(
+            REParser().create_automaton(regex),
+        )
+        return CSREvaluator(automaton.to_deterministic().to_minimized())
+
+
+class TestCSR(unittest.TestCase):
+    """Tests for the CSR conversions."""
+
+    regex = "(a.b+b.a.c)*.(c+λ)"
+
+    def test_round_trip(self) -> None:
+        """Test conversion to CSR and back."""
+        automaton = REParser().create_automaton(self.regex)
+        csr = CSRAutomaton.from_automaton(automaton)
+
+        self.assertEqual(csr.to_automaton(), automaton)
+        self.assertEqual(len(csr.targets) + len(csr.lambda_targets), len(
+            automaton.transitions,
+        ))
+
+    def test_round_trip_large(self) -> None:
+        """Test that converting back is not quadratic."""
+        n_states = 20000
+        csr = CSRAutomaton(
+            initial=0,
+            state_names=[f"q{i}" for i in range(n_states)],
+            finals=bytearray([0] * (n_states - 1) + [1]),
+            symbols="a",
+            offsets=array("q", [*range(n_states), n_states - 1]),
+            symbol_ids=array("i", [0] * (n_states - 1)),
+            targets=array("i", range(1, n_states)),
+            lambda_offsets=array("q", [0] * (n_states + 1)),
+            lambda_targets=array("i"),
+        )
+
+        start = time.perf_counter()
+        automaton = csr.to_automaton()
+        self.assertLess(time.perf_counter() - start, 5)
+
+        self.assertEqual(len(automaton.transitions), n_states - 1)
+        self.assertEqual(
+            CSRAutomaton.from_automaton(automaton).targets,
+            csr.targets,
+        )
+
+    def test_same_algorithms(self) -> None:
+        """Test that CSR algorithms agree with the object ones."""
+        automaton = REParser().create_automaton(self.regex)
+        csr = CSRAutomaton.from_automaton(automaton)
+
+        self.assertEqual(
+            csr.to_deterministic().to_automaton(),
+            automaton.to_deterministic(),
+        )
+        self.assertIsNotNone(deterministic_automata_isomorphism(
+            csr.to_deterministic().to_minimized().to_automaton(),
+            automaton.to_deterministic().to_minimized(),
+        ))
+        self.assertEqual(
+            csr.trim().to_automaton(),
+            automaton.trim(),
+        )
+
+    def test_co_accessible_states(self) -> None:
+        """Test the states reaching a final state."""
+        automaton = REParser().create_automaton(self.regex).to_deterministic()
+        csr = CSRAutomaton.from_automaton(automaton)
+
+        self.assertEqual(
+            {csr.state_names[s] for s in csr.co_accessible_states()},
+            {s.name for s in automaton.co_accessible_states()},
+        )
+        self.assertLess(
+            len(csr.co_accessible_states()),
+            csr.n_states,
+        )
+
+    def test_refine_partition(self) -> None:
+        """Test refining a partition other than the finality."""
+        # States 0 and 1 loop into 2 and 3, which are in different classes
+        rows = [[2], [3], [2], [3]]
+
+        self.assertEqual(refine_partition([0, 0, 1, 1], rows), [0, 0, 1, 1])
+        self.assertEqual(refine_partition([0, 0, 1, 2], rows), [0, 1, 2, 3])
+        self.assertEqual(refine_partition([5, 5, 5, 5], [[-1]] * 4), [0] * 4)
+
+    def test_invalid_symbol(self) -> None:
+        """Test that symbols are checked after a dead prefix."""
+        csr = CSRAutomaton.from_automaton(REParser().create_automaton("a.b"))
+        evaluator = CSREvaluator(csr)
+
+        self.assertFalse(evaluator.accepts("ba"))
+        with self.assertRaises(ValueError):
+            evaluator.accepts("bac")
+
+
+if __name__ == '__main__':
+    unittest.main()
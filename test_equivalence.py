@@ -0,0 +1,57 @@
+"""Test language equivalence of automata."""
+import unittest
+
+from automata.equivalence import distinguishing_string, equivalent
+from automata.re_parser import REParser
+
+
+class TestEquivalence(unittest.TestCase):
+    """Tests for the equivalence check."""
+
+    def _check(
+        self,
+        regex1: str,
+        regex2: str,
+        expected: object = None,
+    ) -> None:
+        with self.subTest(regex1=regex1, regex2=regex2):
+            automaton1 = REParser().create_automaton(regex1)
+            automaton2 = REParser().create_automaton(regex2)
+            self.assertEqual(
+                distinguishing_string(automaton1, automaton2),
+                expected,
+            )
+            self.assertEqual(
+                equivalent(automaton1, automaton2),
+                expected is None,
+            )
+
+    def test_equivalent(self) -> None:
+        """Test automata with the same language."""
+        self._check("(a+b)*", "(a*.b*)*")
+        self._check("a.(b.a)*", "(a.b)*.a")
+        self._check("λ+a.a*", "a*")
+
+    def test_transformed(self) -> None:
+        """Test automata against their transformations."""
+        automaton = REParser().create_automaton("((b.a)+a)*.(b+λ)")
+
+        self.assertTrue(equivalent(automaton, automaton.to_deterministic()))
+        self.assertTrue(equivalent(
+            automaton,
+            automaton.to_deterministic().to_minimized(),
+        ))
+
+    def test_counterexample(self) -> None:
+        """Test that the shortest distinguishing string is returned."""
+        self._check("a*", "a.a*", "")
+        self._check("(a+b)*", "(a.a+b)*", "a")
+        self._check("(a.b)*", "(a.b)*.(a.b.a.b.a+λ)", "ababa")
+
+    def test_different_alphabets(self) -> None:
+        """Test automata over different alphabets."""
+        self._check("a*", "a*.(b+λ)", "b")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+"""Test the streaming reader and writer of the automata format."""
+import io
+import time
+import unittest
+
+from automata.re_parser import REParser
+from automata.utils import (
+    AutomataFormat,
+    FormatParseError,
+    ParseStats,
+    deterministic_automata_isomorphism,
+    dump_dot,
+    write_dot,
+)
+
+
+class TestFormatStreaming(unittest.TestCase):
+    """Tests for load and dump."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        self.automaton = REParser().create_automaton(
+            "(a+b)*.a.b",
+        ).to_deterministic()
+        self.description = """
+        #
+        Automaton:
+            Symbols: ab
+
+            q0
+            q1 final
+
+            --> q0
+            q0 -a-> q1
+            q1 -b-> q1
+            q1 --> q0
+        """
+
+    def test_roundtrip(self) -> None:
+        """Test that dumped automata are loaded back."""
+        output = io.StringIO()
+        AutomataFormat.dump(self.automaton, output)
+        self.assertEqual(output.getvalue(), AutomataFormat.write(self.automaton))
+
+        output.seek(0)
+        loaded = AutomataFormat.load(output)
+        self.assertIsNotNone(
+            deterministic_automata_isomorphism(self.automaton, loaded),
+        )
+
+    def test_load(self) -> None:
+        """Test loading from a file object with CRLF endings."""
+        stats = ParseStats()
+        automaton = AutomataFormat.load(
+            io.StringIO(self.description.replace("\n", "\r\n")),
+            stats,
+        )
+
+        self.assertEqual(automaton.symbols, ("a", "b"))
+        self.assertEqual(automaton.initial_state.name, "q0")
+        self.assertEqual(len(automaton.transitions), 3)
+        self.assertEqual(
+            sum(t.symbol is None for t in automaton.transitions),
+            1,
+        )
+        self.assertEqual(stats.lines, self.description.count("\n") + 1)
+        self.assertGreater(stats.characters, 0)
+        self.assertGreaterEqual(stats.lines_per_second, 0)
+
+    def test_load_large(self) -> None:
+        """Test that loading is not quadratic in the number of states."""
+        n_states = 20000
+        lines = ["Automaton:", "Symbols: a", ""]
+        lines += [f"q{i}" for i in range(n_states)]
+        lines += ["", "--> q0"]
+        lines += [f"q{i} -a-> q{i + 1}" for i in range(n_states - 1)]
+
+        start = time.perf_counter()
+        automaton = AutomataFormat.load(io.StringIO("\n".join(lines)))
+        self.assertLess(time.perf_counter() - start, 5)
+
+        self.assertEqual(len(automaton.states), n_states)
+        self.assertEqual(len(automaton.transitions), n_states - 1)
+
+    def test_invalid_lines(self) -> None:
+        """Test that invalid lines are rejected."""
+        for description in (
+            "q0\nAutomaton:\n",
+            "Automaton:\nSymbols: a\nq0\n--> q0\nAutomaton:\n",
+            "Automaton:\nSymbols: a\nq0 -a- q0\n",
+            "Automaton:\nq0\n--> q0\n",
+        ):
+            with self.subTest(description=description):
+                with self.assertRaises(FormatParseError):
+                    AutomataFormat.read(description)
+
+    def test_dump_dot(self) -> None:
+        """Test that the dot output is streamed."""
+        output = io.StringIO()
+        dump_dot(self.automaton, output)
+        self.assertEqual(output.getvalue(), write_dot(self.automaton))
+        self.assertTrue(output.getvalue().startswith("digraph {\n"))
+
+
+if __name__ == '__main__':
+    unittest.main()
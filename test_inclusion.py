@@ -0,0 +1,71 @@
+"""Test language inclusion of automata."""
+import unittest
+from typing import Optional
+
+from automata.automaton import FiniteAutomaton
+from automata.inclusion import inclusion_counterexample, is_included
+from automata.lazy_dfa import LazyDFA
+from automata.re_parser import REParser
+
+
+def _accepts(automaton: FiniteAutomaton, string: str) -> bool:
+    """Check acceptance, rejecting symbols outside the alphabet."""
+    dfa = LazyDFA(automaton)
+    return dfa.is_final(dfa.step_string(dfa.initial, string))
+
+
+class TestInclusion(unittest.TestCase):
+    """Tests for the inclusion check."""
+
+    def _check(
+        self,
+        regex1: str,
+        regex2: str,
+        included: bool,
+    ) -> None:
+        with self.subTest(regex1=regex1, regex2=regex2):
+            automaton1 = REParser().create_automaton(regex1)
+            automaton2 = REParser().create_automaton(regex2)
+            counterexample: Optional[str] = inclusion_counterexample(
+                automaton1,
+                automaton2,
+            )
+
+            self.assertEqual(is_included(automaton1, automaton2), included)
+            self.assertEqual(counterexample is None, included)
+            if counterexample is not None:
+                self.assertTrue(_accepts(automaton1, counterexample))
+                self.assertFalse(_accepts(automaton2, counterexample))
+
+    def test_included(self) -> None:
+        """Test included languages."""
+        self._check("a.b", "(a+b)*", True)
+        self._check("(a.b)*", "(a+b)*", True)
+        self._check("a*", "λ+a.a*", True)
+        self._check("a.a*", "a*", True)
+
+    def test_not_included(self) -> None:
+        """Test languages that are not included."""
+        self._check("(a+b)*", "(a.b)*", False)
+        self._check("a*", "a.a*", False)
+        self._check("a*.b", "a*", False)
+
+    def test_exponential(self) -> None:
+        """Test an automaton with an exponential determinization."""
+        n = 8
+        any_symbol = "(a+b)"
+        suffix = ".".join([any_symbol] * n)
+        self._check(
+            f"{any_symbol}*.a.{suffix}",
+            f"{any_symbol}*.a.{suffix}+{any_symbol}*.b.{suffix}",
+            True,
+        )
+        self._check(
+            f"{any_symbol}*.a.{suffix}",
+            f"{any_symbol}*.a.{suffix}.{any_symbol}",
+            False,
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+"""Test incremental minimization."""
+import time
+import unittest
+from typing import Dict, Tuple
+
+from automata.automaton import FiniteAutomaton, State, Transition
+from automata.incremental import AutomatonDelta, update_minimized
+from automata.re_parser import REParser
+from automata.utils import deterministic_automata_isomorphism
+
+
+def _apply(
+    automaton: FiniteAutomaton,
+    delta: AutomatonDelta,
+) -> FiniteAutomaton:
+    """Apply a delta without minimizing."""
+    flips = set(delta.final_flips)
+    states = {
+        s.name: State(s.name, is_final=s.is_final != (s.name in flips))
+        for s in list(automaton.states) + list(delta.states)
+    }
+    transitions: Dict[Tuple[str, str], str] = {
+        (t.initial_state.name, t.symbol): t.final_state.name  # type: ignore[misc]
+        for t in automaton.transitions
+    }
+    for source, symbol, target in delta.transitions:
+        transitions[source, symbol] = target
+
+    return FiniteAutomaton(
+        initial_state=states[automaton.initial_state.name],
+        states=states.values(),
+        symbols=automaton.symbols,
+        transitions=[
+            Transition(states[source], symbol, states[target])
+            for (source, symbol), target in transitions.items()
+        ],
+    )
+
+
+class TestIncremental(unittest.TestCase):
+    """Tests for incremental minimization."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        self.minimized = REParser().create_automaton(
+            "(a.b.c+b.b.a+c.c.c)*.a.a",
+        ).to_deterministic().to_minimized()
+        self.names = sorted(s.name for s in self.minimized.states)
+
+    def _check(self, delta: AutomatonDelta) -> None:
+        expected = _apply(self.minimized, delta).to_minimized()
+        for ratio in (0, 0.25, 1):
+            with self.subTest(ratio=ratio):
+                updated = update_minimized(
+                    self.minimized,
+                    delta,
+                    max_affected_ratio=ratio,
+                )
+                self.assertIsNotNone(deterministic_automata_isomorphism(
+                    updated,
+                    expected,
+                ))
+
+    def test_transitions(self) -> None:
+        """Test changing every transition to every state."""
+        for t in self.minimized.transitions:
+            for target in self.names:
+                self._check(AutomatonDelta(transitions=[
+                    (t.initial_state.name, t.symbol, target),  # type: ignore[list-item]
+                ]))
+
+    def test_final_flips(self) -> None:
+        """Test flipping the finality of each state."""
+        for name in self.names:
+            self._check(AutomatonDelta(final_flips=[name]))
+
+    def test_new_state(self) -> None:
+        """Test adding a state equivalent to an existing one."""
+        redirected = self.minimized.transitions[0]
+        copy_transitions = [
+            ("copy", t.symbol, t.final_state.name)
+            for t in self.minimized.transitions
+            if t.initial_state == redirected.final_state
+        ]
+        delta = AutomatonDelta(
+            states=[State("copy", is_final=redirected.final_state.is_final)],
+            transitions=copy_transitions + [(
+                redirected.initial_state.name,
+                redirected.symbol,
+                "copy",
+            )],
+        )
+        self._check(delta)
+
+        updated = update_minimized(self.minimized, delta, max_affected_ratio=1)
+        self.assertEqual(len(updated.states), len(self.minimized.states))
+
+    def test_large(self) -> None:
+        """Test that a small change in a large automaton is cheap."""
+        states = [State(f"q{i}") for i in range(20000)]
+        states[-2].is_final = True
+        automaton = FiniteAutomaton(
+            initial_state=states[0],
+            states=set(states),
+            symbols="a",
+            transitions=[
+                Transition(source, "a", target)
+                for source, target in zip(states, states[1:] + states[-1:])
+            ],
+        )
+
+        start = time.perf_counter()
+        updated = update_minimized(
+            automaton,
+            AutomatonDelta(final_flips=["q1"]),
+        )
+        self.assertLess(time.perf_counter() - start, 5)
+
+        self.assertEqual(len(updated.states), len(states))
+        self.assertEqual(
+            {s.name for s in updated.states if s.is_final},
+            {"q1", states[-2].name},
+        )
+
+    def test_incomplete(self) -> None:
+        """Test that new states must have all their transitions."""
+        with self.assertRaises(ValueError):
+            update_minimized(
+                self.minimized,
+                AutomatonDelta(states=[State("new")]),
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+"""Test the incremental evaluation of edited texts."""
+import random
+import unittest
+
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.incremental_evaluator import IncrementalEvaluator
+from automata.re_parser import REParser
+
+
+class TestIncrementalEvaluator(unittest.TestCase):
+    """Tests for IncrementalEvaluator."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        self.random = random.Random(0)
+
+    def _random_string(self, length: int) -> str:
+        return "".join(self.random.choice("abc") for _ in range(length))
+
+    def test_random_edits(self) -> None:
+        """Test against evaluating the whole text after each edit."""
+        for regex in ["(a+b+c)*.a.b", "(a.b+c)*", "(a+b)*.c.(a+b)*"]:
+            automaton = REParser().create_automaton(regex)
+            evaluator = FiniteAutomatonEvaluator(automaton)
+            for interval in (1, 4, 16):
+                incremental = IncrementalEvaluator(automaton, interval)
+                incremental.set_text(self._random_string(60))
+                text = incremental.text
+                for _ in range(100):
+                    start = self.random.randint(0, len(text))
+                    end = self.random.randint(start, len(text))
+                    if self.random.random() < 0.3:
+                        end = min(end, start + 2)
+                    replacement = self._random_string(
+                        self.random.randint(0, 3),
+                    )
+                    incremental.edit(start, end, replacement)
+                    text = text[:start] + replacement + text[end:]
+                    with self.subTest(regex=regex, text=text):
+                        self.assertEqual(incremental.text, text)
+                        self.assertEqual(
+                            incremental.is_accepting(),
+                            evaluator.accepts(text),
+                        )
+
+    def test_convergence(self) -> None:
+        """Test that edits stop when the evaluation converges."""
+        automaton = REParser().create_automaton("(a+b+c)*.a.b")
+        incremental = IncrementalEvaluator(automaton, checkpoint_interval=64)
+        incremental.set_text(self._random_string(10000) + "ab")
+
+        self.assertEqual(incremental.last_steps, 10002)
+        self.assertLess(incremental.n_checkpoints, 200)
+
+        incremental.insert(5000, "cc")
+        self.assertLess(incremental.last_steps, 3 * 64)
+        self.assertTrue(incremental.is_accepting())
+
+        incremental.delete(10000, 10004)
+        self.assertFalse(incremental.is_accepting())
+
+    def test_invalid_edits(self) -> None:
+        """Test that invalid symbols and slices are rejected."""
+        incremental = IncrementalEvaluator(
+            REParser().create_automaton("a*"),
+        )
+        incremental.set_text("aaa")
+
+        with self.assertRaises(ValueError):
+            incremental.insert(1, "x")
+        with self.assertRaises(ValueError):
+            incremental.delete(2, 5)
+        self.assertEqual(incremental.text, "aaa")
+        self.assertTrue(incremental.is_accepting())
+
+
+if __name__ == '__main__':
+    unittest.main()
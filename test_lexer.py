@@ -0,0 +1,113 @@
+"""Test the lexer."""
+import io
+import unittest
+from typing import List
+
+from automata.lexer import Lexer, LexerError, Token
+
+DIGIT = "(0+1+2+3+4+5+6+7+8+9)"
+LETTER = "(a+b+c+d+e+f+i+n+x)"
+
+
+class TestLexer(unittest.TestCase):
+    """Tests for Lexer."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        self.lexer = Lexer([
+            ("if", "i.f"),
+            ("id", f"{LETTER}.({LETTER}+{DIGIT})*"),
+            ("number", f"{DIGIT}.{DIGIT}*"),
+            ("op", "=+=.=+<+<.="),
+            ("space", "( +\n).( +\n)*"),
+        ])
+
+    def _kinds(self, text: str) -> list:  # type: ignore[type-arg]
+        return [
+            (token.kind, token.text)
+            for token in self.lexer.tokenize(text)
+            if token.kind != "space"
+        ]
+
+    def test_tokenize(self) -> None:
+        """Test longest match and priorities."""
+        self.assertEqual(
+            self._kinds("if iff x1 <= 42 == f"),
+            [
+                ("if", "if"),
+                ("id", "iff"),
+                ("id", "x1"),
+                ("op", "<="),
+                ("number", "42"),
+                ("op", "=="),
+                ("id", "f"),
+            ],
+        )
+        self.assertEqual(list(self.lexer.tokenize("")), [])
+
+    def test_positions(self) -> None:
+        """Test the positions of the tokens."""
+        tokens = list(self.lexer.tokenize("a =1"))
+
+        self.assertEqual(tokens, [
+            Token("id", "a", 0),
+            Token("space", " ", 1),
+            Token("op", "=", 2),
+            Token("number", "1", 3),
+        ])
+
+    def test_error(self) -> None:
+        """Test that unmatched input raises an error."""
+        with self.assertRaises(LexerError) as context:
+            list(self.lexer.tokenize("a = ?"))
+        self.assertEqual(context.exception.position, 4)
+
+        tokens = self.lexer.tokenize("a ?")
+        self.assertEqual(next(tokens), Token("id", "a", 0))
+
+    def test_tokenize_file(self) -> None:
+        """Test that tokens spanning several chunks are found."""
+        text = "if abc123 = 4567\n" * 50 + "xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"
+        expected = list(self.lexer.tokenize(text))
+
+        for chunk_size in (1, 3, 7, 1000):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(
+                    list(self.lexer.tokenize_file(
+                        io.StringIO(text),
+                        chunk_size=chunk_size,
+                    )),
+                    expected,
+                )
+
+        self.assertEqual(expected[-1], Token("id", "x" * 32, 17 * 50))
+
+    def test_linear(self) -> None:
+        """Test that token attempts do not read the same text again."""
+        lexer = Lexer([("a", "a"), ("ab", "a.a*.b")])
+        steps = 0
+
+        class Row(List[int]):
+            def __getitem__(self, symbol_id):  # type: ignore[no-untyped-def]
+                nonlocal steps
+                steps += 1
+                return super().__getitem__(symbol_id)
+
+        lexer.dfa.table = [Row(row) for row in lexer.dfa.table]
+        text = "a" * 5000
+        for chunk_size in (len(text), 64):
+            steps = 0
+            with self.subTest(chunk_size=chunk_size):
+                tokens = list(lexer.tokenize_file(
+                    io.StringIO(text),
+                    chunk_size=chunk_size,
+                ))
+                self.assertEqual(
+                    tokens,
+                    [Token("a", "a", i) for i in range(len(text))],
+                )
+                self.assertLessEqual(steps, 3 * len(text))
+
+
+if __name__ == '__main__':
+    unittest.main()
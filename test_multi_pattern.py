@@ -0,0 +1,73 @@
+"""Test matching several patterns at once."""
+import itertools
+import random
+import time
+import unittest
+
+from automata.lazy_dfa import LazyDFA
+from automata.multi_pattern import MultiPatternMatcher
+from automata.re_parser import REParser
+
+
+class TestMultiPattern(unittest.TestCase):
+    """Tests for MultiPatternMatcher."""
+
+    def test_match(self) -> None:
+        """Test against evaluating each pattern separately."""
+        regexes = ["a.b", "(a+b)*.b", "a*", "c.c*", "a.b", "λ", "b+c"]
+        matcher = MultiPatternMatcher(regexes)
+        dfas = [LazyDFA(REParser().create_automaton(r)) for r in regexes]
+
+        for n in range(6):
+            for symbols in itertools.product("abc", repeat=n):
+                string = "".join(symbols)
+                with self.subTest(string=string):
+                    expected = {
+                        i for i, dfa in enumerate(dfas)
+                        if dfa.is_final(dfa.step_string(dfa.initial, string))
+                    }
+                    self.assertEqual(matcher.match(string), expected)
+
+    def test_tags_not_merged(self) -> None:
+        """Test that states accepting different patterns are not merged."""
+        matcher = MultiPatternMatcher(["a", "b"])
+
+        self.assertEqual(matcher.match("a"), {0})
+        self.assertEqual(matcher.match("b"), {1})
+        # Initial, after "a", after "b" and the dead state
+        self.assertEqual(matcher.dfa.n_states, 4)
+        self.assertEqual(MultiPatternMatcher(["a", "a+b"]).dfa.n_states, 4)
+        self.assertEqual(MultiPatternMatcher(["a+b", "a+b"]).dfa.n_states, 3)
+
+    def test_invalid_symbol(self) -> None:
+        """Test that symbols outside all the patterns are rejected."""
+        matcher = MultiPatternMatcher(["a.b", "c"])
+
+        self.assertEqual(matcher.match("bb"), frozenset())
+        with self.assertRaises(ValueError):
+            matcher.match("bbx")
+
+    def test_many_patterns(self) -> None:
+        """Test that the alphabet and the cost do not grow with patterns."""
+        rng = random.Random(0)
+        words = [
+            "".join(rng.choice("abcdefghij") for _ in range(rng.randint(4, 8)))
+            for _ in range(800)
+        ]
+
+        start = time.perf_counter()
+        matcher = MultiPatternMatcher([".".join(word) for word in words])
+        self.assertLess(time.perf_counter() - start, 5)
+
+        self.assertEqual(len(matcher.dfa.symbols), 10)
+        for word in words[:100]:
+            with self.subTest(word=word):
+                self.assertEqual(
+                    matcher.match(word),
+                    {i for i, other in enumerate(words) if other == word},
+                )
+        self.assertEqual(matcher.match("abc"), frozenset())
+
+
+if __name__ == '__main__':
+    unittest.main()
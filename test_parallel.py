@@ -0,0 +1,133 @@
+"""Test the parallel evaluation of long strings."""
+import random
+import unittest
+from concurrent.futures import Future
+from typing import Any, Callable
+from unittest import mock
+
+import automata.parallel
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.parallel import (
+    ParallelEvaluator,
+    compose,
+    transition_function,
+)
+from automata.re_parser import REParser
+
+
+class _SerialExecutor():
+    """Executor running tasks on submission, counting pending results."""
+
+    pending = 0
+    max_pending = 0
+
+    def __init__(
+        self,
+        max_workers: int,
+        initializer: Callable[..., None],
+        initargs: Any,
+    ) -> None:
+        initializer(*initargs)
+
+    def __enter__(self) -> "_SerialExecutor":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        executor = type(self)
+        executor.pending += 1
+        executor.max_pending = max(executor.max_pending, executor.pending)
+
+        future: Future = Future()
+        future.set_result(fn(*args))
+        result = future.result
+
+        def counted_result(timeout: Any = None) -> Any:
+            executor.pending -= 1
+            return result(timeout)
+
+        future.result = counted_result  # type: ignore[method-assign]
+        return future
+
+
+class TestParallel(unittest.TestCase):
+    """Tests for ParallelEvaluator."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        self.automaton = REParser().create_automaton(
+            "(a+b)*.a.b.(a+b.b)*",
+        ).to_deterministic()
+        self.evaluator = FiniteAutomatonEvaluator(self.automaton)
+        self.parallel = ParallelEvaluator(
+            self.automaton,
+            processes=2,
+            chunk_size=50,
+        )
+        self.random = random.Random(0)
+
+    def test_transition_function(self) -> None:
+        """Test the transition functions and their composition."""
+        dfa = self.parallel.dfa
+        columns = self.parallel.columns
+        for length in (0, 1, 5, 300, 1000):
+            string = "".join(self.random.choice("ab") for _ in range(length))
+            function = transition_function(columns, dfa.n_states, string)
+            for state in range(dfa.n_states):
+                expected = state
+                for symbol in string:
+                    expected = dfa.table[expected][dfa.symbol_id(symbol)]
+                self.assertEqual(function[state], expected)
+
+            self.assertEqual(
+                compose(
+                    transition_function(columns, dfa.n_states, string[:7]),
+                    transition_function(columns, dfa.n_states, string[7:]),
+                ),
+                function,
+            )
+
+    def test_accepts(self) -> None:
+        """Test against the sequential evaluator."""
+        for length in (0, 3, 99, 100, 101, 1234):
+            for _ in range(3):
+                string = "".join(
+                    self.random.choice("ab") for _ in range(length)
+                )
+                with self.subTest(string=string):
+                    self.assertEqual(
+                        self.parallel.accepts(string),
+                        self.evaluator.accepts(string),
+                    )
+
+    def test_bounded_submission(self) -> None:
+        """Test that only a few chunks are in flight at a time."""
+        string = "".join(self.random.choice("ab") for _ in range(5000))
+        with mock.patch.object(
+            automata.parallel,
+            "ProcessPoolExecutor",
+            _SerialExecutor,
+        ):
+            self.assertEqual(
+                self.parallel.accepts(string),
+                self.evaluator.accepts(string),
+            )
+
+        self.assertEqual(_SerialExecutor.pending, 0)
+        self.assertEqual(_SerialExecutor.max_pending, 4)
+
+    def test_invalid_symbol(self) -> None:
+        """Test that invalid symbols are rejected in the workers."""
+        with self.assertRaises(ValueError):
+            self.parallel.accepts("ab" * 100 + "c" + "ab" * 100)
+
+    def test_nondeterministic(self) -> None:
+        """Test that nondeterministic automata are rejected."""
+        with self.assertRaises(ValueError):
+            ParallelEvaluator(REParser().create_automaton("a*"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+"""Test the literal prefilters."""
+import unittest
+
+from automata.prefilter import Prefilter
+from automata.re_parser import REParser
+
+
+class TestPrefilter(unittest.TestCase):
+    """Tests for Prefilter."""
+
+    def _check(self, regex: str, prefix: str, factor: str) -> None:
+        with self.subTest(regex=regex):
+            prefilter = Prefilter.from_regex(regex)
+            self.assertEqual(prefilter.prefix, prefix)
+            self.assertEqual(prefilter.factor, factor)
+
+    def test_literals(self) -> None:
+        """Test the required literals."""
+        self._check("a.b.c.(d+e)*", "abc", "abc")
+        self._check("a.b+a.c", "a", "a")
+        self._check("(a+b)*.x.y.z.(a+b)*", "", "xyz")
+        self._check("(a+b).c.d", "", "cd")
+        self._check("λ+a.b", "", "")
+        self._check("a*", "", "")
+
+    def test_empty_language(self) -> None:
+        """Test that nothing matches the empty language."""
+        prefilter = Prefilter.from_regex("")
+
+        self.assertFalse(prefilter.may_match("abc"))
+        self.assertEqual(list(prefilter.candidates("abc")), [])
+
+    def test_candidates(self) -> None:
+        """Test the candidate positions."""
+        text = "zzabcxyzabd"
+
+        self.assertEqual(
+            list(Prefilter.from_regex("a.b.(c+d)").candidates(text)),
+            [2, 8],
+        )
+        self.assertEqual(
+            list(Prefilter.from_regex("(x+z).y").candidates(text)),
+            [0, 1, 5, 7],
+        )
+        self.assertEqual(
+            list(Prefilter.from_regex("(x+z).y").candidates(text, 2)),
+            [5, 7],
+        )
+        self.assertEqual(
+            list(Prefilter.from_regex("(a+b).q").candidates(text)),
+            [],
+        )
+        self.assertEqual(
+            list(Prefilter.from_regex("(a+b+c+d+e).b").candidates("abc")),
+            [0, 1, 2],
+        )
+
+    def test_max_states(self) -> None:
+        """Test that the analysis is abandoned for big automata."""
+        automaton = REParser().create_automaton("(a+b)*.c.(a+b).(a+b).d")
+
+        self.assertEqual(Prefilter(automaton).factor, "c")
+        prefilter = Prefilter(automaton, max_states=4)
+        self.assertEqual(prefilter.prefix, "")
+        self.assertEqual(prefilter.factor, "")
+        self.assertEqual(prefilter.first_symbols, {"a", "b", "c"})
+        self.assertTrue(prefilter.may_match("xyz"))
+
+
+if __name__ == '__main__':
+    unittest.main()
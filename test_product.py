@@ -0,0 +1,130 @@
+"""Test product constructions."""
+import itertools
+import time
+import unittest
+
+from automata.automaton import FiniteAutomaton, State, Transition
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.product import (
+    ProductEvaluator,
+    complement,
+    difference,
+    intersection,
+    symmetric_difference,
+)
+from automata.re_parser import REParser
+from automata.utils import is_deterministic
+
+
+def _cycle(length: int) -> FiniteAutomaton:
+    """Automaton accepting the strings of a's of a multiple of length."""
+    states = [State(f"q{i}", is_final=i == 0) for i in range(length)]
+    return FiniteAutomaton(
+        initial_state=states[0],
+        states=set(states),
+        symbols="a",
+        transitions=[
+            Transition(source, "a", target)
+            for source, target in zip(states, states[1:] + states[:1])
+        ],
+    )
+
+
+class TestProduct(unittest.TestCase):
+    """Tests for product constructions."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        self.automaton1 = REParser().create_automaton("(a+b)*.a.b")
+        self.automaton2 = REParser().create_automaton("a*.(b.b)*")
+        self.strings = [
+            "".join(s)
+            for n in range(7)
+            for s in itertools.product("ab", repeat=n)
+        ]
+
+    def _check(self, operation: str, function, expected) -> None:  # type: ignore[no-untyped-def]
+        evaluator1 = FiniteAutomatonEvaluator(self.automaton1)
+        evaluator2 = FiniteAutomatonEvaluator(self.automaton2)
+        automaton = function(self.automaton1, self.automaton2)
+        self.assertTrue(is_deterministic(automaton))
+        evaluator = FiniteAutomatonEvaluator(automaton)
+        lockstep = ProductEvaluator(
+            self.automaton1,
+            self.automaton2,
+            operation,
+        )
+
+        for string in self.strings:
+            with self.subTest(operation=operation, string=string):
+                result = expected(
+                    evaluator1.accepts(string),
+                    evaluator2.accepts(string),
+                )
+                self.assertEqual(evaluator.accepts(string), result)
+                self.assertEqual(lockstep.accepts(string), result)
+
+    def test_intersection(self) -> None:
+        """Test the intersection."""
+        self._check("intersection", intersection, lambda x, y: x and y)
+
+    def test_difference(self) -> None:
+        """Test the difference."""
+        self._check("difference", difference, lambda x, y: x and not y)
+
+    def test_symmetric_difference(self) -> None:
+        """Test the symmetric difference."""
+        self._check(
+            "symmetric_difference",
+            symmetric_difference,
+            lambda x, y: x != y,
+        )
+
+    def test_intersection_dead_pairs(self) -> None:
+        """Test that pairs with a dead side are merged in one state."""
+        automaton = intersection(
+            REParser().create_automaton("a.a*"),
+            REParser().create_automaton("b.b*"),
+        )
+
+        self.assertEqual(len(automaton.states), 2)
+        self.assertFalse(any(s.is_final for s in automaton.states))
+
+    def test_large_product(self) -> None:
+        """Test that building many pairs is not quadratic."""
+        start = time.perf_counter()
+        automaton = intersection(_cycle(97), _cycle(101))
+        self.assertLess(time.perf_counter() - start, 5)
+
+        self.assertEqual(len(automaton.states), 97 * 101)
+        self.assertEqual(sum(s.is_final for s in automaton.states), 1)
+
+    def test_lockstep_invalid_symbol(self) -> None:
+        """Test that symbols are checked after the product is dead."""
+        evaluator = ProductEvaluator(self.automaton1, self.automaton2)
+
+        self.assertFalse(evaluator.accepts("baa"))
+        with self.assertRaises(ValueError):
+            evaluator.accepts("bac")
+
+    def test_complement(self) -> None:
+        """Test the complement."""
+        evaluator1 = FiniteAutomatonEvaluator(self.automaton1)
+        automaton = complement(self.automaton1)
+        evaluator = FiniteAutomatonEvaluator(automaton)
+
+        for string in self.strings:
+            with self.subTest(string=string):
+                self.assertNotEqual(
+                    evaluator.accepts(string),
+                    evaluator1.accepts(string),
+                )
+
+        self.assertNotIn("empty", {s.name for s in automaton.states})
+        self.assertIn("empty", {
+            s.name for s in complement(self.automaton2).states
+        })
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+"""Test simulation-based reduction of automata."""
+import unittest
+
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.equivalence import equivalent
+from automata.re_parser import REParser
+from automata.utils import AutomataFormat
+
+from test_re_parser import TestREParser
+
+
+class ReTest(TestREParser):
+    """Test that reduced automata accept the same strings."""
+
+    def _create_evaluator(self, regex: str) -> FiniteAutomatonEvaluator:
+        automaton = REParser().create_automaton(regex).reduce()
+        return FiniteAutomatonEvaluator(automaton)
+
+
+class TestReduce(unittest.TestCase):
+    """Tests for the reduction."""
+
+    def test_smaller(self) -> None:
+        """Test that regex automata are reduced."""
+        for regex in ("(a+b)*.a.b", "a.(b+b).a", "(a+a.a)*.(b+λ)"):
+            with self.subTest(regex=regex):
+                automaton = REParser().create_automaton(regex)
+                reduced = automaton.reduce()
+
+                self.assertTrue(equivalent(automaton, reduced))
+                self.assertLess(len(reduced.states), len(automaton.states))
+                self.assertLessEqual(
+                    len(reduced.to_deterministic().states),
+                    len(automaton.to_deterministic().states),
+                )
+
+    def test_simulation(self) -> None:
+        """Test the simulation preorder and the pruned transitions."""
+        automaton = AutomataFormat.read("""
+        Automaton:
+            Symbols: ab
+
+            q0
+            q1
+            q2
+            q3 final
+
+            --> q0
+            q0 -a-> q1
+            q0 -a-> q2
+            q1 -a-> q3
+            q2 -a-> q3
+            q2 -b-> q3
+        """)
+        simulated_by = automaton.simulation_preorder()
+        states = {s.name: s for s in automaton.states}
+
+        self.assertIn(states["q2"], simulated_by[states["q1"]])
+        self.assertNotIn(states["q1"], simulated_by[states["q2"]])
+
+        reduced = automaton.reduce()
+        self.assertEqual(
+            {s.name for s in reduced.states},
+            {"q0", "q2", "q3"},
+        )
+        self.assertTrue(equivalent(automaton, reduced))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+"""Test the rendering of automata images."""
+import json
+import os
+import stat
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from automata.re_parser import REParser
+from automata.render import render_automata
+
+# Layout program used instead of Graphviz: it copies the dot description
+# to the output and logs each call.
+FAKE_PROG = """\
+#!{python}
+import sys
+with open({log!r}, "a") as log:
+    log.write("call\\n")
+with open(sys.argv[sys.argv.index("-o") + 1], "w") as out:
+    out.write(sys.stdin.read())
+"""
+
+# Renders an automaton in another process.
+RENDER_SCRIPT = """\
+import sys
+from automata.re_parser import REParser
+from automata.render import render_automata
+automaton = REParser().create_automaton(sys.argv[1]).to_deterministic()
+render_automata({"a": automaton}, sys.argv[2], prog=sys.argv[3])
+"""
+
+
+class TestRender(unittest.TestCase):
+    """Tests for render_automata."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.log = os.path.join(self.tmp.name, "calls.log")
+        self.prog = os.path.join(self.tmp.name, "fake_dot")
+        with open(self.prog, "w") as f:
+            f.write(FAKE_PROG.format(python=sys.executable, log=self.log))
+        os.chmod(self.prog, os.stat(self.prog).st_mode | stat.S_IEXEC)
+
+        self.output_dir = os.path.join(self.tmp.name, "imgs")
+        self.automata = {
+            "a": REParser().create_automaton("a.b*"),
+            "b": REParser().create_automaton("(a+b)*"),
+            "a_again": REParser().create_automaton("a.b*"),
+        }
+
+    def _calls(self) -> int:
+        if not os.path.exists(self.log):
+            return 0
+        with open(self.log) as f:
+            return len(f.readlines())
+
+    def test_render(self) -> None:
+        """Test that equal automata are rendered once and indexed."""
+        files = render_automata(
+            self.automata,
+            self.output_dir,
+            processes=2,
+            prog=self.prog,
+        )
+
+        self.assertEqual(self._calls(), 2)
+        self.assertEqual(files["a"], files["a_again"])
+        self.assertNotEqual(files["a"], files["b"])
+        for name in files.values():
+            with open(os.path.join(self.output_dir, name)) as f:
+                self.assertTrue(f.read().startswith("digraph {"))
+
+        with open(os.path.join(self.output_dir, "index.json")) as f:
+            self.assertEqual(json.load(f), files)
+
+    def test_cached(self) -> None:
+        """Test that existing images are not rendered again."""
+        render_automata(self.automata, self.output_dir, prog=self.prog)
+        calls = self._calls()
+
+        render_automata(self.automata, self.output_dir, prog=self.prog)
+        self.assertEqual(self._calls(), calls)
+
+        files = render_automata(
+            {"c": REParser().create_automaton("c")},
+            self.output_dir,
+            prog=self.prog,
+            merge_edges=True,
+        )
+        self.assertEqual(self._calls(), calls + 1)
+
+        with open(os.path.join(self.output_dir, "index.json")) as f:
+            self.assertEqual(set(json.load(f)), {"a", "b", "a_again", "c"})
+        self.assertEqual(set(files), {"c"})
+
+    def test_cached_across_processes(self) -> None:
+        """Test that the cache does not depend on the hash seed."""
+        for seed in ("1", "2", "3"):
+            subprocess.run(
+                [
+                    sys.executable,
+                    "-c",
+                    RENDER_SCRIPT,
+                    "(a.b+b.a.c)*.(c+λ)",
+                    self.output_dir,
+                    self.prog,
+                ],
+                check=True,
+                cwd=os.path.dirname(os.path.abspath(__file__)),
+                env=dict(os.environ, PYTHONHASHSEED=seed),
+            )
+            self.assertEqual(self._calls(), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+"""Test the evaluation of repeated blocks."""
+import itertools
+import unittest
+
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.re_parser import REParser
+from automata.repetition import RepetitionEvaluator, power
+
+
+class TestRepetition(unittest.TestCase):
+    """Tests for RepetitionEvaluator."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        automaton = REParser().create_automaton(
+            "a.(b.b.b)*.(a.a+c)*",
+        ).to_deterministic()
+        self.evaluator = FiniteAutomatonEvaluator(automaton)
+        self.repetition = RepetitionEvaluator(automaton)
+
+    def test_expanded(self) -> None:
+        """Test against evaluating the expanded strings."""
+        for count1, count2 in itertools.product(range(8), repeat=2):
+            parts = ["a", ("b", count1), (["c", ("a", 2)], count2), "c"]
+            string = "a" + "b" * count1 + "caa" * count2 + "c"
+            with self.subTest(parts=parts):
+                self.assertEqual(
+                    self.repetition.accepts(parts),
+                    self.evaluator.accepts(string),
+                )
+
+    def test_huge_counts(self) -> None:
+        """Test descriptions of very long strings."""
+        self.assertTrue(self.repetition.accepts(["a", ("bbb", 10 ** 18)]))
+        self.assertTrue(self.repetition.accepts(["a", ("b", 3 * 10 ** 18)]))
+        self.assertFalse(
+            self.repetition.accepts(["a", ("b", 3 * 10 ** 18 + 1)]),
+        )
+        self.assertTrue(self.repetition.accepts([
+            "a",
+            ([("c", 10 ** 9), ("a", 2)], 10 ** 12),
+        ]))
+
+    def test_power(self) -> None:
+        """Test the powers of a transition function."""
+        function = (1, 2, 0, 3)
+
+        self.assertEqual(power(function, 0), (0, 1, 2, 3))
+        self.assertEqual(power(function, 2), (2, 0, 1, 3))
+        self.assertEqual(power(function, 3 * 10 ** 9 + 1), function)
+        with self.assertRaises(ValueError):
+            power(function, -1)
+
+    def test_invalid_symbol(self) -> None:
+        """Test that invalid symbols are rejected."""
+        with self.assertRaises(ValueError):
+            self.repetition.accepts(["a", ("x", 2)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+"""Test the search of matches inside a text."""
+import itertools
+import re
+import time
+import unittest
+from typing import List, Tuple
+
+from automata.automaton import FiniteAutomaton, State, Transition
+from automata.lazy_dfa import LazyDFA
+from automata.re_parser import REParser
+from automata.search import Searcher
+
+
+def _reference(automaton: FiniteAutomaton, text: str) -> List[Tuple[int, int]]:
+    """Leftmost-longest matches, checking every substring."""
+    dfa = LazyDFA(automaton)
+    matches = []
+    position = 0
+    while position < len(text):
+        for start in range(position, len(text)):
+            ends = [
+                end for end in range(start + 1, len(text) + 1)
+                if dfa.is_final(dfa.step_string(dfa.initial, text[start:end]))
+            ]
+            if ends:
+                matches.append((start, max(ends)))
+                position = max(ends)
+                break
+        else:
+            break
+
+    return matches
+
+
+class TestSearch(unittest.TestCase):
+    """Tests for Searcher."""
+
+    regexes = [
+        "a.b",
+        "a.b*",
+        "(a+b)*.a.b",
+        "b.b*.a",
+        "a+b.a.a",
+        "λ+a",
+        "a.b.(a+c)*",
+        "(a+b).c.c",
+        "a+a.a*.b",
+    ]
+
+    def test_reference(self) -> None:
+        """Test against checking every substring."""
+        texts = [
+            "".join(s)
+            for n in range(7)
+            for s in itertools.product("abc", repeat=n)
+        ]
+        for regex in self.regexes:
+            automaton = REParser().create_automaton(regex)
+            searcher = Searcher(automaton)
+            unfiltered = Searcher(automaton, use_prefilter=False)
+            for text in texts:
+                with self.subTest(regex=regex, text=text):
+                    expected = _reference(automaton, text)
+                    self.assertEqual(list(searcher.finditer(text)), expected)
+                    self.assertEqual(
+                        list(unfiltered.finditer(text)),
+                        expected,
+                    )
+
+    def test_match_ends(self) -> None:
+        """Test the end and start positions of the matches."""
+        searcher = Searcher(REParser().create_automaton("a.b*"))
+        text = "xabbxaab"
+
+        self.assertEqual(list(searcher.match_ends(text)), [2, 3, 4, 6, 7, 8])
+        self.assertEqual(
+            [i for i, start in enumerate(searcher.match_starts(text)) if start],
+            [1, 5, 6],
+        )
+        self.assertIsInstance(searcher.match_starts(text), bytearray)
+
+    def test_large_automaton(self) -> None:
+        """Test that building a searcher is not quadratic."""
+        states = [State(f"q{i}") for i in range(20000)]
+        states[4].is_final = True
+        automaton = FiniteAutomaton(
+            initial_state=states[0],
+            states=set(states),
+            symbols="ab",
+            transitions=[
+                Transition(source, "ab"[i % 2], target)
+                for i, (source, target) in enumerate(zip(states, states[1:]))
+            ],
+        )
+
+        start = time.perf_counter()
+        searcher = Searcher(automaton, use_prefilter=False)
+        self.assertLess(time.perf_counter() - start, 5)
+
+        self.assertEqual(searcher.search("bcababab"), (2, 6))
+
+    def test_long_text(self) -> None:
+        """Test against Python regular expressions on a long text."""
+        searcher = Searcher(REParser().create_automaton("a.(b+c)*.a"))
+        text = "xyzacbcaabba_abcx" * 200
+
+        self.assertEqual(
+            searcher.findall(text),
+            re.findall("a[bc]*a", text),
+        )
+        self.assertEqual(searcher.search("xxacca"), (2, 6))
+        self.assertIsNone(searcher.search("xxacc"))
+
+    def test_linear(self) -> None:
+        """Test that runs from successive starts do not rescan the text."""
+        automaton = REParser().create_automaton("a+a.a*.b")
+        text = "a" * 5000
+        for use_prefilter in (True, False):
+            searcher = Searcher(automaton, use_prefilter=use_prefilter)
+            dfa = searcher._anchored
+            steps = 0
+
+            def step(states, symbol, step=dfa.step):
+                nonlocal steps
+                steps += 1
+                return step(states, symbol)
+
+            dfa.step = step  # type: ignore[method-assign]
+            with self.subTest(use_prefilter=use_prefilter):
+                self.assertEqual(
+                    list(searcher.finditer(text)),
+                    [(i, i + 1) for i in range(len(text))],
+                )
+                self.assertLessEqual(steps, 3 * len(text))
+
+    def test_exponential_dfa(self) -> None:
+        """Test that building a searcher does not determinize eagerly."""
+        regex = "(a+b)*.a" + ".(a+b)" * 12
+        automaton = REParser().create_automaton(regex)
+
+        start = time.perf_counter()
+        searcher = Searcher(automaton)
+        self.assertLess(time.perf_counter() - start, 1)
+
+        text = "b" * 20 + "a" + "b" * 12
+        self.assertEqual(searcher.search(text), (0, 33))
+        self.assertIsNone(searcher.search(text[:-1]))
+
+
+if __name__ == '__main__':
+    unittest.main()
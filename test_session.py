@@ -0,0 +1,89 @@
+"""Test evaluation sessions."""
+import itertools
+import unittest
+
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.re_parser import REParser
+from automata.session import SessionEngine
+from automata.utils import AutomataFormat
+from test_re_parser import TestREParser
+
+
+class _SessionAdapter():
+    def __init__(self, engine: SessionEngine) -> None:
+        self.engine = engine
+
+    def accepts(self, string: str) -> bool:
+        return self.engine.start().feed(string).is_accepting()
+
+
+class TestNondeterministicSession(TestREParser):
+    """Test sessions of nondeterministic automata."""
+
+    def _create_evaluator(self, regex: str) -> _SessionAdapter:
+        return _SessionAdapter(SessionEngine(
+            REParser().create_automaton(regex),
+        ))
+
+
+class TestDeterministicSession(TestREParser):
+    """Test sessions of deterministic automata."""
+
+    def _create_evaluator(self, regex: str) -> _SessionAdapter:
+        return _SessionAdapter(SessionEngine(
+            REParser().create_automaton(regex).to_deterministic(),
+        ))
+
+
+class TestSession(unittest.TestCase):
+    """Tests for sessions."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        self.automaton = REParser().create_automaton("(a+b)*.a.b.(a+λ)")
+        self.evaluator = FiniteAutomatonEvaluator(self.automaton)
+
+    def test_fork(self) -> None:
+        """Test that sessions are not modified when fed."""
+        for automaton in (self.automaton, self.automaton.to_deterministic()):
+            engine = SessionEngine(automaton)
+            session = engine.start().feed("ba")
+            for n in range(4):
+                for symbols in itertools.product("ab", repeat=n):
+                    suffix = "".join(symbols)
+                    with self.subTest(suffix=suffix):
+                        branch = session.feed(suffix)
+                        self.assertEqual(branch.position, 2 + n)
+                        self.assertEqual(
+                            branch.is_accepting(),
+                            self.evaluator.accepts("ba" + suffix),
+                        )
+            self.assertEqual(session, engine.start().feed("b").feed("a"))
+
+    def test_serialization(self) -> None:
+        """Test resuming a session with another engine."""
+        for automaton in (self.automaton, self.automaton.to_deterministic()):
+            session = SessionEngine(automaton).start().feed("aaba")
+            data = session.dumps()
+
+            copy = AutomataFormat.read(AutomataFormat.write(automaton))
+            engine = SessionEngine(copy)
+            restored = engine.loads(data)
+            self.assertEqual(restored.state, session.state)
+            self.assertEqual(restored.position, 4)
+            self.assertTrue(restored.feed("b").is_accepting())
+
+            other = SessionEngine(REParser().create_automaton("a"))
+            with self.assertRaises(ValueError):
+                other.loads(data)
+
+    def test_invalid_symbol(self) -> None:
+        """Test that invalid symbols are rejected."""
+        session = SessionEngine(self.automaton).start()
+
+        with self.assertRaises(ValueError):
+            session.feed("abc")
+
+
+if __name__ == '__main__':
+    unittest.main()
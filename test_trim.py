@@ -0,0 +1,108 @@
+"""Test removal of useless states."""
+import time
+import unittest
+
+from automata.automaton import FiniteAutomaton, State, Transition
+from automata.automaton_evaluator import FiniteAutomatonEvaluator
+from automata.utils import AutomataFormat
+
+
+class TestTrim(unittest.TestCase):
+    """Tests for unreachable and dead state removal."""
+
+    description = """
+    Automaton:
+        Symbols: ab
+
+        q0
+        q1
+        q2 final
+        dead
+        unreachable final
+
+        --> q0
+        q0 -a-> q1
+        q0 -b-> dead
+        q1 -b-> q2
+        q1 -a-> dead
+        dead -a-> dead
+        dead -b-> dead
+        unreachable -a-> q2
+    """
+
+    def test_eliminate_unreachable(self) -> None:
+        """Test that only unreachable states are removed."""
+        automaton = AutomataFormat.read(self.description)
+        reachable = automaton.eliminate_unreachable_states()
+
+        self.assertEqual(
+            {s.name for s in reachable.states},
+            {"q0", "q1", "q2", "dead"},
+        )
+        self.assertEqual(len(reachable.transitions), 6)
+
+    def test_trim(self) -> None:
+        """Test that unreachable and dead states are removed."""
+        automaton = AutomataFormat.read(self.description)
+        trimmed = automaton.trim()
+
+        self.assertEqual(
+            {s.name for s in trimmed.states},
+            {"q0", "q1", "q2"},
+        )
+        self.assertEqual(len(trimmed.transitions), 2)
+
+        evaluator = FiniteAutomatonEvaluator(trimmed)
+        self.assertTrue(evaluator.accepts("ab"))
+        self.assertFalse(evaluator.accepts("ba"))
+
+    def test_trim_empty_language(self) -> None:
+        """Test that the initial state is kept for the empty language."""
+        automaton = AutomataFormat.read("""
+        Automaton:
+            Symbols: a
+
+            q0
+            q1
+
+            --> q0
+            q0 -a-> q1
+        """)
+        trimmed = automaton.trim()
+
+        self.assertEqual([s.name for s in trimmed.states], ["q0"])
+        self.assertEqual(trimmed.transitions, ())
+
+    def test_early_exit_checks_symbols(self) -> None:
+        """Test that symbols are validated after a dead prefix."""
+        automaton = AutomataFormat.read(self.description)
+        evaluator = FiniteAutomatonEvaluator(automaton)
+
+        self.assertFalse(evaluator.accepts("b" + "a" * 1000))
+        with self.assertRaises(ValueError):
+            evaluator.accepts("bac")
+
+    def test_trim_large(self) -> None:
+        """Test that trimming is not quadratic in the number of states."""
+        states = [State(f"q{i}") for i in range(20000)]
+        states[-2].is_final = True
+        automaton = FiniteAutomaton(
+            initial_state=states[0],
+            states=set(states),
+            symbols="a",
+            transitions=[
+                Transition(source, "a", target)
+                for source, target in zip(states, states[1:])
+            ],
+        )
+
+        start = time.perf_counter()
+        trimmed = automaton.trim()
+        self.assertLess(time.perf_counter() - start, 5)
+
+        self.assertEqual(len(trimmed.states), len(states) - 1)
+        self.assertEqual(len(trimmed.transitions), len(states) - 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+"""Test the options of the dot writer."""
+import unittest
+
+from automata.re_parser import REParser
+from automata.utils import write_dot
+
+
+class TestWriteDot(unittest.TestCase):
+    """Tests for write_dot."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        self.automaton = REParser().create_automaton(
+            "(a+b+c+d+f).x",
+        ).to_deterministic().to_minimized()
+
+    def _edges(self, dot: str) -> list:  # type: ignore[type-arg]
+        return [
+            line for line in dot.splitlines()
+            if "->" in line and "__start_point__" not in line
+        ]
+
+    def test_default(self) -> None:
+        """Test that there is an edge per transition by default."""
+        self.assertEqual(
+            len(self._edges(write_dot(self.automaton))),
+            len(self.automaton.transitions),
+        )
+
+    def test_merge_edges(self) -> None:
+        """Test that parallel edges are merged with ranges."""
+        dot = write_dot(self.automaton, merge_edges=True)
+        edges = self._edges(dot)
+
+        self.assertLess(len(edges), len(self.automaton.transitions))
+        self.assertEqual(
+            len(edges),
+            len({
+                (t.initial_state, t.final_state)
+                for t in self.automaton.transitions
+            }),
+        )
+        self.assertTrue(any("label=\"a-d,f\"" in edge for edge in edges))
+
+    def test_collapse_sink(self) -> None:
+        """Test that the sink state is omitted."""
+        dot = write_dot(self.automaton, merge_edges=True, collapse_sink=True)
+        n_states = len(self.automaton.states)
+
+        self.assertEqual(dot.count("[shape="), n_states - 1)
+        self.assertEqual(len(self._edges(dot)), 2)
+
+    def test_max_states(self) -> None:
+        """Test that only a neighborhood is drawn for big automata."""
+        automaton = REParser().create_automaton("a.b.c.d.f.x")
+        dot = write_dot(
+            automaton,
+            max_states=3,
+            center=automaton.initial_state.name,
+        )
+
+        self.assertEqual(dot.count("[shape=circle]"), 3)
+        self.assertIn("__truncated__", dot)
+        self.assertIn("__start_point__ ->", dot)
+
+        with self.assertRaises(ValueError):
+            write_dot(automaton, max_states=3, center="missing")
+
+        self.assertNotIn(
+            "__truncated__",
+            write_dot(automaton, max_states=len(automaton.states)),
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()